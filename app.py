@@ -1,5 +1,11 @@
+from __future__ import annotations
+
+import html
+import threading
+
 import streamlit as st
-from src.summarizer import summarize
+from src.preprocess import NLTKDataError, ensure_nltk_data, nltk_settings
+from src.summarizer import PreparedDocument, warmup
 from src.utils import SAMPLE_TEXTS, word_count, char_count
 
 # ── Page config ──────────────────────────────────────────────────────
@@ -9,6 +15,59 @@ st.set_page_config(
     layout="wide",
 )
 
+
+# ── Background warm-up ───────────────────────────────────────────────
+# Importing src.summarizer is cheap; scikit-learn, NLTK and the Punkt model
+# load on first use.  Start that work once per server process while the
+# page renders, so the first click doesn't pay for it.
+@st.cache_resource(show_spinner=False)
+def _start_warmup() -> threading.Thread:
+    thread = threading.Thread(target=warmup, daemon=True)
+    thread.start()
+    return thread
+
+
+# In offline mode the NLTK resources are validated up front, so a missing
+# or incomplete vendored directory is a clear start-up error rather than
+# a failed first request.
+@st.cache_resource(show_spinner=False)
+def _validate_offline_nltk() -> str | None:
+    try:
+        ensure_nltk_data()
+    except NLTKDataError as exc:
+        return str(exc)
+    return None
+
+
+if nltk_settings()[1]:
+    nltk_error = _validate_offline_nltk()
+    if nltk_error:
+        st.error(f"Offline NLTK data check failed: {nltk_error}")
+        st.stop()
+
+_start_warmup()
+
+
+# Segmentation, TF-IDF and scoring depend only on the text, so each
+# document is prepared once and moving the ratio slider only re-clusters.
+# The app stays on K-Means, so summaries match ``summarize()``; each k is
+# fitted once per document.
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _prepare(text: str) -> PreparedDocument:
+    return PreparedDocument(text, engine="kmeans")
+
+
+def _highlight(cleaned: str, spans: list[list[int]]) -> str:
+    """HTML of *cleaned* with the summary sentences at *spans* wrapped in <mark>."""
+    parts, pos = [], 0
+    for start, end in spans:
+        parts.append(html.escape(cleaned[pos:start]))
+        parts.append(f"<mark>{html.escape(cleaned[start:end])}</mark>")
+        pos = end
+    parts.append(html.escape(cleaned[pos:]))
+    return "".join(parts)
+
+
 # ── Theme state ──────────────────────────────────────────────────────
 if "dark_mode" not in st.session_state:
     st.session_state.dark_mode = False
@@ -156,6 +215,19 @@ st.markdown(
         transition: background 0.4s ease, color 0.4s ease;
     }}
 
+    /* ─── Comparison: original with the picked sentences marked ─── */
+    .original-box {{
+        font-size: 0.95rem;
+        line-height: 1.7;
+        color: {text_primary};
+    }}
+    .original-box mark {{
+        background: {summary_bg};
+        border-bottom: 2px solid {summary_border};
+        color: inherit;
+        padding: 0 0.1rem;
+    }}
+
     /* ─── Theme toggle button ─── */
     .theme-toggle {{
         display: flex;
@@ -360,7 +432,7 @@ if run:
         st.warning("Please enter some text to summarize.")
     else:
         with st.spinner("Analyzing and summarizing…"):
-            result = summarize(input_text, ratio=summary_ratio)
+            result = _prepare(input_text).summarize(summary_ratio)
 
         # Metrics row
         st.markdown('<div class="section-title">📊 Statistics</div>', unsafe_allow_html=True)
@@ -405,7 +477,10 @@ if run:
         col_orig, col_summ = st.columns(2)
         with col_orig:
             st.markdown(f"**Original** — {word_count(input_text)} words, {char_count(input_text)} chars")
-            st.info(input_text)
+            st.markdown(
+                f'<div class="original-box">{_highlight(_prepare(input_text).cleaned, result["spans"])}</div>',
+                unsafe_allow_html=True,
+            )
         with col_summ:
             st.markdown(
                 f'**Summary** — {word_count(result["summary"])} words, '
@@ -0,0 +1,19 @@
+"""
+benchmarks - Performance measurements for the summarisation pipeline
+====================================================================
+
+Run from the repository root, e.g. ``python -m benchmarks.bench_segmenters``.
+
+Modules
+-------
+corpus            Reproducible benchmark documents
+bench_segmenters  Sentence segmenter agreement with Punkt and throughput
+bench_import      Cold-start import time and eager heavy imports
+bench_pipeline    Per-stage timings and peak memory on synthetic + sample texts
+bench_reduction   Clustering on SVD / random projections vs full-width TF-IDF
+bench_tokenize    Tokenize-once id arrays vs every consumer tokenizing itself
+bench_streaming   Peak RSS of summarize_file vs in-memory summarize by file size
+bench_execution   Thread caps and concurrent restarts: throughput and determinism
+bench_dedup       Near-duplicate collapsing: clustered rows, time, wasted summary slots
+load_service      Load generator for the local HTTP service
+"""
@@ -0,0 +1,109 @@
+"""
+Near-duplicate collapsing benchmark.
+
+Builds synthetic ``topical`` documents, then repeats a fraction of their
+sentences — half verbatim, half with one word swapped — at random later
+positions, the way boilerplate and restated quotes pile up in scraped
+text.  Each document is summarised with and without
+``dedup_threshold`` and every row reports:
+
+  - seconds (best of ``--repeat``), and the ``dedup`` stage on its own
+  - sentences clustered vs sentences in the document
+  - ``collapsed_sentence_count``
+  - summary sentences that repeat another summary sentence at Jaccard
+    ≥ the threshold — the slots duplicates waste
+
+Usage
+-----
+    python -m benchmarks.bench_dedup
+    python -m benchmarks.bench_dedup --sizes 2000 20000 --duplicate-fractions 0 0.3 0.6
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.corpus import synthetic_document
+from src.dedup import find_near_duplicates
+from src.preprocess import split_sentences, tokenize_sentences
+from src.summarizer import summarize
+
+
+def with_duplicates(sentences: list[str], fraction: float, seed: int) -> list[str]:
+    """*sentences* plus ``fraction · n`` copies / one-word edits of earlier ones."""
+    rng = np.random.default_rng(seed)
+    doc = list(sentences)
+    for _ in range(int(len(sentences) * fraction)):
+        at = int(rng.integers(1, len(doc) + 1))
+        words = doc[int(rng.integers(at))].split()
+        if rng.random() < 0.5:
+            words[int(rng.integers(len(words)))] = "variant"
+        doc.insert(at, " ".join(words))
+    return doc
+
+
+def wasted_slots(summary: str, threshold: float) -> int:
+    """Summary sentences in a near-duplicate group with an earlier one."""
+    sentences = split_sentences(summary, "regex")
+    if not sentences:
+        return 0
+    groups = find_near_duplicates(tokenize_sentences(sentences), threshold)
+    return groups.n_collapsed
+
+
+def run(text: str, args: argparse.Namespace, threshold: float | None) -> dict:
+    best, result = float("inf"), None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        result = summarize(
+            text, args.ratio, engine=args.engine, segmenter="regex",
+            dedup_threshold=threshold, trace=True,
+        )
+        best = min(best, time.perf_counter() - start)
+    n = result["original_sentence_count"]
+    return {
+        "seconds": round(best, 3),
+        "dedup_seconds": round(result["timings"]["stages"].get("dedup", 0.0), 3),
+        "clustered_sentences": n - result["collapsed_sentence_count"],
+        "collapsed_sentence_count": result["collapsed_sentence_count"],
+        "summary_sentence_count": result["summary_sentence_count"],
+        "wasted_slots": wasted_slots(result["summary"], args.threshold),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--duplicate-fractions", type=float, nargs="+", default=[0.0, 0.25, 0.5])
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--ratio", type=float, default=0.1)
+    parser.add_argument("--engine", default="spherical")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs (best kept)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    runs = []
+    for size in args.sizes:
+        text = synthetic_document(size, distribution="topical", seed=args.seed)
+        base = split_sentences(text, "regex")
+        for fraction in args.duplicate_fractions:
+            text = " ".join(with_duplicates(base, fraction, args.seed))
+            runs.append({
+                "n_sentences": size,
+                "duplicate_fraction": fraction,
+                "off": run(text, args, None),
+                "on": run(text, args, args.threshold),
+            })
+            print(f"done: {size} sentences, {fraction:.0%} duplicates", file=sys.stderr)
+
+    print(json.dumps({"config": vars(args), "runs": runs}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+"""
+Execution-policy benchmark.
+
+Two measurements:
+
+  - ``pool``      ``summarize_many`` over ``--workers`` processes, once with
+                  every worker's native pools left at their defaults
+                  (``ExecutionPolicy()``) and once with each worker capped
+                  at its share of the cores (``ExecutionPolicy.for_workers``,
+                  the default).  Reports docs/sec and whether the summaries
+                  match.
+  - ``restarts``  ``fit_clusters(engine="kmeans")`` — ten restarts — on one
+                  synthetic document with ``restart_workers`` of 1, 2, 4 …,
+                  reporting seconds and whether labels and inertia are
+                  identical to the serial run.
+
+Oversubscription only shows on a machine with several cores; on one core
+the numbers measure the policy's overhead.
+
+Usage
+-----
+    python -m benchmarks.bench_execution
+    python -m benchmarks.bench_execution --workers 8 --docs 256 --restart-workers 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.corpus import sample_documents, synthetic_document
+from src.batch import summarize_many
+from src.clustering import fit_clusters
+from src.execution import ExecutionPolicy, use_policy
+from src.feature_extraction import build_tfidf_matrix
+from src.preprocess import split_sentences
+
+
+def bench_pool(args: argparse.Namespace) -> list[dict]:
+    docs = sample_documents(args.docs, seed=args.seed)
+    policies = {
+        "uncapped": ExecutionPolicy(),
+        "shared": ExecutionPolicy.for_workers(args.workers),
+    }
+    rows, reference = [], None
+    for name, policy in policies.items():
+        start = time.perf_counter()
+        results = summarize_many(
+            docs, args.ratio, workers=args.workers, chunksize=4,
+            engine=args.engine, segmenter="regex", policy=policy,
+        )
+        elapsed = time.perf_counter() - start
+        reference = reference or results
+        rows.append({
+            "policy": name,
+            **policy._asdict(),
+            "seconds": round(elapsed, 3),
+            "docs_per_second": round(len(docs) / elapsed, 1),
+            "identical": results == reference,
+        })
+        print(f"done: pool {name}", file=sys.stderr)
+    return rows
+
+
+def bench_restarts(args: argparse.Namespace) -> list[dict]:
+    text = synthetic_document(args.sentences, distribution="topical", seed=args.seed)
+    X, _ = build_tfidf_matrix(split_sentences(text, "regex"))
+    n_clusters = max(2, int(X.shape[0] * args.ratio))
+
+    rows, reference = [], None
+    for workers in args.restart_workers:
+        with use_policy(ExecutionPolicy(restart_workers=workers)):
+            start = time.perf_counter()
+            fit = fit_clusters(X, n_clusters, args.seed, engine="kmeans")
+            elapsed = time.perf_counter() - start
+        reference = reference or fit
+        rows.append({
+            "restart_workers": workers,
+            "n_sentences": X.shape[0],
+            "n_clusters": n_clusters,
+            "seconds": round(elapsed, 3),
+            "identical": bool(
+                np.array_equal(fit.labels, reference.labels) and fit.inertia == reference.inertia
+            ),
+        })
+        print(f"done: restarts x{workers}", file=sys.stderr)
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--docs", type=int, default=64)
+    parser.add_argument("--sentences", type=int, default=2000)
+    parser.add_argument("--restart-workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--ratio", type=float, default=0.1)
+    parser.add_argument("--engine", default="kmeans")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    report = {
+        "config": {**vars(args), "cores": os.cpu_count()},
+        "pool": bench_pool(args),
+        "restarts": bench_restarts(args),
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
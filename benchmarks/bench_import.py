@@ -0,0 +1,97 @@
+"""
+Import-time benchmark.
+
+Cold-start latency matters on autoscaled containers: every new process
+pays for ``import src.summarizer`` before it can serve anything.  This
+script imports each module in a fresh interpreter several times, keeps the
+best wall time, and records which heavy dependencies got pulled in.  It
+also times ``warmup()`` so the deferred cost stays visible.
+
+Exits non-zero when a module exceeds ``--max-ms`` or eagerly imports one
+of the ``--forbid`` packages, so it can gate CI.
+
+Usage
+-----
+    python -m benchmarks.bench_import [--repeat 5] [--max-ms 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+
+MODULES = ("src", "src.summarizer", "src.batch", "src.preprocess", "src.cache", "src.service")
+HEAVY = ("sklearn", "scipy", "nltk")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+print(json.dumps({{"ms": elapsed * 1000, "heavy": heavy}}))
+"""
+
+_WARMUP_PROBE = """
+import json, time
+from src.summarizer import warmup
+start = time.perf_counter()
+warmup(segmenter={segmenter!r})
+print(json.dumps({{"ms": (time.perf_counter() - start) * 1000, "heavy": []}}))
+"""
+
+
+def _run(code: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def measure(code: str, repeat: int) -> dict:
+    runs = [_run(code) for _ in range(repeat)]
+    return {
+        "best_ms": round(min(r["ms"] for r in runs), 1),
+        "median_ms": round(sorted(r["ms"] for r in runs)[len(runs) // 2], 1),
+        "heavy_imports": runs[0]["heavy"],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module")
+    parser.add_argument("--max-ms", type=float, default=500.0, help="fail above this best time")
+    parser.add_argument(
+        "--forbid", nargs="*", default=list(HEAVY),
+        help="packages that must not be imported eagerly",
+    )
+    parser.add_argument(
+        "--warmup-segmenter", default=None,
+        help="also time warmup() with this segmenter (e.g. punkt, regex)",
+    )
+    args = parser.parse_args(argv)
+
+    report: dict = {"python": sys.version.split()[0], "modules": {}, "failures": []}
+    for module in MODULES:
+        result = measure(_PROBE.format(module=module, heavy=HEAVY), args.repeat)
+        report["modules"][module] = result
+        if result["best_ms"] > args.max_ms:
+            report["failures"].append(f"{module}: {result['best_ms']} ms > {args.max_ms} ms")
+        leaked = sorted(set(result["heavy_imports"]) & set(args.forbid))
+        if leaked:
+            report["failures"].append(f"{module}: eagerly imports {', '.join(leaked)}")
+
+    if args.warmup_segmenter:
+        report["warmup"] = measure(
+            _WARMUP_PROBE.format(segmenter=args.warmup_segmenter), max(1, args.repeat // 2)
+        )
+
+    json.dump(report, sys.stdout, indent=2)
+    print()
+    return 1 if report["failures"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,214 @@
+"""
+Per-stage pipeline benchmark.
+
+Times every stage of ``summarize()`` separately on reproducible inputs —
+synthetic documents at several sizes and vocabulary distributions, plus
+the ``SAMPLE_TEXTS`` from ``src.utils`` — and records each stage's peak
+traced memory.  Output is JSON so runs can be diffed across commits.
+
+Stages
+------
+clean      clean_text
+segment    split_sentences
+tfidf      build_tfidf_matrix
+scores     get_sentence_scores
+cluster    cluster_sentences
+select     select_representative_sentences
+
+Timings are the best of ``--repeat`` untraced runs; memory comes from one
+extra run under ``tracemalloc`` (which only sees allocations made through
+Python's allocator, including NumPy/SciPy arrays).
+
+Usage
+-----
+    python -m benchmarks.bench_pipeline --output bench.json
+    python -m benchmarks.bench_pipeline --sizes 10 1000 1000000 --distributions zipf
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from benchmarks.corpus import DISTRIBUTIONS, synthetic_document
+from src.clustering import cluster_sentences, select_representative_sentences
+from src.feature_extraction import build_tfidf_matrix, get_sentence_scores
+from src.preprocess import clean_text, split_sentences
+from src.utils import SAMPLE_TEXTS
+
+STAGES = ("clean", "segment", "tfidf", "scores", "cluster", "select")
+
+
+def run_pipeline(text: str, args: argparse.Namespace, stage_hook) -> dict:
+    """Run every stage once, calling ``stage_hook(name, fn)`` around each."""
+    state: dict = {}
+
+    def clean():
+        state["cleaned"] = clean_text(text)
+
+    def segment():
+        state["sentences"] = split_sentences(state["cleaned"], args.segmenter)
+
+    def tfidf():
+        state["matrix"], _ = build_tfidf_matrix(state["sentences"])
+
+    def scores():
+        state["scores"] = get_sentence_scores(state["matrix"])
+
+    def cluster():
+        n = len(state["sentences"])
+        k = max(1, min(int(n * args.ratio), args.max_clusters, n))
+        state["labels"] = cluster_sentences(
+            state["matrix"], k, random_state=args.seed, engine=args.engine
+        )
+
+    def select():
+        state["summary"] = select_representative_sentences(
+            state["sentences"], state["labels"], state["scores"]
+        )
+
+    for name, fn in zip(STAGES, (clean, segment, tfidf, scores, cluster, select)):
+        stage_hook(name, fn)
+
+    matrix = state["matrix"]
+    return {
+        "n_sentences": len(state["sentences"]),
+        "n_features": int(matrix.shape[1]),
+        "nnz": int(matrix.nnz),
+        "n_clusters": int(state["labels"].max()) + 1,
+        "summary_sentences": len(state["summary"]),
+    }
+
+
+def benchmark(text: str, args: argparse.Namespace) -> dict:
+    seconds = {name: float("inf") for name in STAGES}
+
+    def timed(name, fn):
+        start = time.perf_counter()
+        fn()
+        seconds[name] = min(seconds[name], time.perf_counter() - start)
+
+    for _ in range(args.repeat):
+        shape = run_pipeline(text, args, timed)
+
+    peak_mb: dict[str, float] = {}
+
+    def traced(name, fn):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        fn()
+        peak_mb[name] = (tracemalloc.get_traced_memory()[1] - base) / 2**20
+
+    if not args.no_memory:
+        tracemalloc.start()
+        try:
+            run_pipeline(text, args, traced)
+        finally:
+            tracemalloc.stop()
+
+    stages = {
+        name: {
+            "seconds": round(seconds[name], 6),
+            **({"peak_mb": round(peak_mb[name], 3)} if name in peak_mb else {}),
+        }
+        for name in STAGES
+    }
+    return {
+        **shape,
+        "input_bytes": len(text.encode("utf-8")),
+        "total_seconds": round(sum(seconds.values()), 6),
+        "stages": stages,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def _versions() -> dict:
+    import numpy
+    import scipy
+    import sklearn
+
+    return {
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "scipy": scipy.__version__,
+        "scikit-learn": sklearn.__version__,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000],
+        help="synthetic document sizes in sentences (up to 1000000)",
+    )
+    parser.add_argument(
+        "--distributions", nargs="+", default=list(DISTRIBUTIONS), choices=DISTRIBUTIONS,
+    )
+    parser.add_argument("--vocab-size", type=int, default=5000)
+    parser.add_argument("--no-samples", action="store_true", help="skip SAMPLE_TEXTS")
+    parser.add_argument("--segmenter", default="regex", help="punkt or regex")
+    parser.add_argument("--engine", default="kmeans", help="clustering engine")
+    parser.add_argument("--ratio", type=float, default=0.3)
+    parser.add_argument(
+        "--max-clusters", type=int, default=500,
+        help="cap on k so very large inputs stay tractable",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs (best kept)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    def inputs():
+        # generated lazily — a 1M-sentence document is ~150 MB of text
+        if not args.no_samples:
+            for name, text in SAMPLE_TEXTS.items():
+                yield {"corpus": "sample", "name": name}, text
+        for distribution in args.distributions:
+            for size in args.sizes:
+                text = synthetic_document(
+                    size, vocab_size=args.vocab_size, distribution=distribution, seed=args.seed
+                )
+                yield {"corpus": "synthetic", "distribution": distribution, "size": size}, text
+
+    # one untimed pass so lazy imports and model loading aren't billed to
+    # the first input's stages
+    run_pipeline(next(iter(SAMPLE_TEXTS.values())), args, lambda _name, fn: fn())
+
+    runs = []
+    for meta, text in inputs():
+        runs.append({**meta, **benchmark(text, args)})
+        print(f"done: {meta}", file=sys.stderr)
+
+    report = {
+        "commit": _git_commit(),
+        "versions": _versions(),
+        "config": {k: v for k, v in vars(args).items() if k != "output"},
+        "runs": runs,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+            fh.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,127 @@
+"""
+Dimensionality-reduction benchmark.
+
+Clusters the same TF-IDF matrix at full width and after
+``reduce_dimensions`` (truncated SVD and sparse random projection at
+several target dimensions) and reports, for each variant, the wall time
+of reduce + cluster, its peak traced memory, and how close the
+clustering is to the full-width one:
+
+  - ``ari``          adjusted Rand index against the full-width labels
+  - ``objective``    cosine objective Σ (1 − cos(x, centroid)) of the
+                     labels, evaluated on the *full* TF-IDF rows so all
+                     variants are scored on the same scale
+  - ``objective_vs_full``  that objective relative to full width
+
+Inputs are ``topical`` synthetic documents with a wide vocabulary, the
+case the reduction stage is meant for.
+
+Usage
+-----
+    python -m benchmarks.bench_reduction
+    python -m benchmarks.bench_reduction --sizes 2000 10000 --dims 64 256 --engine spherical
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.corpus import synthetic_document
+from src.clustering import cluster_sentences
+from src.feature_extraction import REDUCTION_METHODS, build_tfidf_matrix, reduce_dimensions
+from src.preprocess import split_sentences
+
+
+def _objective(X, labels: np.ndarray) -> float:
+    """Spherical K-Means objective of *labels* on the full-width rows."""
+    from src.spherical_kmeans import _indicator, _normalize_centroids, _to_dense
+
+    k = int(labels.max()) + 1
+    C = _normalize_centroids(_to_dense(_indicator(labels, k, X.dtype) @ X))
+    cos = np.asarray(X.multiply(C[labels]).sum(axis=1)).ravel()
+    return float(np.sum(1.0 - cos))
+
+
+def _run(X, n_clusters: int, method: str | None, dim: int | None, args) -> tuple:
+    features = X if method is None else reduce_dimensions(
+        X, dim, method=method, random_state=args.seed
+    )
+    labels = cluster_sentences(features, n_clusters, random_state=args.seed, engine=args.engine)
+    return labels, features.shape[1]
+
+
+def benchmark(X, n_clusters: int, method: str | None, dim: int | None, args) -> dict:
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        labels, width = _run(X, n_clusters, method, dim, args)
+        best = min(best, time.perf_counter() - start)
+
+    row = {"method": method or "full", "dimensions": int(width), "seconds": round(best, 4)}
+    if not args.no_memory:
+        tracemalloc.start()
+        try:
+            _run(X, n_clusters, method, dim, args)
+            row["peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+        finally:
+            tracemalloc.stop()
+    row["labels"] = labels
+    return row
+
+
+def main(argv: list[str] | None = None) -> int:
+    from sklearn.metrics import adjusted_rand_score
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--vocab-size", type=int, default=50000)
+    parser.add_argument("--n-topics", type=int, default=40)
+    parser.add_argument("--dims", type=int, nargs="+", default=[64, 128, 256])
+    parser.add_argument("--methods", nargs="+", default=list(REDUCTION_METHODS),
+                        choices=REDUCTION_METHODS)
+    parser.add_argument("--engine", default="kmeans", help="clustering engine")
+    parser.add_argument("--ratio", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=1, help="timing runs (best kept)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    runs = []
+    for size in args.sizes:
+        text = synthetic_document(
+            size, vocab_size=args.vocab_size, distribution="topical",
+            n_topics=args.n_topics, seed=args.seed,
+        )
+        X, _ = build_tfidf_matrix(split_sentences(text, "regex"))
+        n_clusters = max(2, int(X.shape[0] * args.ratio))
+
+        full = benchmark(X, n_clusters, None, None, args)
+        reference = full["labels"]
+        variants = [full] + [
+            benchmark(X, n_clusters, method, dim, args)
+            for method in args.methods
+            for dim in args.dims
+        ]
+        base = _objective(X, reference)
+        for row in variants:
+            labels = row.pop("labels")
+            row["ari"] = round(float(adjusted_rand_score(reference, labels)), 3)
+            row["objective"] = round(_objective(X, labels), 2)
+            row["objective_vs_full"] = round(row["objective"] / base, 4)
+            row["speedup"] = round(full["seconds"] / row["seconds"], 2)
+            runs.append({"n_sentences": X.shape[0], "n_features": X.shape[1],
+                         "n_clusters": n_clusters, **row})
+        print(f"done: {size} sentences", file=sys.stderr)
+
+    print(json.dumps({"config": vars(args), "runs": runs}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
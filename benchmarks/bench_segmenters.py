@@ -0,0 +1,129 @@
+"""
+Sentence segmenter benchmark.
+
+Measures, for each segmenter:
+
+  - **agreement** with Punkt — precision / recall / F1 of sentence-end
+    offsets, and the share of documents split identically;
+  - **throughput** — documents/s, sentences/s and MB/s, both one call per
+    document and one ``split_batch`` call for the whole corpus.
+
+The legacy path (``nltk.sent_tokenize`` on every call) is included as a
+baseline.  Results are printed as JSON.
+
+Usage
+-----
+    python -m benchmarks.bench_segmenters [--docs 2000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+from benchmarks.corpus import sample_documents
+from src.preprocess import clean_text, get_segmenter
+
+
+def _boundaries(text: str, sentences: list[str]) -> set[int]:
+    """Character offsets at which each sentence ends."""
+    ends, pos = set(), 0
+    for sentence in sentences:
+        start = text.find(sentence, pos)
+        if start < 0:
+            continue
+        pos = start + len(sentence)
+        ends.add(pos)
+    return ends
+
+
+def agreement(docs: list[str], reference: list[list[str]], candidate: list[list[str]]) -> dict:
+    """Boundary precision / recall / F1 of *candidate* against *reference*."""
+    tp = fp = fn = exact = 0
+    for text, ref, cand in zip(docs, reference, candidate):
+        r, c = _boundaries(text, ref), _boundaries(text, cand)
+        tp += len(r & c)
+        fp += len(c - r)
+        fn += len(r - c)
+        exact += ref == cand
+    precision = tp / (tp + fp) if tp + fp else 1.0
+    recall = tp / (tp + fn) if tp + fn else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {
+        "precision": round(precision, 4),
+        "recall": round(recall, 4),
+        "f1": round(f1, 4),
+        "exact_documents": round(exact / len(docs), 4),
+    }
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def throughput(seconds: float, docs: list[str], n_sentences: int) -> dict:
+    n_bytes = sum(len(d.encode("utf-8")) for d in docs)
+    return {
+        "seconds": round(seconds, 4),
+        "docs_per_sec": round(len(docs) / seconds, 1),
+        "sentences_per_sec": round(n_sentences / seconds, 1),
+        "mb_per_sec": round(n_bytes / seconds / 1e6, 2),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--docs", type=int, default=2000, help="number of documents")
+    parser.add_argument("--repeat", type=int, default=3, help="timing repeats (best kept)")
+    parser.add_argument(
+        "--segmenters", nargs="+", default=["punkt", "regex"],
+        help="segmenters to compare; 'punkt', if listed, is the reference",
+    )
+    args = parser.parse_args(argv)
+
+    docs = [clean_text(d) for d in sample_documents(args.docs)]
+    report: dict = {"documents": len(docs), "segmenters": {}}
+
+    reference = None
+    if "punkt" in args.segmenters:
+        from nltk.tokenize import sent_tokenize
+
+        get_segmenter("punkt").split(docs[0])  # load the model outside the timer
+        reference = get_segmenter("punkt").split_batch(docs)
+        n_ref = sum(len(s) for s in reference)
+        seconds = _time(lambda: [sent_tokenize(d) for d in docs], args.repeat)
+        report["segmenters"]["sent_tokenize (per call)"] = {
+            "throughput": throughput(seconds, docs, n_ref),
+        }
+
+    for name in args.segmenters:
+        seg = get_segmenter(name)
+        result = seg.split_batch(docs)
+        n_sentences = sum(len(s) for s in result)
+        entry = {
+            "sentences": n_sentences,
+            "throughput": throughput(
+                _time(lambda: [seg.split(d) for d in docs], args.repeat), docs, n_sentences
+            ),
+            "throughput_batch": throughput(
+                _time(lambda: seg.split_batch(docs), args.repeat), docs, n_sentences
+            ),
+        }
+        if reference is not None:
+            entry["agreement_with_punkt"] = agreement(docs, reference, result)
+        report["segmenters"][name] = entry
+
+    json.dump(report, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,112 @@
+"""
+Out-of-core benchmark.
+
+Writes synthetic ``topical`` text files of increasing size and
+summarises each one twice, in a fresh child process per run so peak RSS
+is measured cleanly:
+
+  - ``in_memory``  read the file into a ``str`` and call ``summarize``
+                   (hashing mode, spherical engine — the closest in-memory
+                   equivalent)
+  - ``streaming``  ``summarize_file`` with ``--max-memory-mb``
+
+Each row reports wall time, the child's peak RSS and the number of
+summary sentences.  The in-memory peak grows with the file; the
+streaming peak should stay flat.
+
+Usage
+-----
+    python -m benchmarks.bench_streaming
+    python -m benchmarks.bench_streaming --sizes-mb 10 100 1000 --max-memory-mb 128
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import synthetic_document
+
+MODES = ("in_memory", "streaming")
+
+
+def write_file(path: str, size_mb: float, vocab_size: int, seed: int) -> None:
+    """Append seeded synthetic documents to *path* until it reaches *size_mb*."""
+    target = int(size_mb * 2**20)
+    with open(path, "w", encoding="utf-8") as fh:
+        written, part = 0, 0
+        while written < target:
+            doc = synthetic_document(
+                20000, vocab_size=vocab_size, distribution="topical", seed=seed + part
+            )
+            written += fh.write(doc + "\n\n")
+            part += 1
+
+
+def _child(mode: str, path: str, args: argparse.Namespace) -> dict:
+    start = time.perf_counter()
+    if mode == "in_memory":
+        from src.summarizer import summarize
+
+        with open(path, encoding="utf-8") as fh:
+            text = fh.read()
+        result = summarize(
+            text, args.ratio, engine="spherical", segmenter="regex", hash_features=2**18
+        )
+    else:
+        from src.streaming import summarize_file
+
+        result = summarize_file(
+            path, args.ratio, max_memory_mb=args.max_memory_mb, segmenter="regex"
+        )
+    return {
+        "seconds": round(time.perf_counter() - start, 2),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "original_sentence_count": result["original_sentence_count"],
+        "summary_sentence_count": result["summary_sentence_count"],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[5, 20, 80])
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=MODES)
+    parser.add_argument("--ratio", type=float, default=0.001)
+    parser.add_argument("--max-memory-mb", type=float, default=128.0)
+    parser.add_argument("--vocab-size", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_child(*args.child, args)))
+        return 0
+
+    runs = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes_mb:
+            path = os.path.join(tmp, f"{size}mb.txt")
+            write_file(path, size, args.vocab_size, args.seed)
+            for mode in args.modes:
+                out = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.bench_streaming",
+                     "--ratio", str(args.ratio), "--max-memory-mb", str(args.max_memory_mb),
+                     "--child", mode, path],
+                    check=True, capture_output=True, text=True,
+                )
+                runs.append({"size_mb": size, "mode": mode, **json.loads(out.stdout)})
+                print(f"done: {size} MB {mode}", file=sys.stderr)
+            os.remove(path)
+
+    print(json.dumps({"config": vars(args), "runs": runs}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
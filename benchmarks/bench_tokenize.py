@@ -0,0 +1,108 @@
+"""
+Fused-tokenization benchmark.
+
+Compares building per-sentence term features the old way, where every
+consumer tokenizes the sentence strings itself, with tokenizing once via
+``tokenize_sentences`` and handing the interned id arrays on:
+
+  consumer     separate                          fused
+  ----------   -------------------------------   ---------------------------------
+  tfidf        TfidfVectorizer                   build_tfidf_matrix(tokens=...)
+  corpus_idf   IDFStore.transform (CountVec.)    IDFStore.transform(tokens=...)
+  word_counts  utils.word_count per sentence     TokenizedSentences.lengths
+
+Each row reports the best-of-``--repeat`` seconds for every consumer,
+the one-off ``tokenize`` pass on the fused side, the totals, and whether
+the matrices are bit-identical.
+
+Usage
+-----
+    python -m benchmarks.bench_tokenize
+    python -m benchmarks.bench_tokenize --sizes 1000 100000 --vocab-size 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+from benchmarks.corpus import DISTRIBUTIONS, sample_documents, synthetic_document
+from src.feature_extraction import build_tfidf_matrix
+from src.idf_store import IDFStore
+from src.preprocess import split_sentences, tokenize_sentences
+from src.utils import word_count
+
+
+def _best(fn, repeat: int):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def _identical(a, b) -> bool:
+    return bool(
+        a.shape == b.shape
+        and (a.indptr == b.indptr).all()
+        and (a.indices == b.indices).all()
+        and (a.data == b.data).all()
+    )
+
+
+def benchmark(sentences: list[str], store: IDFStore, repeat: int) -> dict:
+    separate: dict[str, float] = {}
+    separate["tfidf"], tfidf_a = _best(lambda: build_tfidf_matrix(sentences)[0], repeat)
+    separate["corpus_idf"], idf_a = _best(lambda: store.transform(sentences)[0], repeat)
+    separate["word_counts"], _ = _best(lambda: [word_count(s) for s in sentences], repeat)
+
+    fused: dict[str, float] = {}
+    fused["tokenize"], tokens = _best(lambda: tokenize_sentences(sentences), repeat)
+    fused["tfidf"], tfidf_b = _best(lambda: build_tfidf_matrix(sentences, tokens=tokens)[0], repeat)
+    fused["corpus_idf"], idf_b = _best(lambda: store.transform(sentences, tokens=tokens)[0], repeat)
+    fused["word_counts"], _ = _best(lambda: tokens.lengths, repeat)
+
+    total_separate, total_fused = sum(separate.values()), sum(fused.values())
+    return {
+        "n_sentences": len(sentences),
+        "n_tokens": int(len(tokens.ids)),
+        "n_terms": len(tokens.terms),
+        "separate": {k: round(v, 5) for k, v in separate.items()},
+        "fused": {k: round(v, 5) for k, v in fused.items()},
+        "total_separate": round(total_separate, 5),
+        "total_fused": round(total_fused, 5),
+        "speedup": round(total_separate / total_fused, 2),
+        "tfidf_identical": _identical(tfidf_a, tfidf_b),
+        "corpus_idf_identical": _identical(idf_a, idf_b),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 50000])
+    parser.add_argument("--vocab-size", type=int, default=20000)
+    parser.add_argument("--distribution", default="zipf", choices=DISTRIBUTIONS)
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs (best kept)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    store = IDFStore()
+    store.partial_fit(sample_documents(200, seed=args.seed))
+
+    runs = []
+    for size in args.sizes:
+        text = synthetic_document(
+            size, vocab_size=args.vocab_size, distribution=args.distribution, seed=args.seed
+        )
+        runs.append(benchmark(split_sentences(text, "regex"), store, args.repeat))
+        print(f"done: {size} sentences", file=sys.stderr)
+
+    print(json.dumps({"config": vars(args), "runs": runs}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+"""
+Load generator for the local HTTP service (``src.service``).
+
+Opens ``--concurrency`` keep-alive connections, sends ``--requests``
+``POST /summarize`` calls spread across them, and reports throughput,
+latency percentiles and how many requests were rejected with 503.  The
+server's own ``/metrics`` are printed at the end so queue depth, batch
+sizes and server-side latency can be compared with what clients saw.
+
+Usage
+-----
+    python -m src.service --workers 4 &
+    python -m benchmarks.load_service --concurrency 32 --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter
+
+import numpy as np
+
+from benchmarks.corpus import sample_documents
+
+
+async def _request(reader, writer, method: str, path: str, body: bytes = b"") -> tuple[int, bytes]:
+    head = (
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def _client(host, port, bodies, latencies, statuses) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for body in bodies:
+            start = time.perf_counter()
+            status, _ = await _request(reader, writer, "POST", "/summarize", body)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+    finally:
+        writer.close()
+
+
+async def run(args: argparse.Namespace) -> dict:
+    docs = sample_documents(min(args.requests, 200), seed=args.seed)
+    options = {"ratio": args.ratio, "engine": args.engine}
+    bodies = [
+        json.dumps({"text": docs[i % len(docs)], **options}).encode("utf-8")
+        for i in range(args.requests)
+    ]
+
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(args.host, args.port, bodies[c::args.concurrency], latencies, statuses)
+        for c in range(args.concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    _, metrics = await _request(reader, writer, "GET", "/metrics")
+    writer.close()
+
+    ms = np.array(latencies) * 1000
+    return {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(args.requests / elapsed, 1),
+        "latency_ms": {
+            p: round(float(np.percentile(ms, q)), 1)
+            for p, q in (("p50", 50), ("p90", 90), ("p99", 99), ("max", 100))
+        },
+        "status_counts": dict(statuses),
+        "server_metrics": metrics.decode("utf-8"),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--ratio", type=float, default=0.3)
+    parser.add_argument("--engine", default="kmeans")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    metrics = report.pop("server_metrics")
+    print(json.dumps(report, indent=2))
+    print(metrics)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,9 +4,21 @@ src - Extractive Text Summarization Pipeline
 
 Modules
 -------
-preprocess          Text cleaning, sentence splitting, tokenization
+preprocess          Text cleaning, sentence splitting, fused tokenization
+dedup               MinHash / LSH grouping of near-duplicate sentences
 feature_extraction  TF-IDF vectorization and sentence scoring
+idf_store           Persistent, incrementally updated corpus IDF
 clustering          K-Means sentence clustering with automatic k selection
+spherical_kmeans    Sparse-native cosine K-Means (full-batch and mini-batch)
+ranking             TextRank-style sentence ranking over a similarity graph
 summarizer          High-level API that ties the pipeline together
+streaming           Two-pass, memory-mapped summarisation of huge files
+batch               Process-pool front-end for summarising many documents
+execution           Native thread caps and concurrent K-Means restarts
+__main__            Bulk CLI: directories / JSONL in, JSONL summaries out
+cache               Memory + SQLite result cache for summarize()
+incremental         Re-summarization of edited documents, reusing prior work
+tracing             Opt-in per-stage timings and metrics for summarize()
+service             Local asyncio HTTP service with micro-batching
 utils               Shared helpers and sample texts
 """
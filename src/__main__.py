@@ -0,0 +1,203 @@
+"""
+Bulk command-line summariser.
+
+    python -m src INPUT [INPUT ...] --output summaries.jsonl [options]
+
+Each INPUT may be
+
+  - a directory — every ``*.txt`` file below it is one document, with its
+    relative path as the record id;
+  - a ``.txt`` file — one document;
+  - a ``.jsonl`` file, or ``-`` for JSONL on stdin — one document per
+    line, text in ``--text-field`` and id in ``--id-field`` (falls back to
+    ``<file>:<line>``).
+
+Records are read lazily and summarised in parallel worker processes (see
+``src.batch``); each result is written as one JSON line as soon as it
+finishes, so memory stays flat however large the input is.  Output lines
+are ``{"id": ..., "summary": ..., ...}`` or ``{"id": ..., "error": ...}``.
+
+``--resume`` skips every id already summarised in ``--output`` and
+appends to it, so an interrupted run can be restarted with the same
+command; records that failed are tried again.
+
+Progress and final throughput (docs/sec, sentences/sec) go to stderr;
+the exit status is 1 if any record failed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections.abc import Iterable, Iterator
+
+from src.batch import default_workers, imap, pool_policy, summarize_record, worker_initializer
+from src.execution import ExecutionPolicy
+
+
+# ── Input ──────────────────────────────────────────────────────────
+
+def iter_records(
+    inputs: Iterable[str],
+    text_field: str = "text",
+    id_field: str = "id",
+) -> Iterator[tuple[str, str]]:
+    """Yield ``(record_id, text)`` for every document in *inputs*, lazily."""
+    for source in inputs:
+        if source == "-":
+            yield from _jsonl_records(sys.stdin, "<stdin>", text_field, id_field)
+        elif os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(".txt"):
+                        path = os.path.join(root, name)
+                        yield os.path.relpath(path, source), _read_text(path)
+        elif source.endswith(".jsonl"):
+            with open(source, encoding="utf-8") as fh:
+                yield from _jsonl_records(fh, source, text_field, id_field)
+        else:
+            yield source, _read_text(source)
+
+
+def _read_text(path: str) -> str:
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        return fh.read()
+
+
+def _jsonl_records(lines, name: str, text_field: str, id_field: str):
+    for lineno, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            print(f"skipping {name}:{lineno}: {exc}", file=sys.stderr)
+            continue
+        record_id = record.get(id_field)
+        if record_id is None:
+            record_id = f"{name}:{lineno}"
+        yield str(record_id), str(record.get(text_field) or "")
+
+
+# ── Resume ─────────────────────────────────────────────────────────
+
+def completed_ids(path: str) -> set[str]:
+    """
+    Ids already summarised in *path*.
+
+    Records written as ``{"id": ..., "error": ...}`` are not counted, so a
+    resumed run retries them.  A torn last line (the previous run was killed mid-write) is truncated
+    away so appending starts on a clean line.
+    """
+    done: set[str] = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, "rb+") as fh:
+        good_end = 0
+        for line in fh:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+                record_id = str(record["id"])
+            except (ValueError, KeyError, TypeError):
+                break
+            if "error" not in record:
+                done.add(record_id)
+            good_end += len(line)
+        fh.truncate(good_end)
+    return done
+
+
+# ── Main ───────────────────────────────────────────────────────────
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src",
+        description="Summarise directories of text files or JSONL dumps into JSONL.",
+    )
+    parser.add_argument("inputs", nargs="+", help="directories, .txt or .jsonl files, or -")
+    parser.add_argument("-o", "--output", help="JSONL output file (default: stdout)")
+    parser.add_argument("--resume", action="store_true", help="skip ids already summarised in --output")
+    parser.add_argument("--text-field", default="text", help="JSONL field holding the text")
+    parser.add_argument("--id-field", default="id", help="JSONL field holding the record id")
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--chunksize", type=int, default=8, help="documents per task")
+    parser.add_argument("--ratio", type=float, default=0.3)
+    parser.add_argument("--engine", default="kmeans")
+    parser.add_argument("--segmenter", default="punkt")
+    parser.add_argument("--dedup-threshold", type=float, default=None,
+                        help="collapse near-duplicate sentences at this Jaccard similarity")
+    parser.add_argument("--threads", type=int, default=None,
+                        help="native threads per call (default: cores / workers)")
+    parser.add_argument("--restart-workers", type=int, default=1,
+                        help="K-Means restarts run concurrently per call")
+    parser.add_argument("--progress-every", type=float, default=10.0, help="seconds")
+    args = parser.parse_args(argv)
+
+    if args.resume and not args.output:
+        parser.error("--resume needs --output")
+
+    done = completed_ids(args.output) if args.resume else set()
+    records = (
+        r for r in iter_records(args.inputs, args.text_field, args.id_field)
+        if r[0] not in done
+    )
+    if args.output:
+        out = open(args.output, "a" if args.resume else "w", encoding="utf-8")
+    else:
+        out = sys.stdout
+
+    options = {
+        "ratio": args.ratio, "engine": args.engine, "segmenter": args.segmenter,
+        "dedup_threshold": args.dedup_threshold,
+    }
+    policy = ExecutionPolicy.for_workers(args.workers, args.restart_workers, args.threads)
+    n_docs = n_sentences = n_errors = 0
+    start = last_report = time.perf_counter()
+
+    def report(final: bool = False) -> None:
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        label = "done" if final else "progress"
+        print(
+            f"{label}: {n_docs} docs ({n_errors} errors) in {elapsed:.1f}s — "
+            f"{n_docs / elapsed:.1f} docs/sec, {n_sentences / elapsed:.1f} sentences/sec",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    try:
+        for _, (record_id, result) in imap(
+            summarize_record,
+            records,
+            workers=args.workers,
+            chunksize=args.chunksize,
+            ordered=False,
+            initializer=worker_initializer(**options, policy=pool_policy(args.workers, policy)),
+            policy=policy,
+            **options,
+        ):
+            out.write(json.dumps({"id": record_id, **result}, ensure_ascii=False) + "\n")
+            out.flush()
+            n_docs += 1
+            n_errors += "error" in result
+            n_sentences += result.get("original_sentence_count", 0)
+            if time.perf_counter() - last_report >= args.progress_every:
+                report()
+                last_report = time.perf_counter()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if done:
+        print(f"resumed: skipped {len(done)} completed ids", file=sys.stderr)
+    report(final=True)
+    return 1 if n_errors else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
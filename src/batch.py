@@ -0,0 +1,253 @@
+"""
+Batch summarization module.
+
+Runs the pipeline over many documents at once by fanning them out to a
+pool of worker processes.  Each worker loads the expensive bits — NLTK's
+Punkt model, the stopword set and scikit-learn — exactly once in its
+initializer, so every document after the first pays only for the actual
+summarization work.
+
+Two entry points:
+
+    summarize_many(texts, ...)   →  list of result dicts, in input order
+    iter_summaries(texts, ...)   →  yields (index, result) as they finish
+
+Documents are shipped to workers in batches of *chunksize* to amortise
+pickling overhead, and only a bounded number of batches is in flight at
+any time, so *texts* may be a lazy generator over a huge corpus.
+
+Each worker also caps its native (BLAS / OpenMP) thread pools at its
+share of the cores — ``ExecutionPolicy.for_workers`` unless a ``policy``
+is given — so n workers never run n × cores threads between them.
+"""
+
+from __future__ import annotations
+
+import os
+import functools
+import itertools
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any
+
+from src.execution import ExecutionPolicy, set_policy
+
+
+# ── Worker lifecycle ───────────────────────────────────────────────
+
+def _init_worker(
+    segmenter="punkt",
+    engine: str = "kmeans",
+    policy: ExecutionPolicy | None = None,
+) -> None:
+    """
+    Apply the execution policy and pre-load heavy resources once per
+    worker process.
+
+    Runs in the child right after it starts, before any task arrives.
+    """
+    from src.summarizer import warmup
+
+    if policy is not None:
+        set_policy(policy)  # before warm-up loads the native libraries
+
+    warmup(segmenter, (engine,))
+
+
+def _run_batch(func: Callable, batch: list[tuple[int, Any]], options: dict) -> list:
+    """Apply *func* to every item of one batch, keeping the input index."""
+    return [(i, func(item, **options)) for i, item in batch]
+
+
+def default_workers() -> int:
+    """Number of worker processes to use when the caller doesn't say."""
+    return max(1, os.cpu_count() or 1)
+
+
+def pool_policy(workers: int, policy: ExecutionPolicy | None = None) -> ExecutionPolicy | None:
+    """
+    Policy for the processes of a *workers*-wide pool: *policy* if given,
+    else an even share of the cores each.  ``None`` for in-process runs,
+    which leave the caller's process settings alone.
+    """
+    if workers <= 1:
+        return None
+    return policy or ExecutionPolicy.for_workers(workers)
+
+
+def worker_initializer(
+    segmenter="punkt",
+    engine: str = "kmeans",
+    policy: ExecutionPolicy | None = None,
+    **_ignored,
+) -> Callable:
+    """Initializer that applies *policy* and warms up the segmenter and engine in use."""
+    return functools.partial(_init_worker, segmenter=segmenter, engine=engine, policy=policy)
+
+
+# ── Generic parallel map ───────────────────────────────────────────
+
+def imap(
+    func: Callable,
+    items: Iterable,
+    *,
+    workers: int | None = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    max_pending: int | None = None,
+    initializer: Callable | None = _init_worker,
+    **options,
+) -> Iterator[tuple[int, Any]]:
+    """
+    Apply ``func(item, **options)`` to every item using a process pool.
+
+    Parameters
+    ----------
+    func        : module-level (picklable) callable
+    items       : any iterable — consumed lazily
+    workers     : number of processes; ``1`` runs in-process with no pool
+    chunksize   : items per task sent to a worker
+    ordered     : if True, yield results in input order; otherwise yield
+                  each batch as soon as it completes
+    max_pending : cap on batches in flight or finished and waiting for
+                  their turn (defaults to ``2 × workers``)
+    initializer : per-worker setup hook
+
+    Yields
+    ------
+    (index, result) pairs, where *index* is the item's input position.
+    """
+    if workers is None:
+        workers = default_workers()
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+
+    indexed = enumerate(items)
+
+    # ── serial path: no pickling, no process start-up ─────────────
+    if workers <= 1:
+        if initializer is not None:
+            initializer()
+        for i, item in indexed:
+            yield i, func(item, **options)
+        return
+
+    if max_pending is None:
+        max_pending = 2 * workers
+
+    batches = iter(lambda: list(itertools.islice(indexed, chunksize)), [])
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer) as pool:
+        pending = set()
+        buffered: dict[int, Any] = {}  # finished results waiting for their turn
+        next_index = 0
+
+        def _submit_up_to_limit() -> None:
+            # results parked behind a slow earlier batch count against the
+            # limit too, or memory would grow without bound while we wait
+            held = len(pending) + -(-len(buffered) // chunksize)
+            for batch in itertools.islice(batches, max(0, max_pending - held)):
+                pending.add(pool.submit(_run_batch, func, batch, options))
+
+        _submit_up_to_limit()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for i, result in future.result():
+                    if ordered:
+                        buffered[i] = result
+                    else:
+                        yield i, result
+
+            # flush everything that is now contiguous with what we've emitted
+            while next_index in buffered:
+                yield next_index, buffered.pop(next_index)
+                next_index += 1
+
+            _submit_up_to_limit()
+
+
+# ── Summarization front-ends ───────────────────────────────────────
+
+def summarize_record(record: tuple[str, str], **options) -> tuple[str, dict]:
+    """
+    Summarise one ``(record_id, text)`` pair for bulk jobs.
+
+    A failure is returned as ``{"error": ...}`` for that record rather
+    than raised, so one bad document doesn't abort a long run.
+    """
+    from src.summarizer import summarize
+
+    record_id, text = record
+    try:
+        return record_id, summarize(text, **options)
+    except Exception as exc:
+        return record_id, {"error": f"{type(exc).__name__}: {exc}"}
+
+
+def iter_summaries(
+    texts: Iterable[str],
+    ratio: float = 0.3,
+    *,
+    workers: int | None = None,
+    chunksize: int = 1,
+    ordered: bool = False,
+    **options,
+) -> Iterator[tuple[int, dict]]:
+    """
+    Summarise many documents in parallel, streaming results back.
+
+    Any extra keyword arguments are forwarded to
+    :func:`src.summarizer.summarize`.
+
+    Yields
+    ------
+    (index, result) pairs.  With ``ordered=False`` (the default) each
+    result is yielded as soon as its batch finishes.
+    """
+    from src.summarizer import summarize
+
+    if workers is None:
+        workers = default_workers()
+    policy = pool_policy(workers, options.get("policy"))
+    yield from imap(
+        summarize,
+        texts,
+        workers=workers,
+        chunksize=chunksize,
+        ordered=ordered,
+        initializer=worker_initializer(**{**options, "policy": policy}),
+        ratio=ratio,
+        **options,
+    )
+
+
+def summarize_many(
+    texts: Iterable[str],
+    ratio: float = 0.3,
+    *,
+    workers: int | None = None,
+    chunksize: int = 1,
+    **options,
+) -> list[dict]:
+    """
+    Summarise many documents in parallel.
+
+    Parameters
+    ----------
+    texts     : iterable of raw input strings
+    ratio     : fraction of sentences to keep (see ``summarize``)
+    workers   : number of worker processes (defaults to CPU count)
+    chunksize : documents per task — raise this for many short texts
+
+    Returns
+    -------
+    list[dict]
+        One ``summarize()`` result per input, in input order.
+    """
+    return [
+        result
+        for _, result in iter_summaries(
+            texts, ratio, workers=workers, chunksize=chunksize, ordered=True, **options
+        )
+    ]
@@ -0,0 +1,253 @@
+"""
+Result cache module.
+
+Syndicated articles and demo texts come through the pipeline again and
+again.  ``SummaryCache`` sits in front of ``summarize()`` so a repeated
+input skips preprocessing, TF-IDF and clustering entirely.
+
+Design
+------
+- **Key** — SHA-256 of the *cleaned* text plus every option that changes
+  the output (ratio, engine, random_state, …).  Whitespace-only edits
+  therefore hit the same entry.
+- **Memory tier** — a bounded LRU (``OrderedDict``) private to the process.
+- **Disk tier** (optional) — a SQLite file shared by every process that
+  opens it; least-recently-used rows are evicted once the stored payload
+  exceeds ``max_disk_bytes``.
+- **Single flight** — concurrent callers asking for the same key wait on
+  one computation instead of each running the pipeline.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+
+
+class SummaryCache:
+    """
+    Two-tier (memory + optional SQLite) cache for summary results.
+
+    Parameters
+    ----------
+    max_entries    : capacity of the in-memory LRU tier
+    path           : SQLite file for the disk tier; ``None`` disables it
+    max_disk_bytes : evict least-recently-used rows beyond this size
+
+    Example
+    -------
+    >>> cache = SummaryCache(max_entries=512, path="summaries.sqlite")
+    >>> summarize(text, ratio=0.3, cache=cache)
+    >>> cache.stats()
+    {'hits': 0, 'memory_hits': 0, 'disk_hits': 0, 'misses': 1, ...}
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        path: str | os.PathLike | None = None,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        self.max_entries = max_entries
+        self.path = os.fspath(path) if path is not None else None
+        self.max_disk_bytes = max_disk_bytes
+        self._setup()
+
+    def _setup(self) -> None:
+        self._lock = threading.Lock()       # memory tier, counters, in-flight map
+        self._disk_lock = threading.Lock()  # SQLite — memory hits never wait on I/O
+        self._memory: OrderedDict[str, dict] = OrderedDict()
+        self._inflight: dict[str, Future] = {}
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "shared": 0}
+
+    # pickling support — batch workers get their own memory tier and
+    # connection, but share the same disk file
+    def __getstate__(self) -> dict:
+        return {
+            "max_entries": self.max_entries,
+            "path": self.path,
+            "max_disk_bytes": self.max_disk_bytes,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._setup()
+
+    # ── Keys ───────────────────────────────────────────────────────
+
+    @staticmethod
+    def make_key(cleaned_text: str, **params) -> str:
+        """Content hash of *cleaned_text* plus the output-affecting options."""
+        h = hashlib.sha256()
+        h.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+        h.update(b"\0")
+        h.update(cleaned_text.encode("utf-8"))
+        return h.hexdigest()
+
+    # ── Public API ─────────────────────────────────────────────────
+
+    def get_or_compute(self, key: str, compute: Callable[[], dict]) -> dict:
+        """
+        Return the cached result for *key*, computing it at most once.
+
+        If another thread is already computing the same key, wait for its
+        result instead of starting a second computation.
+        """
+        with self._lock:
+            result = self._memory_get(key)
+            if result is not None:
+                self._counters["memory_hits"] += 1
+                return copy.deepcopy(result)
+
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self._counters["shared"] += 1
+
+        if not owner:
+            return copy.deepcopy(future.result())
+
+        try:
+            result = self._disk_get(key)
+            if result is not None:
+                hit_counter = "disk_hits"
+            else:
+                hit_counter = "misses"
+                result = compute()
+                self._disk_put(key, result)
+
+            with self._lock:
+                self._counters[hit_counter] += 1
+                self._memory_put(key, result)
+            future.set_result(result)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+        return copy.deepcopy(result)
+
+    def stats(self) -> dict:
+        """Hit/miss counters plus current tier sizes."""
+        with self._lock:
+            c = dict(self._counters)
+            c["hits"] = c["memory_hits"] + c["disk_hits"]
+            c["memory_entries"] = len(self._memory)
+        if self.path is not None:
+            c["disk_bytes"] = self._disk_size()
+        return c
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            for name in self._counters:
+                self._counters[name] = 0
+        if self.path is not None:
+            with self._disk_lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM summaries")
+                conn.commit()
+
+    # ── Memory tier (callers hold self._lock) ──────────────────────
+
+    def _memory_get(self, key: str) -> dict | None:
+        result = self._memory.get(key)
+        if result is not None:
+            self._memory.move_to_end(key)
+        return result
+
+    def _memory_put(self, key: str, result: dict) -> None:
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    # ── Disk tier (under self._disk_lock) ──────────────────────────
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (or reuse) this process's connection to the SQLite file."""
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " accessed REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS summaries_accessed ON summaries(accessed)"
+            )
+            conn.commit()
+            self._conn, self._conn_pid = conn, os.getpid()
+        return self._conn
+
+    def _disk_get(self, key: str) -> dict | None:
+        if self.path is None:
+            return None
+        with self._disk_lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE summaries SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            conn.commit()
+        return json.loads(row[0])
+
+    def _disk_put(self, key: str, result: dict) -> None:
+        if self.path is None:
+            return
+        payload = json.dumps(result)
+        with self._disk_lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, value, size, accessed)"
+                " VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time()),
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least-recently-used rows until under ``max_disk_bytes``."""
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM summaries").fetchone()
+        if total <= self.max_disk_bytes:
+            return
+        rows = conn.execute("SELECT key, size FROM summaries ORDER BY accessed")
+        doomed = []
+        for key, size in rows:
+            if total <= self.max_disk_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM summaries WHERE key = ?", doomed)
+
+    def _disk_size(self) -> int:
+        with self._disk_lock:
+            (total,) = self._connect().execute(
+                "SELECT COALESCE(SUM(size), 0) FROM summaries"
+            ).fetchone()
+        return int(total)
@@ -14,21 +14,103 @@ where μ_k is the centroid of cluster C_k.
 
 We pick *k* from user-specified `ratio` (fraction of sentences to keep),
 but also expose `optimal_k()` which uses the *elbow method* — finding the
-k where diminishing returns on J start to flatten out.
+k where diminishing returns on J start to flatten out.  `fast_optimal_k()`
+applies the same rule on a sampled, coarse, early-stopped sweep and backs
+`summarize(ratio="auto")`.
+
+The clustering *engine* is selectable: the default is scikit-learn's
+Euclidean K-Means; "spherical" and "minibatch" optimise cosine distance
+directly on the sparse rows (see `src.spherical_kmeans`).  "bisecting"
+builds a `ClusterHierarchy` that can be cut at any k without re-clustering
+— `select_representative_sentences` accepts one directly.
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import numpy as np
-from sklearn.cluster import KMeans
+
+from src.execution import bounded_threads, map_restarts
+
+# scikit-learn and SciPy (via src.spherical_kmeans) are imported on first
+# use so that importing the package stays cheap.
+if TYPE_CHECKING:
+    from sklearn.cluster import KMeans
+
+    from src.spherical_kmeans import ClusterFit, ClusterHierarchy
 
 
 # ── Cluster assignment ─────────────────────────────────────────────
 
+ENGINES = ("kmeans", "spherical", "minibatch", "bisecting")
+
+
+@bounded_threads
+def fit_clusters(
+    tfidf_matrix,
+    n_clusters: int,
+    random_state: int = 42,
+    engine: str = "kmeans",
+    sample_weight: np.ndarray | None = None,
+) -> ClusterFit:
+    """
+    Cluster the TF-IDF sentence vectors with the selected *engine*.
+
+    *sample_weight*, if given, makes row i count as ``sample_weight[i]``
+    identical rows — e.g. the group sizes of collapsed near-duplicates
+    (see ``src.dedup``).
+
+    Engines
+    -------
+    kmeans     scikit-learn ``KMeans(n_init=10)`` — Euclidean Lloyd with
+               ten restarts.  The reference; slowest on long documents.
+               Restarts run concurrently under an execution policy
+               with ``restart_workers > 1`` (see ``src.execution``).
+    spherical  Sparse-native cosine K-Means with k-means++ seeding and a
+               single run (see ``src.spherical_kmeans``).
+    minibatch  Mini-batch spherical K-Means — per-step cost independent
+               of n; the choice for very long inputs.
+    bisecting  Bisecting spherical K-Means (``ClusterHierarchy``) — one
+               tree serves every k; use ``build_hierarchy`` to keep it.
+
+    Returns
+    -------
+    ClusterFit(labels, centroids, inertia, n_iter)
+    """
+    from src.spherical_kmeans import (
+        ClusterFit,
+        ClusterHierarchy,
+        minibatch_spherical_kmeans,
+        spherical_kmeans,
+    )
+
+    if engine == "kmeans":
+        km = kmeans_restarts(
+            tfidf_matrix, n_clusters, random_state, n_init=10, max_iter=300,
+            sample_weight=sample_weight,
+        )
+        return ClusterFit(km.labels_, km.cluster_centers_, float(km.inertia_), int(km.n_iter_))
+    if engine == "spherical":
+        return spherical_kmeans(
+            tfidf_matrix, n_clusters, random_state=random_state, sample_weight=sample_weight
+        )
+    if engine == "minibatch":
+        return minibatch_spherical_kmeans(
+            tfidf_matrix, n_clusters, random_state=random_state, sample_weight=sample_weight
+        )
+    if engine == "bisecting":
+        return ClusterHierarchy(
+            tfidf_matrix, random_state=random_state, sample_weight=sample_weight
+        ).fit(n_clusters)
+    raise ValueError(f"unknown clustering engine {engine!r}; expected one of {ENGINES}")
+
+
 def cluster_sentences(
     tfidf_matrix,
     n_clusters: int,
     random_state: int = 42,
+    engine: str = "kmeans",
 ) -> np.ndarray:
     """
     Run K-Means on the TF-IDF sentence vectors.
@@ -38,23 +120,98 @@ def cluster_sentences(
     tfidf_matrix  : sparse/dense matrix, shape (n_sentences, n_features)
     n_clusters    : number of clusters (= desired summary sentences)
     random_state  : seed for reproducibility
+    engine        : "kmeans" (default), "spherical", "minibatch" or
+                    "bisecting" — see ``fit_clusters``
 
     Returns
     -------
     labels : ndarray of shape (n_sentences,)
         Cluster id for each sentence.
     """
-    km = KMeans(
-        n_clusters=n_clusters,
-        random_state=random_state,
-        n_init=10,
-        max_iter=300,
-    )
-    return km.fit_predict(tfidf_matrix)
+    return fit_clusters(tfidf_matrix, n_clusters, random_state, engine).labels
+
+
+@bounded_threads
+def kmeans_restarts(
+    tfidf_matrix,
+    n_clusters: int,
+    random_state: int = 42,
+    n_init: int = 10,
+    max_iter: int = 300,
+    sample_weight: np.ndarray | None = None,
+) -> KMeans:
+    """
+    ``KMeans(n_init=n_init).fit(X, sample_weight=sample_weight)``, with the restarts spread over the
+    execution policy's restart pool.
+
+    The k-means++ seeds are drawn up front from one ``RandomState``, in
+    the order ``KMeans`` itself draws them; each restart is then a
+    single-init ``KMeans`` and the winner is picked by ``KMeans``' own
+    rule (strictly lower inertia and a different partition).  The result
+    matches ``KMeans(n_init=n_init)`` and does not depend on how many
+    restarts run at once.
+
+    Returns
+    -------
+    The fitted ``KMeans`` of the best restart.
+    """
+    import scipy.sparse as sp
+    from sklearn.cluster import KMeans, kmeans_plusplus
+    from sklearn.utils import check_random_state
+    from sklearn.utils.extmath import row_norms
+
+    # KMeans seeds on mean-centred rows when X is dense; do the same
+    X = tfidf_matrix
+    mean = None if sp.issparse(X) else X.mean(axis=0)
+    centred = X if mean is None else X - mean
+    norms = row_norms(centred, squared=True)
+    rng = check_random_state(random_state)
+    seeds = []
+    for _ in range(n_init):
+        centres, _ = kmeans_plusplus(
+            centred, n_clusters, sample_weight=sample_weight, x_squared_norms=norms,
+            random_state=rng,
+        )
+        seeds.append(centres if mean is None else centres + mean)
+    del centred
+
+    def restart(init: np.ndarray) -> KMeans:
+        km = KMeans(n_clusters=n_clusters, init=init, n_init=1, max_iter=max_iter)
+        return km.fit(X, sample_weight=sample_weight)
+
+    best = None
+    for km in map_restarts(restart, seeds):
+        if best is None or (
+            km.inertia_ < best.inertia_ and not _same_partition(km.labels_, best.labels_)
+        ):
+            best = km
+    return best
+
+
+def _same_partition(a: np.ndarray, b: np.ndarray) -> bool:
+    """True if labelings *a* and *b* differ only by renaming clusters."""
+    pairs = np.unique(np.stack([a, b]), axis=1).shape[1]
+    return pairs == len(np.unique(a)) == len(np.unique(b))
+
+
+@bounded_threads
+def build_hierarchy(tfidf_matrix, random_state: int = 42) -> ClusterHierarchy:
+    """
+    Bisecting spherical K-Means tree over the sentence vectors.
+
+    Build it once per document; ``hierarchy.cut(k)`` then returns labels
+    for any k near-instantly, and ``select_representative_sentences``
+    accepts the hierarchy in place of labels.  The tree grows lazily, so
+    only the splits the largest requested k needs are ever computed.
+    """
+    from src.spherical_kmeans import ClusterHierarchy
+
+    return ClusterHierarchy(tfidf_matrix, random_state=random_state)
 
 
 # ── Optimal k via the elbow heuristic ──────────────────────────────
 
+@bounded_threads
 def optimal_k(
     tfidf_matrix,
     max_k: int | None = None,
@@ -88,8 +245,7 @@ def optimal_k(
     ks = list(range(2, max_k + 1))
     inertias = []
     for k in ks:
-        km = KMeans(n_clusters=k, random_state=random_state, n_init=5, max_iter=200)
-        km.fit(tfidf_matrix)
+        km = kmeans_restarts(tfidf_matrix, k, random_state, n_init=5, max_iter=200)
         inertias.append(km.inertia_)
 
     # second-derivative approach to find the elbow
@@ -104,12 +260,107 @@ def optimal_k(
     return ks[elbow_idx]
 
 
+# ── Fast automatic k ───────────────────────────────────────────────
+
+@bounded_threads
+def fast_optimal_k(
+    tfidf_matrix,
+    max_k: int | None = None,
+    random_state: int = 42,
+    sample_size: int = 2000,
+    grid_size: int = 32,
+    patience: int = 4,
+) -> int:
+    """
+    Elbow-method estimate of k at a fraction of ``optimal_k``'s cost.
+
+    ``optimal_k`` fits a fresh 5-restart K-Means for *every* k in
+    2 … n/2, which is roughly quadratic in the sentence count.  This
+    version keeps the same elbow rule but makes each piece cheaper:
+
+      1. **Sample** — fit on at most *sample_size* rows (seeded).
+      2. **Coarse grid** — evaluate ~*grid_size* k values spaced
+         geometrically between 2 and *max_k*; when the range is small
+         enough every k is evaluated, exactly like ``optimal_k``.
+      3. **Cheap fits** — one k-means++-seeded spherical run per k
+         instead of five Euclidean restarts.
+      4. **Early stop** — the sweep ends once the sharpest bend found so
+         far has stayed the sharpest for *patience* further grid points,
+         so the expensive large-k fits are usually skipped.
+
+    The elbow is the point after the largest second derivative of
+    inertia with respect to k, using spacing-aware finite differences
+    (on a uniform grid this is exactly ``optimal_k``'s rule).
+
+    Parameters
+    ----------
+    tfidf_matrix : sparse/dense matrix
+    max_k        : upper bound for k (defaults to n_sentences // 2)
+    random_state : seed
+    sample_size  : row sample used for the sweep
+    grid_size    : number of k values on the grid
+    patience     : grid points to look past the current best elbow
+
+    Returns
+    -------
+    best_k : int
+        Suggested number of clusters (>= 2).
+    """
+    n = tfidf_matrix.shape[0]
+    if n <= 3:
+        return max(1, n - 1)
+
+    if max_k is None:
+        max_k = max(3, n // 2)
+    max_k = min(max_k, n - 1)
+
+    from src.spherical_kmeans import spherical_kmeans
+
+    X = tfidf_matrix
+    if n > sample_size:
+        rng = np.random.default_rng(random_state)
+        rows = np.sort(rng.choice(n, size=sample_size, replace=False))
+        X = X[rows]
+        max_k = min(max_k, sample_size - 1)
+
+    if max_k - 1 <= grid_size:
+        ks = np.arange(2, max_k + 1)
+    else:
+        ks = np.unique(np.round(np.geomspace(2, max_k, grid_size)).astype(int))
+    if len(ks) < 3:
+        return int(ks[0])
+
+    k_f = ks.astype(float)
+    inertias: list[float] = []
+    # start at the first point with a curvature, so a flat or degenerate
+    # curve (e.g. all-duplicate sentences) still yields a k
+    best_i, best_curv = 2, -np.inf
+    for i, k in enumerate(ks):
+        inertias.append(
+            spherical_kmeans(X, int(k), random_state=random_state, max_iter=50).inertia
+        )
+        if i < 2:
+            continue
+        # spacing-aware second derivative centred on ks[i-1]
+        s_left = (inertias[i - 1] - inertias[i - 2]) / (k_f[i - 1] - k_f[i - 2])
+        s_right = (inertias[i] - inertias[i - 1]) / (k_f[i] - k_f[i - 1])
+        curv = (s_right - s_left) / ((k_f[i] - k_f[i - 2]) / 2)
+        if np.isfinite(curv) and curv > best_curv:
+            best_i, best_curv = i, curv
+        elif i - best_i >= patience:
+            break
+
+    # same "+2" offset as optimal_k: the k right after the sharpest bend
+    return int(ks[best_i])
+
+
 # ── Representative selection ───────────────────────────────────────
 
 def select_representative_sentences(
     sentences: list[str],
-    labels: np.ndarray,
+    labels: np.ndarray | ClusterHierarchy,
     sentence_scores: np.ndarray,
+    n_clusters: int | None = None,
 ) -> list[str]:
     """
     From each cluster pick the sentence with the highest TF-IDF score,
@@ -121,14 +372,34 @@ def select_representative_sentences(
     Parameters
     ----------
     sentences       : original sentence list
-    labels          : cluster id per sentence (from `cluster_sentences`)
+    labels          : cluster id per sentence (from `cluster_sentences`),
+                      or a hierarchy from `build_hierarchy`
     sentence_scores : per-sentence TF-IDF importance score
+    n_clusters      : where to cut *labels* when it is a hierarchy
 
     Returns
     -------
     list[str]
         Selected sentences, ordered by their position in the document.
     """
+    selected_indices = select_representative_indices(labels, sentence_scores, n_clusters)
+    return [sentences[i] for i in selected_indices]
+
+
+def select_representative_indices(
+    labels: np.ndarray | ClusterHierarchy,
+    sentence_scores: np.ndarray,
+    n_clusters: int | None = None,
+) -> list[int]:
+    """
+    Positions of the sentences ``select_representative_sentences`` picks,
+    in document order — for callers that hold sentences as offsets.
+    """
+    if hasattr(labels, "cut"):
+        if n_clusters is None:
+            raise ValueError("n_clusters is required when selecting from a hierarchy")
+        labels = labels.cut(n_clusters)
+
     selected_indices: list[int] = []
 
     for cluster_id in range(labels.max() + 1):
@@ -144,4 +415,4 @@ def select_representative_sentences(
 
     # sort by position so the summary follows original order
     selected_indices.sort()
-    return [sentences[i] for i in selected_indices]
\ No newline at end of file
+    return selected_indices
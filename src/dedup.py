@@ -0,0 +1,216 @@
+"""
+Near-duplicate sentence detection with MinHash and LSH banding.
+
+Scraped pages and transcripts repeat themselves — boilerplate,
+disclaimers, quotes restated with a word changed.  Every copy inflates the
+number of rows K-Means has to cluster and can take a summary slot of its
+own.  This module groups such sentences so only one per group needs to go
+on to TF-IDF and clustering.
+
+Math refresher
+--------------
+Two sentences are compared by the Jaccard similarity of their word
+shingles (runs of ``shingle_size`` consecutive tokens):
+
+    J(A, B) = |A ∩ B| / |A ∪ B|
+
+For a random hash function h, ``P[min h(A) = min h(B)] = J(A, B)``, so a
+*signature* of ``n_perm`` such minima estimates J as the fraction of
+positions on which two signatures agree.
+
+Comparing every pair of signatures would be O(n²).  LSH banding instead
+cuts each signature into ``b`` bands of ``r`` rows and only compares
+sentences whose signatures agree on an entire band.  A pair is a
+candidate with probability ``1 − (1 − Jʳ)ᵇ`` — an S-curve that jumps near
+``(1/b)^(1/r)``, which is placed just below the threshold.  Each candidate
+is then checked against its estimated J, and groups are the connected
+components of the surviving pairs (single linkage).  Hashing, banding and
+the component search are all linear in the number of sentences.
+
+Everything is deterministic for a given ``random_state``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.preprocess import TokenizedSentences
+
+# hash functions are multiply-add-shift, h(x) = ((a·x + b) mod 2⁶⁴) >> 32,
+# over 32-bit shingle hashes x — 2-universal, and no slow uint64 modulo
+_SHIFT = np.uint64(32)
+# odd 64-bit multiplier: combines ids into keys, and its high bits spread
+# a key over 32 bits (Fibonacci hashing)
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+class DuplicateGroups(NamedTuple):
+    """Output of ``find_near_duplicates``."""
+
+    representatives: np.ndarray  # (n_groups,) first sentence of each group, ascending
+    weights: np.ndarray          # (n_groups,) sentences in each group
+    labels: np.ndarray           # (n_sentences,) group of every sentence
+
+    @property
+    def n_collapsed(self) -> int:
+        """Sentences folded into an earlier one (``n_sentences − n_groups``)."""
+        return len(self.labels) - len(self.representatives)
+
+
+# ── Signatures ─────────────────────────────────────────────────────
+
+def minhash_signatures(
+    tokens: TokenizedSentences,
+    n_perm: int = 128,
+    shingle_size: int = 2,
+    random_state: int = 42,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    MinHash signature of every sentence's shingle set.
+
+    Sentences shorter than *shingle_size* tokens form a single shingle of
+    all their tokens; sentences with no tokens have no signature.
+
+    Parameters
+    ----------
+    tokens       : the document's ``TokenizedSentences``
+    n_perm       : hash functions (signature length)
+    shingle_size : tokens per shingle
+    random_state : seed for the hash functions
+
+    Returns
+    -------
+    signatures : uint32 array, shape (n_signed, n_perm)
+    signed     : int64 array, shape (n_signed,) — the sentence of each row
+    """
+    rows, keys = _shingles(tokens, shingle_size)
+    n = len(tokens)
+    counts = np.bincount(rows, minlength=n)
+    signed = np.flatnonzero(counts)
+    if not len(signed):
+        return np.empty((0, n_perm), dtype=np.uint32), signed
+
+    x = (keys * _MIX) >> _SHIFT
+    starts = np.concatenate(([0], np.cumsum(counts[signed])[:-1]))
+
+    rng = np.random.default_rng(random_state)
+    a = rng.integers(0, 1 << 63, size=n_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    b = rng.integers(0, 1 << 63, size=n_perm, dtype=np.uint64)
+
+    signatures = np.empty((len(signed), n_perm), dtype=np.uint32)
+    # a block of hash functions at a time bounds the (shingles × block) scratch
+    block = max(1, min(n_perm, (32 << 20) // (8 * len(x))))
+    for lo in range(0, n_perm, block):
+        hashed = (x[:, None] * a[lo:lo + block] + b[lo:lo + block]) >> _SHIFT
+        signatures[:, lo:lo + block] = np.minimum.reduceat(hashed, starts, axis=0)
+    return signatures, signed
+
+
+def _shingles(tokens: TokenizedSentences, shingle_size: int) -> tuple[np.ndarray, np.ndarray]:
+    """(sentence, 64-bit key) of every shingle, in sentence order."""
+    if shingle_size < 1:
+        raise ValueError(f"shingle_size must be >= 1, got {shingle_size}")
+    lengths = tokens.lengths
+    row_of = np.repeat(np.arange(len(tokens)), lengths)
+    end_of = tokens.indptr[1:][row_of]
+    pos = np.arange(len(tokens.ids))
+
+    # a shingle starts wherever a full window fits, or at the first token
+    # of a sentence too short for one
+    starts = (pos + shingle_size <= end_of) | (
+        (pos == tokens.indptr[:-1][row_of]) & (lengths[row_of] < shingle_size)
+    )
+    pos = pos[starts]
+    keys = np.zeros(len(pos), dtype=np.uint64)
+    ids = tokens.ids.astype(np.uint64) + np.uint64(1)  # 0 marks "past the end"
+    for j in range(shingle_size):
+        inside = pos + j < end_of[pos]
+        step = np.where(inside, ids[np.minimum(pos + j, len(ids) - 1)], np.uint64(0))
+        keys = keys * _MIX + step
+    return row_of[pos], keys
+
+
+# ── Grouping ───────────────────────────────────────────────────────
+
+def band_shape(threshold: float, n_perm: int) -> tuple[int, int]:
+    """
+    ``(bands, rows)`` whose S-curve midpoint ``(1/b)^(1/r)`` is the
+    closest one not above *threshold* — recall over precision, since
+    candidates are verified afterwards.
+    """
+    best = (n_perm, 1)
+    for rows in range(1, n_perm + 1):
+        bands = n_perm // rows
+        midpoint = (1.0 / bands) ** (1.0 / rows)
+        if midpoint <= threshold:
+            best = (bands, rows)
+    return best
+
+
+def find_near_duplicates(
+    tokens: TokenizedSentences,
+    threshold: float = 0.8,
+    n_perm: int = 128,
+    shingle_size: int = 2,
+    random_state: int = 42,
+) -> DuplicateGroups:
+    """
+    Group sentences whose shingle sets have Jaccard similarity ≥ *threshold*.
+
+    Parameters
+    ----------
+    tokens       : the document's ``TokenizedSentences``
+    threshold    : estimated Jaccard similarity at or above which two
+                   sentences are near-duplicates (0 < threshold ≤ 1)
+    n_perm       : MinHash signature length — longer is more accurate
+    shingle_size : tokens per shingle; 1 compares bags of words
+    random_state : seed for the hash functions
+
+    Returns
+    -------
+    DuplicateGroups(representatives, weights, labels)
+        Groups are numbered in document order and represented by their
+        first sentence; sentences without tokens stay on their own.
+    """
+    import scipy.sparse as sp
+    from scipy.sparse.csgraph import connected_components
+
+    if not 0.0 < threshold <= 1.0:
+        raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+    n = len(tokens)
+    signatures, signed = minhash_signatures(tokens, n_perm, shingle_size, random_state)
+    bands, rows = band_shape(threshold, n_perm)
+
+    pairs = []
+    for band in range(bands):
+        keys = np.zeros(len(signed), dtype=np.uint64)
+        for column in signatures[:, band * rows:(band + 1) * rows].T:
+            keys = keys * _MIX + column
+        order = np.argsort(keys, kind="stable")
+        head = np.flatnonzero(np.r_[True, keys[order][1:] != keys[order][:-1]])
+        bucket_head = order[np.repeat(head, np.diff(np.r_[head, len(order)]))]
+        member = order != bucket_head
+        if not member.any():
+            continue
+        # verify each candidate against the first sentence of its bucket
+        a, b = order[member], bucket_head[member]
+        agree = (signatures[a] == signatures[b]).mean(axis=1)
+        keep = agree >= threshold
+        pairs.append(np.stack([signed[a[keep]], signed[b[keep]]]))
+
+    edges = np.concatenate(pairs, axis=1) if pairs else np.empty((2, 0), dtype=np.int64)
+    graph = sp.csr_matrix(
+        (np.ones(edges.shape[1], dtype=np.int8), (edges[0], edges[1])), shape=(n, n)
+    )
+    _, components = connected_components(graph, directed=False)
+
+    # renumber groups by their first sentence so labels follow the document
+    _, first = np.unique(components, return_index=True)
+    order = np.argsort(first)
+    rank = np.empty(len(first), dtype=np.int64)
+    rank[order] = np.arange(len(first))
+    labels = rank[components]
+    return DuplicateGroups(first[order], np.bincount(labels), labels)
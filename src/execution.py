@@ -0,0 +1,206 @@
+"""
+Execution policy for the native-code stages.
+
+K-Means, SVD and the similarity products spend their time in OpenMP and
+BLAS thread pools that size themselves to every core on the machine.  One
+process doing that is fine; eight worker processes each doing it
+oversubscribe the cores and throughput collapses.  An ``ExecutionPolicy``
+says how much parallelism to use instead:
+
+  threads          native threads each clustering / similarity call may
+                   use (``None`` leaves the libraries' defaults alone)
+  restart_workers  K-Means restarts run concurrently on this many threads
+  process_threads  cap applied to every native pool in the process, for
+                   worker processes (see ``set_policy``)
+
+Setting it
+----------
+- per process:  ``set_policy(policy)`` — worker initializers do this,
+  with ``ExecutionPolicy.for_workers(n)`` as the default for a pool of n.
+- per call:     ``summarize(text, policy=...)``, or ``with use_policy(...)``
+  around any pipeline code.
+
+Determinism
+-----------
+Restart seeds are drawn up front, in order, from the one seeded
+generator the serial loop would use, and the best restart is chosen in
+restart order.  A given ``random_state`` therefore gives the same labels
+however many restarts run at once.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import functools
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# environment variables read by native thread pools when they first load
+_THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+class ExecutionPolicy(NamedTuple):
+    """How much native and restart parallelism the pipeline may use."""
+
+    threads: int | None = None
+    restart_workers: int = 1
+    process_threads: int | None = None
+
+    @classmethod
+    def for_workers(
+        cls,
+        workers: int,
+        restart_workers: int = 1,
+        threads: int | None = None,
+        cores: int | None = None,
+    ) -> ExecutionPolicy:
+        """
+        Policy for one of *workers* processes sharing *cores*.
+
+        Unless *threads* is given, every concurrent restart in every
+        process gets an equal share of the cores; the process cap is that
+        share times *restart_workers*.
+        """
+        cores = cores or os.cpu_count() or 1
+        restart_workers = max(1, restart_workers)
+        if threads is None:
+            threads = max(1, cores // (max(1, workers) * restart_workers))
+        return cls(threads, restart_workers, threads * restart_workers)
+
+
+_PROCESS_POLICY = ExecutionPolicy()
+_CALL_POLICY: contextvars.ContextVar[ExecutionPolicy | None] = contextvars.ContextVar(
+    "execution_policy", default=None
+)
+_ACTIVE_LIMIT: contextvars.ContextVar[int | None] = contextvars.ContextVar(
+    "native_thread_limit", default=None
+)
+_PROCESS_LIMITS = None  # threadpoolctl handle keeping the process-wide cap alive
+
+
+# ── Setting the policy ─────────────────────────────────────────────
+
+def get_policy() -> ExecutionPolicy:
+    """The policy in effect here: a ``use_policy`` override, else the process one."""
+    policy = _CALL_POLICY.get()
+    return _PROCESS_POLICY if policy is None else policy
+
+
+def set_policy(policy: ExecutionPolicy) -> None:
+    """
+    Make *policy* the process default and apply its ``process_threads`` cap.
+
+    The cap is written to the thread-count environment variables, which
+    libraries not yet loaded (and child processes) read at start-up, and
+    applied through threadpoolctl to those already loaded.
+    """
+    global _PROCESS_POLICY, _PROCESS_LIMITS
+    _validate(policy)
+    _PROCESS_POLICY = policy
+    if policy.process_threads is not None:
+        for name in _THREAD_ENV_VARS:
+            os.environ[name] = str(policy.process_threads)
+        from threadpoolctl import threadpool_limits
+
+        _PROCESS_LIMITS = threadpool_limits(limits=policy.process_threads)
+
+
+@contextlib.contextmanager
+def use_policy(policy: ExecutionPolicy | None):
+    """Use *policy* for the calls inside the block (``None`` changes nothing)."""
+    if policy is None:
+        yield get_policy()
+        return
+    _validate(policy)
+    token = _CALL_POLICY.set(policy)
+    try:
+        yield policy
+    finally:
+        _CALL_POLICY.reset(token)
+
+
+def _validate(policy: ExecutionPolicy) -> None:
+    for name in ("threads", "process_threads"):
+        value = getattr(policy, name)
+        if value is not None and value < 1:
+            raise ValueError(f"{name} must be >= 1 or None, got {value}")
+    if policy.restart_workers < 1:
+        raise ValueError(f"restart_workers must be >= 1, got {policy.restart_workers}")
+
+
+# ── Applying it ────────────────────────────────────────────────────
+
+@contextlib.contextmanager
+def native_threads(threads: int | None = None):
+    """
+    Cap OpenMP / BLAS pools at *threads* (default: the policy's) inside the block.
+
+    A no-op when the cap is ``None`` or already in force, so nested
+    pipeline calls pay for threadpoolctl once.
+    """
+    if threads is None:
+        threads = get_policy().threads
+    if threads is None or _ACTIVE_LIMIT.get() == threads:
+        yield
+        return
+    from threadpoolctl import threadpool_limits
+
+    token = _ACTIVE_LIMIT.set(threads)
+    try:
+        with threadpool_limits(limits=threads):
+            yield
+    finally:
+        _ACTIVE_LIMIT.reset(token)
+
+
+def bounded_threads(func: Callable[..., R]) -> Callable[..., R]:
+    """Decorator: run *func* under ``native_threads()``."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with native_threads():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def map_restarts(func: Callable[[T], R], items: Iterable[T]) -> list[R]:
+    """
+    ``[func(item) for item in items]``, on the policy's restart pool.
+
+    Results come back in input order whatever finishes first.  Each
+    restart gets ``threads`` native threads, or an even share of the
+    cores when the policy leaves that open.
+    """
+    items = list(items)
+    policy = get_policy()
+    workers = min(policy.restart_workers, len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+
+    threads = policy.threads or max(1, (os.cpu_count() or 1) // workers)
+
+    def run(item: T) -> R:
+        # OpenMP limits are per thread, so each pool thread sets its own
+        # (the copied context already marks the cap as in force)
+        from threadpoolctl import threadpool_limits
+
+        with threadpool_limits(limits=threads):
+            return func(item)
+
+    with native_threads(threads), ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(contextvars.copy_context().run, run, item) for item in items]
+        return [future.result() for future in futures]
@@ -18,39 +18,274 @@ For a term *t* in sentence (document) *d* within a corpus *D* of *N* docs:
 Scikit-learn's TfidfVectorizer applies L2 row-normalisation by default so
 each sentence vector has unit length.  This lets us use the dot product
 directly as cosine similarity later on.
+
+Every function here keeps the dtype it is given: build the matrix with
+``dtype=np.float32`` and the scores, reduced features and similarity
+graph stay float32 too, at half the memory of float64.
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity as _cosine_similarity
+
+from src.execution import bounded_threads
+
+# scikit-learn is imported on first use — it dominates cold-start time.
+if TYPE_CHECKING:
+    from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+    from sklearn.pipeline import Pipeline
+
+    from src.idf_store import IDFStore
+    from src.preprocess import TokenizedSentences
 
 
 def build_tfidf_matrix(
     sentences: list[str],
-) -> tuple[np.ndarray, TfidfVectorizer]:
+    n_features: int | None = None,
+    idf_model: IDFStore | None = None,
+    dtype=np.float64,
+    tokens: TokenizedSentences | None = None,
+) -> tuple[np.ndarray, TfidfVectorizer | Pipeline | CountVectorizer | TokenizedSentences]:
     """
     Build a TF-IDF matrix from a list of sentence strings.
 
     Parameters
     ----------
-    sentences : list[str]
+    sentences  : list[str]
         Raw sentence strings (stop-word removal is handled internally).
+    n_features : int, optional
+        If given, hash terms into this many columns instead of building a
+        vocabulary (see ``build_hashed_tfidf_matrix``).
+    idf_model  : IDFStore, optional
+        Weight terms by corpus-level IDF from this store instead of
+        fitting IDF on *sentences* (see ``src.idf_store``).
+    dtype      : np.float64 or np.float32
+        Value type of the matrix; float32 halves its memory.
+    tokens     : TokenizedSentences, optional
+        *sentences* already tokenized by ``tokenize_sentences``; the
+        count matrix is then built from its id arrays instead of
+        tokenizing the strings again.  Same matrix either way.  Ignored
+        in hashing mode.
 
     Returns
     -------
     tfidf_matrix : sparse CSR matrix, shape (n_sentences, n_features)
-    vectorizer   : fitted TfidfVectorizer (useful for inspection / vocab)
+    vectorizer   : fitted TfidfVectorizer (useful for inspection / vocab),
+                   the hashing pipeline when *n_features* is set, the
+                   local CountVectorizer when *idf_model* is set, or
+                   *tokens* when given
     """
+    dtype = np.dtype(dtype)  # scikit-learn only recognises dtype objects, not names
+    if idf_model is not None:
+        return idf_model.transform(sentences, dtype=dtype, tokens=tokens)
+    if n_features is not None:
+        return build_hashed_tfidf_matrix(sentences, n_features, dtype=dtype)
+    if tokens is not None:
+        return _tfidf_from_tokens(tokens, dtype), tokens
+
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
     vectorizer = TfidfVectorizer(
         stop_words="english",
         max_df=0.95,        # ignore terms appearing in >95 % of sentences
         min_df=1,           # keep singletons — sentences are short
         sublinear_tf=True,  # apply 1 + log(tf) dampening
+        dtype=dtype,
     )
     tfidf_matrix = vectorizer.fit_transform(sentences)
     return tfidf_matrix, vectorizer
 
 
+def _tfidf_from_tokens(tokens: TokenizedSentences, dtype: np.dtype):
+    """``TfidfVectorizer`` with the settings above, minus the tokenizing."""
+    import scipy.sparse as sp
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+    from sklearn.preprocessing import normalize
+
+    counts, _terms = tokens.count_matrix(ENGLISH_STOP_WORDS)
+    if counts.shape[1] == 0:
+        raise ValueError("empty vocabulary; perhaps the documents only contain stop words")
+
+    n = counts.shape[0]
+    counts, _kept = drop_frequent_terms(counts)
+    df = np.bincount(counts.indices, minlength=counts.shape[1])
+
+    # same operation order as TfidfTransformer, so results are identical
+    # (not .astype, which would also sort each row's indices)
+    tfidf_matrix = sp.csr_matrix(
+        (counts.data.astype(dtype), counts.indices, counts.indptr), shape=counts.shape
+    )
+    idf = np.full(len(df), n + 1, dtype=dtype)
+    idf /= df.astype(dtype) + 1.0
+    np.log(idf, out=idf)
+    idf += 1.0
+    np.log(tfidf_matrix.data, out=tfidf_matrix.data)  # sublinear_tf
+    tfidf_matrix.data += 1.0
+    tfidf_matrix.data *= idf[tfidf_matrix.indices]
+    return normalize(tfidf_matrix, norm="l2", copy=False)
+
+
+def drop_frequent_terms(counts, max_df: float = 0.95):
+    """
+    Remove the columns of terms that occur in more than *max_df* of the rows.
+
+    The pruning ``TfidfVectorizer(max_df=...)`` applies, for count
+    matrices built elsewhere (``IDFStore.transform``, pre-tokenized
+    input).  Entries keep their order within each row.
+
+    Returns
+    -------
+    counts : CSR matrix without the frequent columns
+    kept   : bool array, shape (n_columns,) — which input columns survive
+    """
+    import scipy.sparse as sp
+
+    n = counts.shape[0]
+    df = np.bincount(counts.indices, minlength=counts.shape[1])
+    kept = df <= max_df * n
+    if not kept.any():
+        raise ValueError("After pruning, no terms remain. Try a lower min_df or a higher max_df.")
+    if not kept.all():
+        keep = kept[counts.indices]
+        column = np.cumsum(kept) - 1
+        row_of = np.repeat(np.arange(n), np.diff(counts.indptr))[keep]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row_of, minlength=n), out=indptr[1:])
+        counts = sp.csr_matrix(
+            (counts.data[keep], column[counts.indices[keep]], indptr),
+            shape=(n, int(kept.sum())),
+        )
+    return counts, kept
+
+
+def build_hashed_tfidf_matrix(
+    sentences: list[str],
+    n_features: int = 2**18,
+    dtype=np.float64,
+) -> tuple[np.ndarray, Pipeline]:
+    """
+    TF-IDF over hashed term buckets — memory independent of vocabulary.
+
+    ``TfidfVectorizer`` keeps a Python dict entry for every distinct term,
+    which on noisy text (logs, scraped pages, identifiers) can outgrow
+    the matrix itself.  Here each term is hashed straight to one of
+    *n_features* columns, so no vocabulary is stored; IDF is then computed
+    per column.  Terms that collide share a column (and an IDF), which
+    blurs similarities slightly — fewer buckets, more blur.
+
+    Same settings as ``build_tfidf_matrix`` otherwise: English stop words,
+    columns in more than 95 % of sentences dropped, sublinear TF, smooth
+    IDF and L2-normalised rows.
+
+    Parameters
+    ----------
+    sentences  : list[str]
+    n_features : number of hash buckets (columns)
+    dtype      : value type of the matrix (np.float64 or np.float32)
+
+    Returns
+    -------
+    tfidf_matrix : sparse CSR matrix, shape (n_sentences, n_features)
+    pipeline     : fitted ``HashingVectorizer → TfidfTransformer`` pipeline
+    """
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+    from sklearn.pipeline import make_pipeline
+
+    dtype = np.dtype(dtype)
+    hasher = HashingVectorizer(
+        n_features=n_features,
+        stop_words="english",
+        alternate_sign=False,  # keep counts non-negative so IDF makes sense
+        norm=None,             # normalise after weighting, not before
+        dtype=dtype,
+    )
+    counts = hasher.transform(sentences)
+
+    # max_df=0.95 — drop buckets present in nearly every sentence
+    df = np.bincount(counts.indices, minlength=n_features)
+    frequent = df > 0.95 * counts.shape[0]
+    if frequent.any():
+        counts = counts.multiply((~frequent).astype(counts.dtype)).tocsr()
+        counts.eliminate_zeros()
+
+    transformer = TfidfTransformer(sublinear_tf=True)
+    tfidf_matrix = transformer.fit_transform(counts)
+    return tfidf_matrix, make_pipeline(hasher, transformer)
+
+
+REDUCTION_METHODS = ("svd", "projection")
+
+
+@bounded_threads
+def reduce_dimensions(
+    tfidf_matrix,
+    n_components: int = 128,
+    method: str = "svd",
+    random_state: int = 42,
+) -> np.ndarray:
+    """
+    Project TF-IDF rows onto *n_components* dense dimensions for clustering.
+
+    Technical documents can carry tens of thousands of vocabulary
+    columns, and every K-Means distance pays for that width.  Projecting
+    once up front lets clustering run on a compact dense matrix instead.
+
+    Methods
+    -------
+    svd         Randomized truncated SVD (LSA).  Keeps the directions of
+                greatest variance, so a few hundred components preserve
+                the topical structure well; costs a few passes over X.
+    projection  Sparse random projection.  One sparse product, no
+                fitting; distances are preserved only approximately
+                (Johnson–Lindenstrauss), so it needs more components
+                than SVD for the same clustering quality.
+
+    Rows are L2-normalised again after projection so dot products stay
+    cosine similarities.  If the matrix is already no wider than
+    *n_components* (or has too few rows to support that many), the
+    component count is capped at what the matrix can hold.
+
+    Parameters
+    ----------
+    tfidf_matrix : sparse matrix, shape (n_sentences, n_features)
+    n_components : target dimensionality
+    method       : "svd" or "projection"
+    random_state : seed for the randomized solver / projection
+
+    Returns
+    -------
+    reduced : ndarray, shape (n_sentences, n_components)
+    """
+    from sklearn.preprocessing import normalize
+
+    if method not in REDUCTION_METHODS:
+        raise ValueError(f"unknown reduction method {method!r}; expected one of {REDUCTION_METHODS}")
+    if n_components < 1:
+        raise ValueError(f"n_components must be >= 1, got {n_components}")
+
+    n_rows, n_cols = tfidf_matrix.shape
+    if method == "svd":
+        from sklearn.decomposition import TruncatedSVD
+
+        # the randomized solver needs strictly fewer components than either side
+        n_components = max(1, min(n_components, n_rows - 1, n_cols - 1))
+        reducer = TruncatedSVD(
+            n_components=n_components, algorithm="randomized", random_state=random_state
+        )
+    else:
+        from sklearn.random_projection import SparseRandomProjection
+
+        n_components = min(n_components, n_cols)
+        reducer = SparseRandomProjection(
+            n_components=n_components, dense_output=True, random_state=random_state
+        )
+
+    reduced = np.asarray(reducer.fit_transform(tfidf_matrix))
+    return normalize(reduced, norm="l2", copy=False)
+
+
 def get_sentence_scores(tfidf_matrix) -> np.ndarray:
     """
     Score each sentence by the mean TF-IDF value across its terms.
@@ -71,6 +306,7 @@ def get_sentence_scores(tfidf_matrix) -> np.ndarray:
     return scores
 
 
+@bounded_threads
 def compute_similarity_matrix(tfidf_matrix) -> np.ndarray:
     """
     Compute pairwise cosine similarity between all sentence vectors.
@@ -84,5 +320,103 @@ def compute_similarity_matrix(tfidf_matrix) -> np.ndarray:
     -------
     sim_matrix : ndarray, shape (n_sentences, n_sentences)
         Values in [0, 1] — 1 means identical direction.
+
+    Memory is O(n²); for more than a few thousand sentences use
+    ``topk_similarity_graph`` instead.
+    """
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    return cosine_similarity(tfidf_matrix)
+
+
+@bounded_threads
+def topk_similarity_graph(
+    tfidf_matrix,
+    k: int | None = 10,
+    threshold: float | None = None,
+    memory_budget_mb: float = 256.0,
+    block_size: int | None = None,
+    workers: int = 1,
+):
     """
-    return _cosine_similarity(tfidf_matrix)
\ No newline at end of file
+    Sparse cosine-similarity graph that keeps only the strongest edges.
+
+    ``compute_similarity_matrix`` materialises all n² similarities — at
+    50k sentences that is 20 GB of float64.  Here rows are processed in
+    blocks: each block's similarities to every sentence are computed,
+    pruned to the *k* largest per row and/or those ``>= threshold``, and
+    only the survivors are kept.  Self-similarities are dropped.
+
+    Block height follows *memory_budget_mb* (the dense block, the sparse
+    product that feeds it and the full-width pruning temporaries), so
+    peak memory is bounded no matter how many sentences there are.  With ``workers > 1`` blocks are
+    computed on a thread pool; output is identical either way.
+
+    Parameters
+    ----------
+    tfidf_matrix     : sparse matrix, shape (n_sentences, n_features),
+                       L2-normalised rows
+    k                : neighbours kept per sentence (None = no cap)
+    threshold        : minimum similarity kept (None = no floor)
+    memory_budget_mb : working memory allowed per block
+    block_size       : explicit rows per block (overrides the budget)
+    workers          : threads used to process blocks
+
+    Returns
+    -------
+    graph : sparse CSR matrix, shape (n_sentences, n_sentences)
+        ``graph[i, j]`` is the similarity of sentence *j* to sentence *i*
+        if *j* is among *i*'s retained neighbours, else 0.  Not
+        necessarily symmetric.
+    """
+    import scipy.sparse as sp
+
+    if k is None and threshold is None:
+        raise ValueError("give at least one of k or threshold")
+
+    X = sp.csr_matrix(tfidf_matrix)
+    n = X.shape[0]
+    dtype = X.dtype if np.issubdtype(X.dtype, np.floating) else np.float64
+    if block_size is None:
+        # per entry: dense block (itemsize) + worst-case sparse product
+        # (value + index) + the pruning temporaries, which are as wide as
+        # the block — argpartition's int64 indices for top-k, else the
+        # boolean keep-mask
+        pruning = 8 if k is not None and k < n - 1 else 1
+        bytes_per_row = max(1, n) * (2 * np.dtype(dtype).itemsize + 4 + pruning)
+        block_size = int(memory_budget_mb * 2**20 // bytes_per_row)
+    block_size = max(1, min(block_size, n))
+    XT = X.T.tocsc()
+
+    def _block(start: int):
+        stop = min(start + block_size, n)
+        S = (X[start:stop] @ XT).toarray().astype(dtype, copy=False)
+        rows = np.arange(stop - start)
+        S[rows, start + rows] = 0.0  # drop self-loops
+
+        if k is not None and k < n - 1:
+            cols = np.argpartition(S, -k, axis=1)[:, -k:]
+            vals = np.take_along_axis(S, cols, axis=1)
+        else:
+            cols = np.broadcast_to(np.arange(n), S.shape)
+            vals = S
+        keep = vals > 0 if threshold is None else vals >= threshold
+        keep &= vals != 0
+        r = np.broadcast_to(rows[:, None] + start, cols.shape)[keep]
+        return r, cols[keep], vals[keep]
+
+    starts = range(0, n, block_size)
+    if workers > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_block, starts))
+    else:
+        parts = [_block(s) for s in starts]
+
+    if parts:
+        rows, cols, vals = (np.concatenate(p) for p in zip(*parts))
+    else:
+        rows = cols = np.empty(0, dtype=np.int64)
+        vals = np.empty(0, dtype=dtype)
+    return sp.csr_matrix((vals, (rows, cols)), shape=(n, n), dtype=dtype)
@@ -0,0 +1,237 @@
+"""
+Corpus-level IDF store.
+
+``build_tfidf_matrix`` normally learns IDF from the sentences of the one
+document being summarised.  For a short input that is a handful of
+sentences — every term looks rare, and the weights are mostly noise —
+and the statistics are thrown away after every call.
+
+``IDFStore`` keeps document frequencies for a large background corpus
+instead.  Fit it once, save it, and pass it to ``build_tfidf_matrix``
+(or ``summarize(idf_model=...)``); new documents can be folded in later
+with ``partial_fit``.
+
+On-disk format
+--------------
+A directory with three files:
+
+    df.npy      int64 document frequency per term (memory-mapped on load)
+    terms.txt   one term per line, UTF-8 — line i is column i of df.npy
+    meta.json   {"format": 1, "n_docs": ..., "n_terms": ...}
+
+Terms are only ever appended, so a term's column never changes.
+
+Example
+-------
+>>> store = IDFStore().partial_fit(background_documents)
+>>> store.save("models/idf")
+>>> store = IDFStore.load("models/idf")
+>>> summarize(text, idf_model=store)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import os
+from collections.abc import Iterable
+
+import numpy as np
+
+FORMAT_VERSION = 1
+
+
+class IDFStore:
+    """
+    Document frequencies for a background corpus.
+
+    Tokenisation matches ``build_tfidf_matrix`` (lower-cased, default
+    scikit-learn token pattern, English stop words removed).  Each item
+    passed to ``partial_fit`` counts as one document.
+    """
+
+    def __init__(self) -> None:
+        self.n_docs = 0
+        self._terms: list[str] = []
+        self._index: dict[str, int] | None = {}
+        self._df = np.zeros(0, dtype=np.int64)
+        self._n_terms = 0
+        self._fingerprint: str | None = None
+
+    def __len__(self) -> int:
+        return self._n_terms
+
+    # ── Fitting ────────────────────────────────────────────────────
+
+    def partial_fit(self, documents: Iterable[str], batch_size: int = 1000) -> IDFStore:
+        """
+        Add *documents* to the document-frequency counts.
+
+        *documents* may be a lazy iterable; it is consumed in batches of
+        *batch_size*.  Returns ``self`` so calls can be chained.
+        """
+        from sklearn.feature_extraction.text import CountVectorizer
+
+        index = self._vocabulary()
+        documents = iter(documents)
+        for batch in iter(lambda: list(itertools.islice(documents, batch_size)), []):
+            vectorizer = CountVectorizer(stop_words="english", binary=True)
+            try:
+                presence = vectorizer.fit_transform(batch)
+            except ValueError:  # nothing but stop words in this batch
+                self.n_docs += len(batch)
+                continue
+
+            batch_df = np.bincount(presence.indices, minlength=presence.shape[1])
+            columns = np.empty(len(batch_df), dtype=np.int64)
+            for term, local in vectorizer.vocabulary_.items():
+                column = index.get(term)
+                if column is None:
+                    column = index[term] = len(self._terms)
+                    self._terms.append(term)
+                columns[local] = column
+
+            self._grow(len(self._terms))
+            np.add.at(self._df, columns, batch_df)
+            self.n_docs += len(batch)
+
+        self._fingerprint = None
+        return self
+
+    def _grow(self, n_terms: int) -> None:
+        """Make room for *n_terms* columns (amortised doubling, copy-on-write)."""
+        if n_terms > len(self._df) or not self._df.flags.writeable:
+            capacity = max(n_terms, 2 * len(self._df), 1024)
+            df = np.zeros(capacity, dtype=np.int64)
+            df[:self._n_terms] = self._df[:self._n_terms]
+            self._df = df
+        self._n_terms = n_terms
+
+    # ── Lookup ─────────────────────────────────────────────────────
+
+    def _vocabulary(self) -> dict[str, int]:
+        if self._index is None:  # built lazily after load()
+            self._index = {term: i for i, term in enumerate(self._terms)}
+        return self._index
+
+    def document_frequency(self, terms: Iterable[str]) -> np.ndarray:
+        """Document frequency of each of *terms* (0 for unseen terms)."""
+        index = self._vocabulary()
+        columns = np.fromiter((index.get(t, -1) for t in terms), dtype=np.int64)
+        df = np.zeros(len(columns), dtype=np.int64)
+        known = columns >= 0
+        df[known] = self._df[columns[known]]
+        return df
+
+    def idf(self, terms: Iterable[str]) -> np.ndarray:
+        """
+        Smoothed IDF of each of *terms*: ``log((1 + N) / (1 + df)) + 1``.
+
+        Unseen terms get the largest weight, as if they occurred in no
+        document.
+        """
+        df = self.document_frequency(terms)
+        return np.log((1.0 + self.n_docs) / (1.0 + df)) + 1.0
+
+    def fingerprint(self) -> str:
+        """Content hash of the statistics — changes whenever they do."""
+        if self._fingerprint is None:
+            h = hashlib.sha256(f"{self.n_docs}:{self._n_terms}".encode())
+            h.update(np.ascontiguousarray(self._df[:self._n_terms]).tobytes())
+            self._fingerprint = h.hexdigest()
+        return self._fingerprint
+
+    # ── Vectorising ────────────────────────────────────────────────
+
+    def transform(self, sentences: list[str], dtype=np.float64, tokens=None):
+        """
+        TF-IDF matrix for *sentences* weighted by the corpus IDF.
+
+        Columns are the sentences' own vocabulary (as with
+        ``build_tfidf_matrix``), minus terms in more than 95 % of the
+        sentences (``max_df=0.95``, judged within the document); only the
+        IDF comes from the store.  Sublinear TF and L2 row normalisation
+        are applied as usual, and values are stored as *dtype*.  Pass *tokens* (from
+        ``tokenize_sentences``) to count terms without re-tokenizing.
+
+        Returns
+        -------
+        tfidf_matrix : sparse CSR matrix, shape (n_sentences, n_local_terms)
+        vectorizer   : the fitted CountVectorizer (local vocabulary), or
+                       *tokens* when given
+        """
+        from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS, CountVectorizer
+        from sklearn.preprocessing import normalize
+
+        from src.feature_extraction import drop_frequent_terms
+
+        if tokens is not None:
+            counts, terms = tokens.count_matrix(ENGLISH_STOP_WORDS)
+            if counts.shape[1] == 0:
+                raise ValueError("empty vocabulary; perhaps the documents only contain stop words")
+            vectorizer = tokens
+        else:
+            vectorizer = CountVectorizer(stop_words="english")
+            counts = vectorizer.fit_transform(sentences)
+            terms = vectorizer.get_feature_names_out()
+        counts, kept = drop_frequent_terms(counts)  # max_df=0.95
+        terms = np.asarray(terms, dtype=object)[kept]
+        counts = counts.astype(dtype)
+
+        counts.data = 1.0 + np.log(counts.data)  # sublinear_tf
+        idf = self.idf(terms)
+        counts.data *= idf[counts.indices]
+        return normalize(counts, norm="l2", copy=False), vectorizer
+
+    # ── Persistence ────────────────────────────────────────────────
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Write the store to directory *path* (created if missing)."""
+        os.makedirs(path, exist_ok=True)
+        meta = {"format": FORMAT_VERSION, "n_docs": self.n_docs, "n_terms": self._n_terms}
+
+        # each file is replaced atomically and meta.json goes last; load()
+        # checks the sizes agree, so an interrupted save is detected
+        _replace(os.path.join(path, "df.npy"),
+                 lambda fh: np.save(fh, self._df[:self._n_terms]))
+        _replace(os.path.join(path, "terms.txt"),
+                 lambda fh: fh.write("".join(t + "\n" for t in self._terms).encode("utf-8")))
+        _replace(os.path.join(path, "meta.json"),
+                 lambda fh: fh.write(json.dumps(meta).encode("utf-8")))
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, mmap: bool = True) -> IDFStore:
+        """
+        Read a store written by ``save``.
+
+        With *mmap* the frequency array is memory-mapped read-only, so
+        loading is near-instant and pages are shared between processes;
+        it is copied the first time ``partial_fit`` adds to it.
+        """
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as fh:
+            meta = json.load(fh)
+        if meta.get("format") != FORMAT_VERSION:
+            raise ValueError(f"unsupported IDF store format: {meta.get('format')!r}")
+
+        with open(os.path.join(path, "terms.txt"), encoding="utf-8") as fh:
+            terms = fh.read().split("\n")[:-1]
+        df = np.load(os.path.join(path, "df.npy"), mmap_mode="r" if mmap else None)
+        if not (len(terms) == len(df) == meta["n_terms"]):
+            raise ValueError(f"IDF store at {path!r} is inconsistent")
+
+        store = cls()
+        store.n_docs = int(meta["n_docs"])
+        store._terms = terms
+        store._index = None
+        store._df = df
+        store._n_terms = len(terms)
+        return store
+
+
+def _replace(path: str, write) -> None:
+    """Write a file via a temporary sibling and an atomic rename."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as fh:
+        write(fh)
+    os.replace(tmp, path)
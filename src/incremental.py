@@ -0,0 +1,332 @@
+"""
+Incremental re-summarization for edited documents.
+
+An editor tweaks one paragraph and asks for the summary again.
+``summarize()`` would re-segment, re-vectorise and re-cluster the whole
+document; ``IncrementalSummarizer`` keeps the previous run's state and
+only redoes the work the edit touched:
+
+  - **segmentation** — the text is split on blank lines and each
+    paragraph's sentences are cached, so only edited paragraphs are
+    cleaned and re-segmented;
+  - **tokenisation** — per-sentence term counts are cached by sentence
+    text, so only new sentences are tokenised;
+  - **document frequencies** — the new sentence list is diffed against
+    the old one and df is decremented/incremented for the removed and
+    added sentences only;
+  - **clustering** — the previous centroids are kept.  New sentences are
+    assigned to their nearest centroid, clusters that lost or gained
+    members get their centroids recomputed and their members reassigned,
+    and k grows or shrinks with the sentence count by seeding from new
+    sentences or retiring the smallest clusters.  A cluster left empty is
+    re-seeded with the sentences furthest from their centre, so the
+    summary keeps k sentences.  That costs O(edited sentences × k)
+    instead of a full Lloyd run.
+
+The weighted TF-IDF matrix itself is *not* incremental: every update
+reassembles it from the cached term counts, an O(non-zeros) pass over
+the whole document with no re-tokenising.  IDF depends on the sentence
+count and on df, so any edit reweights every row, and only a full pass
+gives the exact weights ``build_tfidf_matrix`` would.
+
+Local updates drift slowly as IDF shifts under unchanged sentences, so
+once the edits since the last full fit exceed *refit_fraction* of the
+document, the next update runs spherical K-Means over everything,
+warm-started from the current centroids.
+
+Weighting matches ``build_tfidf_matrix`` (English stop words, terms in
+more than 95 % of sentences dropped, sublinear TF, smooth IDF, L2 rows),
+and selection is ``select_representative_sentences`` as usual.
+Sentences are segmented per paragraph, so a sentence that runs across a
+blank line is split there.
+
+Example
+-------
+>>> inc = IncrementalSummarizer(ratio=0.3)
+>>> inc.update(text)["summary"]
+>>> inc.update(edited_text)["summary"]   # reuses everything unchanged
+>>> inc.last_update
+{'paragraphs_resegmented': 1, 'sentences_added': 2, 'sentences_removed': 1, ...}
+"""
+
+from __future__ import annotations
+
+import difflib
+import re
+from collections import Counter
+
+import numpy as np
+
+from src.clustering import select_representative_sentences
+from src.feature_extraction import get_sentence_scores
+from src.preprocess import Segmenter, clean_text, get_segmenter
+from src.summarizer import _empty_result, _locate_spans, _summary_result, _whole_text_result
+
+
+class IncrementalSummarizer:
+    """
+    Stateful summariser that reuses work across successive edits.
+
+    Parameters
+    ----------
+    ratio          : fraction of sentences to keep (as in ``summarize``)
+    random_state   : seed for full clustering runs
+    segmenter      : sentence splitter (see ``summarize``)
+    refit_fraction : run a full (warm-started) clustering once the
+                     sentences added + removed since the last one exceed
+                     this fraction of the document
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.3,
+        random_state: int = 42,
+        segmenter: str | Segmenter = "punkt",
+        refit_fraction: float = 0.25,
+    ) -> None:
+        self.ratio = ratio
+        self.random_state = random_state
+        self.segmenter = get_segmenter(segmenter)
+        self.refit_fraction = refit_fraction
+        self.last_update: dict = {}
+
+        self._paragraphs: dict[str, list[str]] = {}                 # raw paragraph → sentences
+        self._terms: dict[str, tuple[np.ndarray, np.ndarray]] = {}  # sentence → (cols, tf)
+        self._vocabulary: dict[str, int] = {}
+        self._df = np.zeros(0, dtype=np.int64)
+        self._sentences: list[str] = []
+        self._labels = np.zeros(0, dtype=np.int64)
+        self._centroids: np.ndarray | None = None
+        self._churn = 0
+        self._analyzer = None
+
+    # ── Public API ─────────────────────────────────────────────────
+
+    def update(self, text: str) -> dict:
+        """Summarise the new version of the document."""
+        sentences, resegmented = self._segment(text)
+        labels, touched, added, removed = self._apply_diff(sentences)
+        self._churn += added + removed
+        self.last_update = {
+            "paragraphs_resegmented": resegmented,
+            "sentences_added": added,
+            "sentences_removed": removed,
+            "sentences_reused": len(sentences) - added,
+        }
+
+        if len(sentences) <= 2:
+            self._centroids = None
+            self._labels = np.zeros(len(sentences), dtype=np.int64)
+            if not sentences:
+                return _empty_result()
+            cleaned = clean_text(text)
+            return _whole_text_result(cleaned, len(sentences), _locate_spans(cleaned, sentences))
+
+        X = self._tfidf_matrix()
+        n_clusters = min(max(1, int(len(sentences) * self.ratio)), len(sentences))
+        if self._centroids is None or self._churn > self.refit_fraction * len(sentences):
+            self._full_fit(X, n_clusters)
+        else:
+            self._local_update(X, n_clusters, labels, touched)
+
+        summary_sentences = select_representative_sentences(
+            sentences, self._labels, get_sentence_scores(X)
+        )
+        return _summary_result(
+            summary_sentences,
+            len(sentences),
+            _locate_spans(clean_text(text), summary_sentences),
+        )
+
+    # ── Segmentation (per paragraph, cached) ───────────────────────
+
+    def _segment(self, text: str) -> tuple[list[str], int]:
+        paragraphs = [p for p in re.split(r"\n\s*\n", text or "") if p.strip()]
+
+        new = [p for p in dict.fromkeys(paragraphs) if p not in self._paragraphs]
+        cache = {p: self._paragraphs[p] for p in paragraphs if p in self._paragraphs}
+        cache.update(zip(new, self.segmenter.split_batch([clean_text(p) for p in new])))
+        self._paragraphs = cache  # drop paragraphs that no longer exist
+
+        return [s for p in paragraphs for s in cache[p]], len(new)
+
+    # ── Diff, term counts and document frequencies ─────────────────
+
+    def _apply_diff(self, sentences: list[str]) -> tuple[np.ndarray, set, int, int]:
+        """
+        Update df for the sentences that were added or removed.
+
+        Returns the previous cluster label of every surviving sentence
+        (−1 for new ones), the clusters that lost members, and the counts
+        of added and removed sentences.
+        """
+        matcher = difflib.SequenceMatcher(None, self._sentences, sentences, autojunk=False)
+        labels = np.full(len(sentences), -1, dtype=np.int64)
+        touched: set[int] = set()
+        added = removed = 0
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                labels[j1:j2] = self._labels[i1:i2]
+                continue
+            for s in self._sentences[i1:i2]:
+                self._df[self._terms[s][0]] -= 1
+            for s in sentences[j1:j2]:
+                cols, _tf = self._term_counts(s)  # may grow self._df
+                self._df[cols] += 1
+            touched.update(self._labels[i1:i2].tolist())
+            removed += i2 - i1
+            added += j2 - j1
+
+        live = set(sentences)
+        self._terms = {s: v for s, v in self._terms.items() if s in live}
+        self._sentences = sentences
+        return labels, touched, added, removed
+
+    def _term_counts(self, sentence: str) -> tuple[np.ndarray, np.ndarray]:
+        """Column ids and raw counts of one sentence's terms (cached)."""
+        cached = self._terms.get(sentence)
+        if cached is not None:
+            return cached
+
+        if self._analyzer is None:
+            from sklearn.feature_extraction.text import CountVectorizer
+
+            self._analyzer = CountVectorizer(stop_words="english").build_analyzer()
+
+        counts = Counter(self._analyzer(sentence))
+        cols = np.empty(len(counts), dtype=np.int64)
+        for i, term in enumerate(counts):
+            col = self._vocabulary.get(term)
+            if col is None:
+                col = self._vocabulary[term] = len(self._vocabulary)
+            cols[i] = col
+        if len(self._vocabulary) > len(self._df):
+            grown = np.zeros(max(len(self._vocabulary), 2 * len(self._df), 1024), np.int64)
+            grown[:len(self._df)] = self._df
+            self._df = grown
+
+        self._terms[sentence] = (cols, np.fromiter(counts.values(), np.float64, len(counts)))
+        return self._terms[sentence]
+
+    def _tfidf_matrix(self):
+        """L2-normalised TF-IDF rows, weighted like ``build_tfidf_matrix``."""
+        import scipy.sparse as sp
+        from sklearn.preprocessing import normalize
+
+        n = len(self._sentences)
+        rows = [self._terms[s] for s in self._sentences]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum([len(c) for c, _ in rows], out=indptr[1:])
+        indices = np.concatenate([c for c, _ in rows])
+        tf = np.concatenate([t for _, t in rows])
+
+        df = self._df[:len(self._vocabulary)]
+        idf = np.log((1.0 + n) / (1.0 + df)) + 1.0
+        idf[df > 0.95 * n] = 0.0  # max_df=0.95
+
+        data = (1.0 + np.log(tf)) * idf[indices]
+        X = sp.csr_matrix((data, indices, indptr), shape=(n, len(self._vocabulary)))
+        X.eliminate_zeros()
+        return normalize(X, norm="l2", copy=False)
+
+    # ── Clustering ─────────────────────────────────────────────────
+
+    def _padded_centroids(self, n_features: int) -> np.ndarray:
+        """Previous centroids, with zero weight on vocabulary added since."""
+        if self._centroids.shape[1] == n_features:
+            return self._centroids
+        C = np.zeros((len(self._centroids), n_features))
+        C[:, :self._centroids.shape[1]] = self._centroids
+        return C
+
+    def _full_fit(self, X, n_clusters: int) -> None:
+        from src.spherical_kmeans import spherical_kmeans
+
+        init = None
+        if self._centroids is not None:
+            init = self._padded_centroids(X.shape[1])[:n_clusters]
+        fit = spherical_kmeans(X, n_clusters, random_state=self.random_state, init=init)
+
+        self._centroids = fit.centroids
+        self._labels = fit.labels
+        self._churn = 0
+        self.last_update.update(clustering="full", kmeans_iterations=fit.n_iter)
+
+    def _local_update(self, X, n_clusters: int, labels: np.ndarray, touched: set) -> None:
+        from src.spherical_kmeans import _to_dense
+
+        C = self._padded_centroids(X.shape[1])
+        counts = np.bincount(labels[labels >= 0], minlength=len(C))
+
+        # retire emptied clusters, then the smallest, until at most k remain
+        keep = np.flatnonzero(counts > 0)
+        if len(keep) > n_clusters:
+            keep = np.sort(keep[np.argsort(-counts[keep], kind="stable")[:n_clusters]])
+        remap = np.full(len(C), -1, dtype=np.int64)
+        remap[keep] = np.arange(len(keep))
+        labels = np.where(labels >= 0, remap[np.maximum(labels, 0)], -1)
+        touched = {int(remap[t]) for t in touched if remap[t] >= 0}
+        if len(keep) < len(C):
+            C = C[keep]
+
+        # seed missing clusters from the unassigned rows that fit worst
+        free = np.flatnonzero(labels < 0)
+        if len(C) < n_clusters and len(free):
+            fit = np.asarray(X[free] @ C.T).max(axis=1) if len(C) else np.zeros(len(free))
+            seeds = free[np.argsort(fit, kind="stable")[: n_clusters - len(C)]]
+            labels[seeds] = len(C) + np.arange(len(seeds))
+            C = np.vstack([C, _to_dense(X[seeds])])
+            free = np.flatnonzero(labels < 0)
+
+        if len(free):
+            labels[free] = np.asarray(X[free] @ C.T).argmax(axis=1)
+            touched.update(np.unique(labels[free]).tolist())
+        if len(C) < n_clusters:
+            # still short (e.g. only deletions): start empty, filled below
+            C = np.vstack([C, np.zeros((n_clusters - len(C), C.shape[1]), dtype=C.dtype)])
+
+        # recompute the touched centroids, then let their members move
+        for _ in range(2):
+            if not touched:
+                break
+            rows = _recentre(X, C, labels, touched)
+            moved = np.asarray(X[rows] @ C.T).argmax(axis=1)
+            changed = moved != labels[rows]
+            touched = set(labels[rows][changed].tolist()) | set(moved[changed].tolist())
+            labels[rows] = moved
+
+        # an empty cluster (its members all moved away, or added above) is
+        # re-seeded with the rows furthest from their centre, never taking
+        # a cluster's last member
+        counts = np.bincount(labels, minlength=len(C))
+        empty = np.flatnonzero(counts == 0)
+        if len(empty):
+            row_of = np.repeat(np.arange(X.shape[0]), np.diff(X.indptr))
+            sims = np.bincount(
+                row_of, weights=X.data * C[labels[row_of], X.indices], minlength=X.shape[0]
+            )
+            far = []
+            for row in np.argsort(sims, kind="stable"):
+                if counts[labels[row]] > 1:
+                    counts[labels[row]] -= 1
+                    far.append(row)
+                    if len(far) == len(empty):
+                        break
+            donors = set(labels[far].tolist())
+            labels[far] = empty[:len(far)]
+            _recentre(X, C, labels, donors | set(empty[:len(far)].tolist()))
+
+        self._centroids = C
+        self._labels = labels
+        self.last_update.update(clustering="local", n_clusters=len(C))
+
+
+def _recentre(X, C: np.ndarray, labels: np.ndarray, clusters: set) -> np.ndarray:
+    """Recompute the centroids of *clusters* in place; returns their member rows."""
+    from src.spherical_kmeans import _indicator, _normalize_centroids, _to_dense
+
+    ids = np.sort(np.fromiter(clusters, dtype=np.int64))
+    rows = np.flatnonzero(np.isin(labels, ids))
+    position = np.searchsorted(ids, labels[rows])
+    C[ids] = _normalize_centroids(_to_dense(_indicator(position, len(ids), X.dtype) @ X[rows]))
+    return rows
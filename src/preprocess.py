@@ -1,60 +1,186 @@
 """
 Text preprocessing module.
 
-Handles three main jobs:
+Handles four main jobs:
   1. Downloading NLTK resources (punkt tokenizer, stopwords list).
   2. Cleaning raw text — collapsing whitespace, stripping junk chars.
   3. Splitting text into sentences and optionally tokenizing words.
+  4. Tokenizing a document's sentences once, into interned integer ids
+     that every later stage shares (``tokenize_sentences``).
 """
 
+from __future__ import annotations
+
+import os
 import re
-import ssl
 import functools
+import itertools
+from collections import defaultdict
+from collections.abc import Sequence
+
+import numpy as np
+
+# NLTK is imported inside the functions that need it: ``import nltk``
+# alone costs seconds, and callers that only clean text (or use the regex
+# segmenter) should never pay for it.
+
 
-import nltk
+def _allow_unverified_https() -> None:
+    """
+    macOS SSL workaround for ``nltk.download``.
+
+    Some macOS installs ship with outdated certs, which makes nltk.download
+    fail over HTTPS.  This patches the default context so downloads work.
+    It is applied only right before a download — never at import time.
+    """
+    import ssl
 
-# ── macOS SSL workaround ────────────────────────────────────────────
-# Some macOS installs ship with outdated certs, which makes nltk.download
-# fail over HTTPS.  This patches the default context so downloads work.
-try:
-    _create_unverified_https_context = ssl._create_unverified_context
-except AttributeError:
-    pass  # not on macOS — nothing to patch
-else:
-    ssl._create_default_https_context = _create_unverified_https_context
+    try:
+        _create_unverified_https_context = ssl._create_unverified_context
+    except AttributeError:
+        pass  # not on macOS — nothing to patch
+    else:
+        ssl._create_default_https_context = _create_unverified_https_context
 
-from nltk.corpus import stopwords
-from nltk.tokenize import sent_tokenize, word_tokenize
 
 # ── NLTK resource management ───────────────────────────────────────
+#
+# By default missing resources are fetched with ``nltk.download`` the first
+# time they're needed.  Air-gapped deployments switch to *offline mode*:
+# resources are read from a local directory (``configure_nltk`` or the
+# SCHOLARLENS_NLTK_DATA / SCHOLARLENS_NLTK_OFFLINE environment variables, or
+# a ``src/nltk_data`` directory shipped with the package), validated once,
+# and the downloader is never touched.
+
+NLTK_RESOURCES = {
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab",
+    "stopwords": "corpora/stopwords",
+}
+
+_PACKAGED_NLTK_DATA = os.path.join(os.path.dirname(__file__), "nltk_data")
 
 _NLTK_READY = False  # simple flag so we only check once per process
+_NLTK_CONFIG: dict = {"data_dir": None, "offline": None}
+
+
+class NLTKDataError(RuntimeError):
+    """Required NLTK resources are missing and may not be downloaded."""
+
+
+def configure_nltk(data_dir: str | os.PathLike | None = None, offline: bool = True) -> None:
+    """
+    Point NLTK at a local resource directory and optionally forbid downloads.
+
+    Call this once at start-up, before the first request.  Explicit
+    arguments win over the SCHOLARLENS_NLTK_DATA / SCHOLARLENS_NLTK_OFFLINE
+    environment variables.
+    """
+    global _NLTK_READY
+    _NLTK_CONFIG["data_dir"] = os.fspath(data_dir) if data_dir is not None else None
+    _NLTK_CONFIG["offline"] = offline
+    _NLTK_READY = False
+
+
+def nltk_settings() -> tuple[str | None, bool]:
+    """Return the effective ``(data_dir, offline)`` configuration."""
+    data_dir = _NLTK_CONFIG["data_dir"] or os.environ.get("SCHOLARLENS_NLTK_DATA")
+    if data_dir is None and os.path.isdir(_PACKAGED_NLTK_DATA):
+        data_dir = _PACKAGED_NLTK_DATA
+
+    offline = _NLTK_CONFIG["offline"]
+    if offline is None:
+        offline = os.environ.get("SCHOLARLENS_NLTK_OFFLINE", "").lower() in ("1", "true", "yes")
+    return data_dir, offline
+
+
+def _register_data_dir(nltk, data_dir: str | None) -> None:
+    if data_dir is not None and data_dir not in nltk.data.path:
+        nltk.data.path.insert(0, data_dir)
+
+
+def validate_nltk_data() -> None:
+    """
+    Check that every resource in ``NLTK_RESOURCES`` can be found locally.
+
+    Raises
+    ------
+    NLTKDataError
+        Listing the missing resources and every directory searched.
+    """
+    import nltk
+
+    data_dir, _offline = nltk_settings()
+    _register_data_dir(nltk, data_dir)
+
+    missing = []
+    for name, path in NLTK_RESOURCES.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            missing.append(name)
+    if missing:
+        raise NLTKDataError(
+            f"NLTK resources not found: {', '.join(missing)}. "
+            f"Searched: {', '.join(map(str, nltk.data.path))}. "
+            "Vendor them with src.preprocess.download_nltk_data(<dir>) and point "
+            "SCHOLARLENS_NLTK_DATA (or configure_nltk) at that directory."
+        )
 
 
 def ensure_nltk_data() -> None:
-    """Download required NLTK data packages if they aren't already cached."""
+    """
+    Make sure the required NLTK data packages are available.
+
+    Online (default): download whatever isn't already cached.
+    Offline: validate the local copies once and raise ``NLTKDataError``
+    if anything is missing — never touch the network.
+    """
     global _NLTK_READY
     if _NLTK_READY:
         return
 
-    resources = {
-        "punkt": "tokenizers/punkt",
-        "punkt_tab": "tokenizers/punkt_tab",
-        "stopwords": "corpora/stopwords",
-    }
-    for name, path in resources.items():
+    import nltk
+
+    data_dir, offline = nltk_settings()
+    _register_data_dir(nltk, data_dir)
+
+    if offline:
+        validate_nltk_data()
+        _NLTK_READY = True
+        return
+
+    for name, path in NLTK_RESOURCES.items():
         try:
             nltk.data.find(path)
         except LookupError:
+            _allow_unverified_https()
             nltk.download(name, quiet=True)
 
     _NLTK_READY = True
 
 
+def download_nltk_data(target_dir: str | os.PathLike) -> None:
+    """
+    Fetch every resource in ``NLTK_RESOURCES`` into *target_dir*.
+
+    Run this at build time (with network access) to produce the directory
+    that offline mode reads from.
+    """
+    import nltk
+
+    _allow_unverified_https()
+    for name in NLTK_RESOURCES:
+        if not nltk.download(name, download_dir=os.fspath(target_dir), quiet=True):
+            raise NLTKDataError(f"failed to download NLTK resource {name!r}")
+
+
 # cache the stopword set so we don't rebuild it on every call
 @functools.lru_cache(maxsize=1)
 def _get_stop_words() -> frozenset:
     ensure_nltk_data()
+    from nltk.corpus import stopwords
+
     return frozenset(stopwords.words("english"))
 
 
@@ -68,18 +194,231 @@ def clean_text(text: str) -> str:
     return text.strip()
 
 
+# ── Sentence segmenters ────────────────────────────────────────────
+#
+# ``split_sentences`` delegates to a *segmenter*.  Two are built in:
+#
+#   punkt  NLTK's Punkt model, loaded once per process and reused —
+#          the default, and the right choice for arbitrary input.
+#   regex  A compiled rule-based splitter for trusted, well-formed text
+#          (edited articles, generated reports).  Several times faster,
+#          but it only knows a fixed list of abbreviations.
+#
+# Custom segmenters subclass ``Segmenter`` and are passed by instance or
+# registered in ``SEGMENTERS``.
+
+class Segmenter:
+    """
+    Base class for sentence segmenters.
+
+    Subclasses implement ``split``, or ``spans`` and derive ``split``
+    from it; the built-in segmenters do the latter so the pipeline can
+    work on offsets without copying every sentence.
+
+    Result caches tell segmenters apart by class and ``name``; give
+    differently configured instances of one class distinct names.
+    """
+
+    name = "base"
+
+    def split(self, text: str) -> list[str]:
+        """Split *text* into stripped, non-empty sentences."""
+        raise NotImplementedError
+
+    def spans(self, text: str) -> np.ndarray:
+        """
+        ``(start, end)`` offsets of the sentences ``split`` would return.
+
+        The default locates each sentence of ``split(text)`` in *text* in
+        turn; override it to produce offsets directly.
+        """
+        bounds = []
+        pos = 0
+        for sentence in self.split(text):
+            start = text.find(sentence, pos)
+            if start < 0:
+                raise ValueError(f"{type(self).__name__} returned text not found in the input")
+            pos = start + len(sentence)
+            bounds.append((start, pos))
+        return _span_array(bounds, len(text))
+
+    def split_batch(self, texts: list[str]) -> list[list[str]]:
+        """Split several documents in one call."""
+        return [self.split(t) for t in texts]
+
+
+class PunktSegmenter(Segmenter):
+    """
+    NLTK Punkt, loaded lazily on first use and then reused.
+
+    ``nltk.sent_tokenize`` looks the model up again on every call; holding
+    on to the tokenizer instance skips that lookup.
+    """
+
+    name = "punkt"
+
+    def __init__(self, language: str = "english") -> None:
+        self.language = language
+        self._tokenizer = None
+
+    def _load(self):
+        ensure_nltk_data()
+        import nltk
+
+        try:
+            from nltk.tokenize import PunktTokenizer
+        except ImportError:  # NLTK < 3.8.2 ships the pickled model instead
+            return nltk.data.load(f"tokenizers/punkt/{self.language}.pickle")
+        return PunktTokenizer(self.language)
+
+    def split(self, text: str) -> list[str]:
+        return [text[start:end] for start, end in self.spans(text).tolist()]
+
+    def spans(self, text: str) -> np.ndarray:
+        if self._tokenizer is None:
+            self._tokenizer = self._load()
+        bounds = (_strip_span(text, start, end) for start, end in self._tokenizer.span_tokenize(text))
+        return _span_array([b for b in bounds if b[0] < b[1]], len(text))
+
+    def __getstate__(self) -> dict:
+        # ship the language, not the model — workers load their own copy
+        return {"language": self.language, "_tokenizer": None}
+
+
+class RegexSegmenter(Segmenter):
+    """
+    Rule-based splitter: a sentence ends at ``.``, ``!`` or ``?`` (plus any
+    closing quotes/brackets) followed by whitespace and an upper-case
+    letter, digit or opening quote — unless the word before the period is
+    a known abbreviation or a single-letter initial.
+    """
+
+    name = "regex"
+
+    _BOUNDARY = re.compile(r"([.!?]+[\"'\u201d\u2019)\]]*)\s+(?=[\"'\u201c\u2018(\[]?[A-Z0-9])")
+    ABBREVIATIONS = frozenset(
+        "mr mrs ms dr prof sr jr st vs etc fig eq no vol approx dept est "
+        "inc ltd co corp jan feb mar apr jun jul aug sep sept oct nov dec "
+        "e.g i.e a.m p.m u.s u.k".split()
+    )
+
+    def split(self, text: str) -> list[str]:
+        return [text[start:end] for start, end in self.spans(text).tolist()]
+
+    def spans(self, text: str) -> np.ndarray:
+        bounds = []
+        start = 0
+        for m in self._BOUNDARY.finditer(text):
+            if m.group(1).startswith(".") and self._is_abbreviation(text, start, m.start()):
+                continue
+            bounds.append(_strip_span(text, start, m.end(1)))
+            start = m.end()
+        bounds.append(_strip_span(text, start, len(text)))
+        return _span_array([b for b in bounds if b[0] < b[1]], len(text))
+
+    def _is_abbreviation(self, text: str, start: int, dot: int) -> bool:
+        word_start = max(text.rfind(" ", start, dot), start - 1) + 1
+        word = text[word_start:dot].lstrip("\"'(\u201c\u2018").lower()
+        return (len(word) == 1 and word.isalpha()) or word in self.ABBREVIATIONS
+
+
+def _strip_span(text: str, start: int, end: int) -> tuple[int, int]:
+    """Narrow ``text[start:end]`` to what ``str.strip()`` would keep."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _span_array(bounds: list[tuple[int, int]], text_length: int) -> np.ndarray:
+    # int32 offsets while the text fits, so spans cost 8 bytes a sentence
+    dtype = np.int32 if text_length < 2**31 else np.int64
+    return np.array(bounds, dtype=dtype).reshape(-1, 2)
+
+
+SEGMENTERS: dict[str, type[Segmenter]] = {
+    "punkt": PunktSegmenter,
+    "regex": RegexSegmenter,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _segmenter_instance(name: str) -> Segmenter:
+    try:
+        return SEGMENTERS[name]()
+    except KeyError:
+        raise ValueError(
+            f"unknown segmenter {name!r}; expected one of {sorted(SEGMENTERS)}"
+        ) from None
+
+
+def get_segmenter(segmenter: str | Segmenter = "punkt") -> Segmenter:
+    """Resolve a segmenter name to its shared per-process instance."""
+    if isinstance(segmenter, Segmenter):
+        return segmenter
+    return _segmenter_instance(segmenter)
+
+
 # ── Sentence splitting ─────────────────────────────────────────────
 
-def split_sentences(text: str) -> list[str]:
+def split_sentences(text: str, segmenter: str | Segmenter = "punkt") -> list[str]:
     """
-    Split *text* into sentences using NLTK's Punkt tokenizer.
+    Split *text* into sentences.
+
+    Uses NLTK's Punkt tokenizer by default; pass ``segmenter="regex"``
+    (or a ``Segmenter`` instance) to use another one.
 
     Empty or whitespace-only fragments are dropped automatically.
     """
-    ensure_nltk_data()
-    sentences = sent_tokenize(text)
-    # strip each sentence and throw away blanks
-    return [s.strip() for s in sentences if s.strip()]
+    return get_segmenter(segmenter).split(text)
+
+
+class SentenceSpans(Sequence):
+    """
+    Sentences as ``(start, end)`` offsets into one text, without copies.
+
+    Behaves like the ``list[str]`` from ``split_sentences`` — ``len``,
+    indexing and iteration — but holds only the text and an ``(n, 2)``
+    offset array; a sentence string is built only when it is accessed.
+    The pipeline reads sentences through their token ids, so only the
+    sentences that end up in the summary are ever materialised.
+
+    Attributes
+    ----------
+    text  : str — the text the offsets index into
+    spans : int array, shape (n_sentences, 2)
+    """
+
+    def __init__(self, text: str, spans: np.ndarray) -> None:
+        self.text = text
+        self.spans = spans
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SentenceSpans(self.text, self.spans[index])
+        start, end = self.spans[index]
+        return self.text[start:end]
+
+    def __iter__(self):
+        text = self.text
+        return (text[start:end] for start, end in self.spans.tolist())
+
+
+def split_sentence_spans(text: str, segmenter: str | Segmenter = "punkt") -> SentenceSpans:
+    """``split_sentences`` as offsets into *text* (see ``SentenceSpans``)."""
+    return SentenceSpans(text, get_segmenter(segmenter).spans(text))
+
+
+def split_sentences_batch(
+    texts: list[str],
+    segmenter: str | Segmenter = "punkt",
+) -> list[list[str]]:
+    """Split several documents at once with a single segmenter instance."""
+    return get_segmenter(segmenter).split_batch(texts)
 
 
 # ── Word-level tokenization ────────────────────────────────────────
@@ -105,6 +444,8 @@ def tokenize_and_clean(
         Cleaned token list, e.g. ["machine", "learning", "algorithms"].
     """
     ensure_nltk_data()
+    from nltk.tokenize import word_tokenize
+
     tokens = word_tokenize(sentence.lower())
     tokens = [t for t in tokens if t.isalpha()]
 
@@ -115,15 +456,140 @@ def tokenize_and_clean(
     return tokens
 
 
+# ── Fused tokenization ─────────────────────────────────────────────
+
+# scikit-learn's default token_pattern, so matrices built from these
+# tokens match TfidfVectorizer / CountVectorizer column for column
+TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+
+class TokenizedSentences:
+    """
+    A document's sentences, each tokenized exactly once.
+
+    Every sentence is lowercased and matched against ``TOKEN_PATTERN`` in
+    a single pass, and each distinct token is interned to an integer id.
+    The flat id array is what later stages consume — the TF-IDF matrix
+    (``build_tfidf_matrix(..., tokens=...)``), corpus IDF lookups
+    (``IDFStore.transform``) and near-duplicate signatures
+    (``src.dedup``) — instead of re-tokenizing the strings.
+
+    Attributes
+    ----------
+    terms  : list[str] — the token for each id, in first-seen order
+    ids    : int32 array — token ids of every sentence, concatenated
+    indptr : int64 array, shape (n_sentences + 1,) — sentence *i*'s ids
+             are ``ids[indptr[i]:indptr[i + 1]]``
+    """
+
+    def __init__(self, sentences: list[str] | SentenceSpans) -> None:
+        findall = TOKEN_PATTERN.findall
+        lowered = sentences.text.lower() if isinstance(sentences, SentenceSpans) else None
+        if lowered is not None and len(lowered) == len(sentences.text):
+            # match inside the lowered text by offset — no per-sentence copies
+            per_sentence = [findall(lowered, s, e) for s, e in sentences.spans.tolist()]
+        else:
+            per_sentence = [findall(s.lower()) for s in sentences]
+        lengths = np.fromiter(map(len, per_sentence), np.int64, len(per_sentence))
+
+        interned: defaultdict[str, int] = defaultdict(itertools.count().__next__)
+        self.indptr = np.zeros(len(per_sentence) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.indptr[1:])
+        self.ids = np.fromiter(
+            map(interned.__getitem__, itertools.chain.from_iterable(per_sentence)),
+            dtype=np.int32,
+            count=int(self.indptr[-1]),
+        )
+        self.terms = list(interned)
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Token count of every sentence."""
+        return np.diff(self.indptr)
+
+    def tokens(self, i: int) -> list[str]:
+        """The tokens of sentence *i*, as strings."""
+        return [self.terms[t] for t in self.ids[self.indptr[i]:self.indptr[i + 1]]]
+
+    def take(self, indices) -> TokenizedSentences:
+        """
+        The sentences at *indices* as their own ``TokenizedSentences``.
+
+        Ids are re-interned in first-seen order over the kept sentences,
+        so the result equals tokenizing those sentences directly.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        lengths = self.lengths[indices]
+        indptr = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        positions = np.repeat(self.indptr[indices] - indptr[:-1], lengths) + np.arange(indptr[-1])
+        old = self.ids[positions]
+
+        kept, first = np.unique(old, return_index=True)
+        kept = kept[np.argsort(first)]
+        remap = np.empty(len(self.terms), dtype=np.int32)
+        remap[kept] = np.arange(len(kept), dtype=np.int32)
+
+        taken = object.__new__(type(self))
+        taken.indptr, taken.ids = indptr, remap[old]
+        taken.terms = [self.terms[t] for t in kept]
+        return taken
+
+    def count_matrix(self, stop_words: frozenset = frozenset()):
+        """
+        Raw term counts as CSR, built straight from the id arrays.
+
+        Columns are the terms not in *stop_words*, in sorted order — the
+        same layout ``CountVectorizer`` produces.
+
+        Returns
+        -------
+        counts        : sparse CSR int64 matrix, shape (n_sentences, n_terms)
+        feature_names : ndarray of str, the term for each column
+        """
+        import scipy.sparse as sp
+
+        terms = np.array(self.terms, dtype=object)
+        kept = np.flatnonzero([t not in stop_words for t in self.terms])
+        kept = kept[np.argsort(terms[kept].astype(str), kind="stable")]
+        column = np.full(len(terms), -1, dtype=np.int64)
+        column[kept] = np.arange(len(kept))
+
+        n, width = len(self), len(kept)
+        # unique (row, id) keys give the counts in row-major, first-seen id
+        # order — the order CountVectorizer emits — and are only then
+        # mapped to columns, so downstream float sums match it bit for bit
+        stride = max(len(terms), 1)
+        rows = np.repeat(np.arange(n), self.lengths)
+        live = column[self.ids] >= 0
+        keys, counts = np.unique(rows[live] * stride + self.ids[live], return_counts=True)
+        row_of, ids = np.divmod(keys, stride)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row_of, minlength=n), out=indptr[1:])
+        matrix = sp.csr_matrix((counts, column[ids], indptr), shape=(n, width))
+        return matrix, terms[kept].astype(str)
+
+
+def tokenize_sentences(sentences: list[str] | SentenceSpans) -> TokenizedSentences:
+    """Tokenize every sentence once and intern the tokens (see ``TokenizedSentences``)."""
+    return TokenizedSentences(sentences)
+
+
 # ── Convenience pipeline ───────────────────────────────────────────
 
-def preprocess_text(text: str) -> tuple[str, list[str]]:
+def preprocess_text(
+    text: str,
+    segmenter: str | Segmenter = "punkt",
+) -> tuple[str, list[str]]:
     """
     Run the full preprocessing pipeline on raw input text.
 
     Steps:
       1. clean_text()   — normalise whitespace
-      2. split_sentences() — NLTK Punkt sentence segmentation
+      2. split_sentences() — sentence segmentation (Punkt by default)
 
     Returns
     -------
@@ -131,5 +597,5 @@ def preprocess_text(text: str) -> tuple[str, list[str]]:
         (cleaned_text, list_of_sentences)
     """
     cleaned = clean_text(text)
-    sentences = split_sentences(cleaned)
+    sentences = split_sentences(cleaned, segmenter)
     return cleaned, sentences
\ No newline at end of file
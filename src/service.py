@@ -0,0 +1,477 @@
+"""
+Local HTTP summarization service.
+
+A small asyncio server (standard library only) that lets other services
+call the summariser over HTTP:
+
+    POST /summarize   {"text": "...", "ratio": 0.3, "engine": "spherical"}
+                      → the ``summarize()`` result as JSON
+    GET  /healthz     → {"status": "ok"}
+    GET  /metrics     → Prometheus text: queue depth, in-flight batches,
+                        request/rejection counters, latency and batch-size
+                        histograms
+
+How a request flows
+-------------------
+1. The handler parses the JSON body and puts ``(text, options, future)``
+   on a bounded ``asyncio.Queue``.  If the queue is full the client gets
+   **503** with ``Retry-After`` straight away — back-pressure instead of
+   an ever-growing backlog.
+2. The batcher takes the first waiting request, then keeps collecting
+   for up to ``batch_wait_ms`` (or until ``max_batch`` requests), and
+   ships the whole group to a worker process in one pickle round-trip.
+3. Workers are pre-warmed at start-up (``src.summarizer.warmup``), so no
+   request pays for importing scikit-learn or loading Punkt.  At most
+   ``workers`` batches run at once; the rest wait in the queue.
+
+Run it with::
+
+    python -m src.service --port 8000 --workers 4 --max-batch 8 --batch-wait-ms 5
+
+and load-test it with ``python -m benchmarks.load_service``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import json
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.batch import default_workers, worker_initializer
+from src.execution import ExecutionPolicy
+
+# options a client may pass through to summarize()
+ALLOWED_OPTIONS = (
+    "ratio", "engine", "segmenter", "random_state", "hash_features", "reduce_dim",
+    "dtype", "max_memory_mb", "dedup_threshold",
+)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+MAX_HEADERS = 100
+
+_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 431: "Request Header Fields Too Large", 500: "Internal Server Error", 503: "Service Unavailable",
+}
+
+
+_SHUTTING_DOWN = {"status": 503, "error": "service shutting down"}
+
+
+# ── Worker side ────────────────────────────────────────────────────
+
+def _summarize_batch(items: list[tuple[str, dict]]) -> list[dict]:
+    """Run one micro-batch inside a worker; failures are per request."""
+    from src.summarizer import summarize
+
+    results = []
+    for text, options in items:
+        try:
+            results.append({"status": 200, "result": summarize(text, **options)})
+        except (TypeError, ValueError) as exc:  # bad options, e.g. unknown engine
+            results.append({"status": 400, "error": f"{type(exc).__name__}: {exc}"})
+        except Exception as exc:  # reported to that client only
+            results.append({"status": 500, "error": f"{type(exc).__name__}: {exc}"})
+    return results
+
+
+def _ping() -> int:
+    time.sleep(0.05)  # hold this worker so the next ping starts another
+    return os.getpid()
+
+
+# ── Metrics ────────────────────────────────────────────────────────
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.total = 0.0
+        self.n = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.n += 1
+
+    def render(self, name: str) -> list[str]:
+        lines, running = [], 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            lines.append(f'{name}_bucket{{le="{bound}"}} {running}')
+        lines.append(f'{name}_bucket{{le="+Inf"}} {self.n}')
+        lines.append(f"{name}_sum {self.total:.6f}")
+        lines.append(f"{name}_count {self.n}")
+        return lines
+
+
+# ── Server ─────────────────────────────────────────────────────────
+
+class SummarizationService:
+    """
+    Micro-batching front-end over a pool of warm worker processes.
+
+    Parameters
+    ----------
+    workers       : worker processes (defaults to CPU count)
+    max_batch     : most requests sent to a worker in one batch
+    batch_wait_ms : how long the batcher waits to fill a batch
+    queue_size    : waiting requests beyond this are rejected with 503
+    segmenter     : segmenter to pre-load in each worker
+    engine        : clustering engine to pre-load in each worker
+    policy        : execution policy for each worker process (defaults to
+                    ``ExecutionPolicy.for_workers(workers)`` — an even
+                    share of the cores per worker)
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_batch: int = 8,
+        batch_wait_ms: float = 5.0,
+        queue_size: int = 256,
+        segmenter: str = "punkt",
+        engine: str = "kmeans",
+        policy: ExecutionPolicy | None = None,
+    ) -> None:
+        self.workers = workers or default_workers()
+        self.policy = policy or ExecutionPolicy.for_workers(self.workers)
+        self.max_batch = max_batch
+        self.batch_wait = batch_wait_ms / 1000.0
+        self.queue_size = queue_size
+        self.segmenter = segmenter
+        self.engine = engine
+
+        self._queue: asyncio.Queue | None = None
+        self._pool: ProcessPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._batcher: asyncio.Task | None = None
+        self._batch_tasks: set[asyncio.Task] = set()  # the loop only holds weak refs
+        self._closing = False
+        self._in_flight = 0
+        self._counters = {"requests": 0, "rejected": 0, "errors": 0, "batches": 0}
+        self._latency = Histogram(LATENCY_BUCKETS)
+        self._queue_wait = Histogram(LATENCY_BUCKETS)
+        self._batch_size = Histogram(BATCH_BUCKETS)
+
+    # ── lifecycle ──────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        """Start and warm the worker pool, then the batcher."""
+        loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._slots = asyncio.Semaphore(self.workers)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=worker_initializer(self.segmenter, self.engine, self.policy),
+        )
+        # one overlapping ping per worker forces every process to start
+        # (and run its warm-up initializer) before we accept traffic
+        await asyncio.gather(
+            *(loop.run_in_executor(self._pool, _ping) for _ in range(self.workers))
+        )
+        self._batcher = asyncio.create_task(self._batch_loop())
+
+    async def stop(self) -> None:
+        """
+        Shut down without leaving any client hanging.
+
+        Batches already taken off the queue — including one still being
+        collected — run to completion; requests still waiting in the
+        queue, and any submitted from now on, get a 503.
+        """
+        self._closing = True
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        while self._queue is not None and not self._queue.empty():
+            *_, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.set_result(_SHUTTING_DOWN)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    # ── request path ───────────────────────────────────────────────
+
+    async def submit(self, text: str, options: dict) -> dict:
+        """
+        Queue one request and wait for its result.
+
+        Raises ``asyncio.QueueFull`` when the queue is at capacity; once
+        ``stop()`` has begun the result is a 503 without queueing.
+        """
+        if self._closing:
+            return _SHUTTING_DOWN
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, options, future, time.perf_counter()))
+        return await future
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._slots.acquire()
+            batch = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.batch_wait
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # stopping: requests already off the queue still get run
+                if batch:
+                    self._start_batch(batch)
+                else:
+                    self._slots.release()
+                raise
+            self._start_batch(batch)
+
+    def _start_batch(self, batch: list) -> None:
+        task = asyncio.create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: list) -> None:
+        loop = asyncio.get_running_loop()
+        now = time.perf_counter()
+        for *_, enqueued in batch:
+            self._queue_wait.observe(now - enqueued)
+        self._batch_size.observe(len(batch))
+        self._counters["batches"] += 1
+        self._in_flight += 1
+        try:
+            items = [(text, options) for text, options, _, _ in batch]
+            try:
+                results = await loop.run_in_executor(self._pool, _summarize_batch, items)
+            except Exception as exc:  # worker crashed — fail the whole batch
+                results = [{"status": 500, "error": f"{type(exc).__name__}: {exc}"}] * len(batch)
+            for (*_, future, _), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._in_flight -= 1
+            self._slots.release()
+
+    # ── HTTP ───────────────────────────────────────────────────────
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, payload, extra = await self._dispatch(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                _write_response(writer, status, payload, extra, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except _HTTPError as exc:
+            _write_response(writer, exc.status, {"error": exc.message}, {}, False)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> tuple[int, object, dict]:
+        path = path.split("?", 1)[0]
+        if path == "/healthz":
+            return 200, {"status": "ok", "workers": self.workers}, {}
+        if path == "/metrics":
+            return 200, self.render_metrics(), {"Content-Type": "text/plain; version=0.0.4"}
+        if path != "/summarize":
+            return 404, {"error": f"no route for {path}"}, {}
+        if method != "POST":
+            return 405, {"error": "use POST"}, {"Allow": "POST"}
+
+        try:
+            text, options = _parse_summarize_body(body)
+        except ValueError as exc:
+            return 400, {"error": str(exc)}, {}
+
+        self._counters["requests"] += 1
+        start = time.perf_counter()
+        try:
+            outcome = await self.submit(text, options)
+        except asyncio.QueueFull:
+            self._counters["rejected"] += 1
+            return 503, {"error": "server busy, retry later"}, {"Retry-After": "1"}
+        self._latency.observe(time.perf_counter() - start)
+
+        if outcome["status"] != 200:
+            self._counters["errors"] += 1
+            return outcome["status"], {"error": outcome["error"]}, {}
+        return 200, outcome["result"], {}
+
+    def render_metrics(self) -> str:
+        """Prometheus text exposition of the service's counters."""
+        lines = [
+            f"scholarlens_queue_depth {self._queue.qsize() if self._queue else 0}",
+            f"scholarlens_queue_capacity {self.queue_size}",
+            f"scholarlens_batches_in_flight {self._in_flight}",
+            f"scholarlens_workers {self.workers}",
+        ]
+        lines += [f"scholarlens_{name}_total {value}" for name, value in self._counters.items()]
+        lines += self._latency.render("scholarlens_request_latency_seconds")
+        lines += self._queue_wait.render("scholarlens_queue_wait_seconds")
+        lines += self._batch_size.render("scholarlens_batch_size")
+        return "\n".join(lines) + "\n"
+
+
+# ── Minimal HTTP/1.1 plumbing ──────────────────────────────────────
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+async def _read_request(reader: asyncio.StreamReader):
+    """Parse one request; ``None`` when the client closed the connection."""
+    line = await _read_line(reader, 400, "request line too long")
+    if not line:
+        return None
+    try:
+        method, target, _version = line.decode("latin-1").split()
+    except ValueError:
+        raise _HTTPError(400, "malformed request line") from None
+
+    headers = {}
+    while True:
+        line = await _read_line(reader, 431, "header line too long")
+        if line in (b"\r\n", b"\n", b""):
+            break
+        if len(headers) >= MAX_HEADERS:
+            raise _HTTPError(431, f"more than {MAX_HEADERS} headers")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", 0) or 0)
+    except ValueError:
+        raise _HTTPError(400, "invalid Content-Length") from None
+    if length < 0:
+        raise _HTTPError(400, "invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise _HTTPError(413, f"body larger than {MAX_BODY_BYTES} bytes")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, headers, body
+
+
+async def _read_line(reader: asyncio.StreamReader, status: int, message: str) -> bytes:
+    """``reader.readline()``, with a line past the stream limit as an HTTP error."""
+    try:
+        return await reader.readline()
+    except ValueError:  # asyncio.LimitOverrunError, re-raised by readline
+        raise _HTTPError(status, message) from None
+
+
+def _write_response(writer, status: int, payload, extra: dict, keep_alive: bool) -> None:
+    if isinstance(payload, str):
+        body = payload.encode("utf-8")
+    else:
+        body = json.dumps(payload).encode("utf-8")
+    headers = {
+        "Content-Type": "application/json",
+        "Content-Length": str(len(body)),
+        "Connection": "keep-alive" if keep_alive else "close",
+        **extra,
+    }
+    head = f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+    head += "".join(f"{k}: {v}\r\n" for k, v in headers.items())
+    writer.write(head.encode("latin-1") + b"\r\n" + body)
+
+
+def _parse_summarize_body(body: bytes) -> tuple[str, dict]:
+    try:
+        payload = json.loads(body or b"{}")
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"invalid JSON: {exc}") from None
+    if not isinstance(payload, dict) or not isinstance(payload.get("text"), str):
+        raise ValueError('body must be a JSON object with a string "text"')
+    unknown = set(payload) - {"text", *ALLOWED_OPTIONS}
+    if unknown:
+        raise ValueError(f"unknown options: {sorted(unknown)}")
+    options = {k: payload[k] for k in ALLOWED_OPTIONS if k in payload}
+    return payload["text"], options
+
+
+# ── Entry point ────────────────────────────────────────────────────
+
+async def serve(host: str = "127.0.0.1", port: int = 8000, **service_options) -> None:
+    """Run the service until SIGINT/SIGTERM."""
+    service = SummarizationService(**service_options)
+    await service.start()
+    server = await asyncio.start_server(service.handle_connection, host, port)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    print(f"serving on http://{host}:{port} with {service.workers} warm workers", flush=True)
+    async with server:
+        await stop.wait()
+    await service.stop()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Local HTTP summarization service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("--max-batch", type=int, default=8)
+    parser.add_argument("--batch-wait-ms", type=float, default=5.0)
+    parser.add_argument("--queue-size", type=int, default=256)
+    parser.add_argument("--segmenter", default="punkt")
+    parser.add_argument("--engine", default="kmeans")
+    parser.add_argument("--threads", type=int, default=None,
+                        help="native threads per call (default: cores / workers)")
+    parser.add_argument("--restart-workers", type=int, default=1,
+                        help="K-Means restarts run concurrently per call")
+    args = parser.parse_args(argv)
+
+    workers = args.workers or default_workers()
+    asyncio.run(serve(
+        args.host,
+        args.port,
+        workers=workers,
+        max_batch=args.max_batch,
+        batch_wait_ms=args.batch_wait_ms,
+        queue_size=args.queue_size,
+        segmenter=args.segmenter,
+        engine=args.engine,
+        policy=ExecutionPolicy.for_workers(workers, args.restart_workers, args.threads),
+    ))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,468 @@
+"""
+Spherical (cosine) K-Means on sparse TF-IDF rows.
+
+TF-IDF rows are L2-normalised, so the natural distance between sentences
+is the cosine distance ``1 − x·μ``.  Spherical K-Means optimises exactly
+that:
+
+    J = Σ_{k=1}^{K}  Σ_{x ∈ C_k}  (1 − x · μ_k),      ‖μ_k‖ = 1
+
+Compared to running scikit-learn's Euclidean ``KMeans(n_init=10)`` on the
+same rows, this module
+
+  - never densifies the input — assignments are one sparse × dense
+    product ``X @ Cᵀ`` and centroid updates one sparse indicator product;
+  - uses k-means++ seeding (with greedy local trials), which is usually
+    good enough that a single run replaces ten restarts;
+  - offers a mini-batch variant whose cost per step is independent of n;
+  - builds a bisecting hierarchy (``ClusterHierarchy``) once, after which
+    a flat clustering for *any* k is a table lookup.
+
+Everything here is deterministic for a given ``random_state``, including
+restarts run concurrently under an execution policy (``src.execution``).
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from typing import NamedTuple
+
+import numpy as np
+import scipy.sparse as sp
+
+from src.execution import bounded_threads, map_restarts
+
+
+class ClusterFit(NamedTuple):
+    """Output of a clustering run (shared by every engine)."""
+
+    labels: np.ndarray      # (n_samples,) cluster id per row
+    centroids: np.ndarray   # (n_clusters, n_features) unit-length centroids
+    inertia: float          # Σ (1 − cos) between rows and their centroid
+    n_iter: int             # Lloyd iterations (or mini-batch steps) run
+
+
+# ── Helpers ────────────────────────────────────────────────────────
+
+def _to_dense(a) -> np.ndarray:
+    return a.toarray() if sp.issparse(a) else np.asarray(a)
+
+
+def _unit_rows(X):
+    """Return *X* as CSR (or ndarray) with L2-normalised rows."""
+    if sp.issparse(X):
+        X = sp.csr_matrix(X)
+        if not np.issubdtype(X.dtype, np.floating):
+            X = X.astype(np.float64)
+        norms = np.sqrt(np.asarray(X.multiply(X).sum(axis=1)).ravel())
+    else:
+        X = np.asarray(X)
+        if not np.issubdtype(X.dtype, np.floating):
+            X = X.astype(np.float64)
+        norms = np.linalg.norm(X, axis=1)
+    norms[norms == 0] = 1.0
+    if sp.issparse(X):
+        return sp.diags((1.0 / norms).astype(X.dtype)) @ X
+    return X / norms[:, None].astype(X.dtype)
+
+
+def _normalize_centroids(C: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(C, axis=1)
+    norms[norms == 0] = 1.0
+    return C / norms[:, None]
+
+
+def _weights(sample_weight, n: int) -> np.ndarray | None:
+    """Validated float64 row weights, or None for unweighted."""
+    if sample_weight is None:
+        return None
+    weights = np.asarray(sample_weight, dtype=np.float64)
+    if weights.shape != (n,) or (weights < 0).any() or not weights.sum() > 0:
+        raise ValueError(f"sample_weight must be {n} non-negative weights with a positive sum")
+    return weights
+
+
+def _objective(sims: np.ndarray, weights: np.ndarray | None) -> float:
+    """Σ w (1 − cos) — the (weighted) cosine inertia."""
+    if weights is None:
+        return float(len(sims) - sims.sum())
+    return float(weights.sum() - weights @ sims)
+
+
+def _indicator(labels: np.ndarray, n_clusters: int, dtype, weights=None):
+    """Sparse (n_clusters × n_samples) membership matrix."""
+    n = labels.shape[0]
+    data = np.ones(n, dtype=dtype) if weights is None else weights.astype(dtype)
+    return sp.csr_matrix((data, (labels, np.arange(n))), shape=(n_clusters, n))
+
+
+def _kmeans_plusplus(
+    X,
+    n_clusters: int,
+    rng: np.random.Generator,
+    init: np.ndarray | None = None,
+    weights: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    k-means++ seeding under cosine distance.
+
+    Each new centre is sampled with probability proportional to the
+    current distance ``1 − max cos`` to the chosen centres (times the
+    row's weight, if *weights* are given); like scikit-learn we try
+    ``2 + log k`` candidates and keep the one that lowers the total
+    potential most.
+
+    If *init* centroids are given they are kept as the first rows and
+    only the remaining ``n_clusters − len(init)`` centres are seeded.
+    """
+    n = X.shape[0]
+    n_trials = 2 + int(math.log(n_clusters))
+
+    if init is not None and len(init):
+        init = _normalize_centroids(np.asarray(init, dtype=X.dtype))[:n_clusters]
+        if len(init) == n_clusters:
+            return init
+        centers: list[int] = []
+        dist = 1.0 - np.asarray(X @ init.T).max(axis=1)
+    else:
+        init = None
+        first = int(rng.integers(n) if weights is None else rng.choice(n, p=weights / weights.sum()))
+        centers = [first]
+        dist = 1.0 - _to_dense(X @ X[first].T).ravel()
+    np.clip(dist, 0.0, None, out=dist)
+
+    n_seeded = len(centers) if init is None else len(init)
+    for _ in range(n_seeded, n_clusters):
+        potential = dist if weights is None else dist * weights
+        total = potential.sum()
+        if total <= 0:
+            # every row already coincides with a centre — fall back to uniform
+            remaining = np.setdiff1d(np.arange(n), centers)
+            cand = rng.choice(remaining, size=min(n_trials, len(remaining)), replace=False)
+        else:
+            cand = rng.choice(n, size=n_trials, p=potential / total)
+        cand_dist = 1.0 - _to_dense(X @ X[cand].T)          # (n, n_trials)
+        cand_dist = np.minimum(dist[:, None], np.clip(cand_dist, 0.0, None))
+        if weights is None:
+            best = int(np.argmin(cand_dist.sum(axis=0)))
+        else:
+            best = int(np.argmin(weights @ cand_dist))
+        centers.append(int(cand[best]))
+        dist = cand_dist[:, best]
+
+    seeded = _normalize_centroids(_to_dense(X[centers]).astype(X.dtype, copy=False))
+    if init is None:
+        return seeded
+    return np.vstack([init, seeded]) if centers else init
+
+
+def _assign(X, C: np.ndarray, block_rows: int = 65536) -> tuple[np.ndarray, np.ndarray]:
+    """Nearest centroid (by cosine) and its similarity, in row blocks."""
+    n = X.shape[0]
+    labels = np.empty(n, dtype=np.int64)
+    best = np.empty(n, dtype=C.dtype)
+    for start in range(0, n, block_rows):
+        S = np.asarray(X[start:start + block_rows] @ C.T)
+        lab = S.argmax(axis=1)
+        labels[start:start + block_rows] = lab
+        best[start:start + block_rows] = S[np.arange(S.shape[0]), lab]
+    return labels, best
+
+
+# ── Full-batch spherical K-Means ───────────────────────────────────
+
+@bounded_threads
+def spherical_kmeans(
+    X,
+    n_clusters: int,
+    random_state: int = 42,
+    n_init: int = 1,
+    max_iter: int = 100,
+    tol: float = 1e-6,
+    init: np.ndarray | None = None,
+    sample_weight: np.ndarray | None = None,
+) -> ClusterFit:
+    """
+    Cluster the rows of *X* by cosine similarity.
+
+    Parameters
+    ----------
+    X            : sparse/dense matrix, shape (n_samples, n_features)
+    n_clusters   : number of clusters
+    random_state : seed — same seed, same labels
+    n_init       : independent k-means++ restarts (best objective wins)
+    max_iter     : Lloyd iteration cap per restart
+    tol          : stop when the relative objective change drops below this
+    init         : optional warm-start centroids, shape (m, n_features);
+                   if m < n_clusters the rest are seeded with k-means++.
+                   Warm starts run a single time regardless of *n_init*.
+    sample_weight : optional per-row weights, shape (n_samples,) — a row
+                   of weight w counts as w identical rows
+
+    Returns
+    -------
+    ClusterFit(labels, centroids, inertia, n_iter)
+    """
+    X = _unit_rows(X)
+    n = X.shape[0]
+    n_clusters = max(1, min(n_clusters, n))
+    rng = np.random.default_rng(random_state)
+    if init is not None:
+        n_init = 1
+    weights = _weights(sample_weight, n)
+
+    # seed every restart first, in order, so concurrent runs see the same seeds
+    seeds = [
+        _kmeans_plusplus(X, n_clusters, rng, init=init, weights=weights)
+        for _ in range(max(1, n_init))
+    ]
+    best_fit: ClusterFit | None = None
+    for fit in map_restarts(lambda C: _lloyd(X, C, max_iter, tol, weights), seeds):
+        if best_fit is None or fit.inertia < best_fit.inertia:
+            best_fit = fit
+    return best_fit
+
+
+def _lloyd(
+    X, C: np.ndarray, max_iter: int, tol: float, weights: np.ndarray | None = None
+) -> ClusterFit:
+    n_clusters = C.shape[0]
+    labels = None
+    prev_obj = np.inf
+    n_iter = 0
+
+    for n_iter in range(1, max_iter + 1):
+        new_labels, sims = _assign(X, C)
+        obj = _objective(sims, weights)
+
+        converged = labels is not None and np.array_equal(new_labels, labels)
+        labels = new_labels
+        if converged or prev_obj - obj <= tol * max(obj, 1e-12):
+            break
+        prev_obj = obj
+
+        # centroid update: sum (weighted) member rows, renormalise
+        C = _to_dense(_indicator(labels, n_clusters, X.dtype, weights) @ X)
+        counts = np.bincount(labels, minlength=n_clusters)
+        empty = np.flatnonzero(counts == 0)
+        if len(empty):
+            # re-seed empty clusters with the rows furthest from their centre
+            far = np.argsort(sims)[: len(empty)]
+            C[empty] = _to_dense(X[far])
+        C = _normalize_centroids(C)
+
+    return ClusterFit(labels, C, obj, n_iter)
+
+
+# ── Mini-batch variant ─────────────────────────────────────────────
+
+@bounded_threads
+def minibatch_spherical_kmeans(
+    X,
+    n_clusters: int,
+    random_state: int = 42,
+    batch_size: int = 1024,
+    max_iter: int = 10,
+    max_no_improvement: int = 10,
+    sample_weight: np.ndarray | None = None,
+) -> ClusterFit:
+    """
+    Mini-batch spherical K-Means for large *n*.
+
+    Each step assigns one random batch and moves every touched centroid
+    toward the batch mean with a per-centroid learning rate ``1 / count``
+    (Sculley, 2010), then re-normalises it.  Stops after *max_iter*
+    passes' worth of batches, or earlier once the smoothed batch objective
+    has not improved for *max_no_improvement* consecutive steps.
+
+    Parameters
+    ----------
+    X                  : sparse/dense matrix, shape (n_samples, n_features)
+    n_clusters         : number of clusters
+    random_state       : seed — same seed, same labels
+    batch_size         : rows per step
+    max_iter           : cap on passes over the data
+    max_no_improvement : early-stopping patience, in steps
+    sample_weight      : optional per-row weights — batches are drawn
+                         with probability proportional to weight
+
+    Returns
+    -------
+    ClusterFit(labels, centroids, inertia, n_iter)
+        ``n_iter`` counts mini-batch steps.
+    """
+    X = _unit_rows(X)
+    n = X.shape[0]
+    n_clusters = max(1, min(n_clusters, n))
+    batch_size = min(batch_size, n)
+    rng = np.random.default_rng(random_state)
+    weights = _weights(sample_weight, n)
+    p = None if weights is None else weights / weights.sum()
+
+    # seed on a sample — k-means++ over all n rows would defeat the purpose
+    init_size = min(n, max(3 * n_clusters, 3 * batch_size))
+    init_rows = np.sort(rng.choice(n, size=init_size, replace=False))
+    C = _kmeans_plusplus(
+        X[init_rows], n_clusters, rng, weights=None if weights is None else weights[init_rows]
+    )
+
+    counts = np.zeros(n_clusters, dtype=np.float64)
+    n_steps = max_iter * math.ceil(n / batch_size)
+    ewa, best_ewa, stale = None, np.inf, 0
+    alpha = min(1.0, 2.0 * batch_size / (n + 1))
+    step = 0
+
+    for step in range(1, n_steps + 1):
+        if p is None:
+            rows = rng.integers(0, n, size=batch_size)
+        else:
+            rows = rng.choice(n, size=batch_size, p=p)
+        Xb = X[rows]
+        S = np.asarray(Xb @ C.T)
+        lab = S.argmax(axis=1)
+        batch_obj = float(batch_size - S[np.arange(batch_size), lab].sum()) / batch_size
+
+        cnt = np.bincount(lab, minlength=n_clusters)
+        touched = cnt > 0
+        sums = _to_dense(_indicator(lab, n_clusters, X.dtype) @ Xb)
+        counts += cnt
+        C[touched] += (sums[touched] - cnt[touched, None] * C[touched]) / counts[touched, None]
+        C[touched] = _normalize_centroids(C[touched])
+
+        # early stopping on an exponentially-weighted batch objective
+        ewa = batch_obj if ewa is None else (1 - alpha) * ewa + alpha * batch_obj
+        if ewa < best_ewa:
+            best_ewa, stale = ewa, 0
+        else:
+            stale += 1
+            if stale >= max_no_improvement:
+                break
+
+    labels, sims = _assign(X, C)
+    return ClusterFit(labels, C, _objective(sims, weights), step)
+
+
+# ── Bisecting hierarchy ────────────────────────────────────────────
+
+class ClusterHierarchy:
+    """
+    Divisive cluster tree built by bisecting spherical K-Means.
+
+    Starting from one cluster holding every row, the cluster with the
+    largest cosine inertia is repeatedly split in two with a 2-means run.
+    Split *t* turns cluster ``parent[t]`` into itself plus a new cluster
+    *t*, so cutting the tree at k clusters just maps every later cluster
+    back to its ancestor below k — O(n), with no re-clustering.
+
+    The tree is grown lazily: ``cut(k)`` performs only the splits not
+    done yet, so asking for 30 % and then 50 % of the sentences costs one
+    build up to 50 %.
+
+    Parameters
+    ----------
+    X            : sparse/dense matrix, shape (n_samples, n_features)
+    random_state : seed — same seed, same tree
+    max_iter     : Lloyd iteration cap for each 2-means split
+    sample_weight : optional per-row weights — a row of weight w counts
+                   as w identical rows in every split and inertia
+
+    Example
+    -------
+    >>> tree = ClusterHierarchy(tfidf_matrix)
+    >>> tree.cut(5)      # labels for 5 clusters
+    >>> tree.cut(12)     # grows the tree by 7 splits, then cuts
+    """
+
+    def __init__(
+        self, X, random_state: int = 42, max_iter: int = 20, sample_weight=None
+    ) -> None:
+        self._X = _unit_rows(X)
+        self.n_samples = self._X.shape[0]
+        self._weights = _weights(sample_weight, self.n_samples)
+        self.random_state = random_state
+        self.max_iter = max_iter
+
+        self._leaf = np.zeros(self.n_samples, dtype=np.int64)  # finest labels so far
+        self._parent = [-1]                                    # parent[t] of cluster t
+        self._members = {0: np.arange(self.n_samples)}         # splittable clusters only
+        self._heap: list[tuple[float, int]] = []
+        self._push(0)
+
+    @property
+    def n_clusters(self) -> int:
+        """Number of leaves grown so far."""
+        return len(self._parent)
+
+    def _push(self, cluster: int) -> None:
+        rows = self._members[cluster]
+        if len(rows) < 2:
+            del self._members[cluster]
+            return
+        # Σ w (1 − x·μ) over unit rows with μ = s/‖s‖, s = Σ w x, is Σ w − ‖s‖
+        if self._weights is None:
+            total = np.asarray(self._X[rows].sum(axis=0)).ravel()
+            inertia = len(rows) - float(np.linalg.norm(total))
+        else:
+            w = self._weights[rows]
+            total = np.asarray(self._X[rows].T @ w).ravel()
+            inertia = float(w.sum()) - float(np.linalg.norm(total))
+        heapq.heappush(self._heap, (-inertia, cluster))
+
+    def _split_next(self) -> bool:
+        if not self._heap:
+            return False  # every cluster is a single row
+        _, cluster = heapq.heappop(self._heap)
+        rows = self._members.pop(cluster)
+        new = self.n_clusters
+
+        if len(rows) == 2:
+            side = np.array([False, True])
+        else:
+            Xs = self._X[rows]
+            if sp.issparse(Xs) and len(rows) <= 256:
+                # small clusters touch few terms — dense is much faster
+                Xs = Xs[:, np.unique(Xs.indices)].toarray()
+            rng = np.random.default_rng(self.random_state + new)
+            w = None if self._weights is None else self._weights[rows]
+            fit = _lloyd(Xs, _kmeans_plusplus(Xs, 2, rng, weights=w), self.max_iter, 1e-6, w)
+            side = fit.labels == 1
+            if side.all() or not side.any():
+                # identical rows — any split is as good as another
+                side = np.arange(len(rows)) >= len(rows) // 2
+
+        self._parent.append(cluster)
+        self._leaf[rows[side]] = new
+        self._members[cluster] = rows[~side]
+        self._members[new] = rows[side]
+        self._push(cluster)
+        self._push(new)
+        return True
+
+    def cut(self, n_clusters: int) -> np.ndarray:
+        """
+        Labels (0 … k−1) for a flat clustering into *n_clusters* groups.
+
+        Fewer groups are returned only if the input has fewer rows.
+        """
+        k = max(1, min(n_clusters, self.n_samples))
+        while self.n_clusters < k and self._split_next():
+            pass
+
+        ancestor = np.arange(self.n_clusters)
+        for t in range(k, self.n_clusters):
+            ancestor[t] = ancestor[self._parent[t]]
+        return ancestor[self._leaf]
+
+    def fit(self, n_clusters: int) -> ClusterFit:
+        """``cut(n_clusters)`` packaged as a ``ClusterFit`` like the other engines."""
+        labels = self.cut(n_clusters)
+        k = int(labels.max()) + 1
+        C = _normalize_centroids(
+            _to_dense(_indicator(labels, k, self._X.dtype, self._weights) @ self._X)
+        )
+        if sp.issparse(self._X):
+            sims = np.asarray(self._X.multiply(C[labels]).sum(axis=1)).ravel()
+        else:
+            sims = np.einsum("ij,ij->i", self._X, C[labels])
+        return ClusterFit(labels, C, _objective(sims, self._weights), self.n_clusters - 1)
@@ -0,0 +1,346 @@
+"""
+Out-of-core summarisation of files too large to load.
+
+``summarize()`` takes the whole text as one ``str`` and builds the whole
+TF-IDF matrix, so its peak memory grows with the input.
+``summarize_file()`` instead memory-maps the file and walks it in blocks,
+twice:
+
+  1. **Document frequencies** — every sentence is hashed into
+     *n_features* buckets (as in hashing mode, no vocabulary is kept) and
+     counted into one df array.  A fixed-size uniform reservoir of
+     sentences is sampled on the way.
+  2. **Score and assign** — with the global IDF known, the reservoir is
+     clustered into *k* groups (after a truncated SVD fitted on it), and
+     the file is streamed again: each sentence is weighted, scored by
+     mean TF-IDF and assigned to its nearest centroid.  Every cluster
+     keeps only its best sentence so far, so the selection state is *k*
+     slots however many sentences go past.
+
+Nothing held between blocks grows with the file: the df array is fixed
+by *n_features*, the reservoir, block size and SVD width are derived from
+*max_memory_mb*, and mapped pages already read are released back to the
+OS as the scan moves on.
+
+Usage
+-----
+    from src.streaming import summarize_file
+    result = summarize_file("transcript.txt", ratio=0.001, max_memory_mb=256)
+
+Spans in the result are offsets into ``clean_text()`` of the whole file,
+the same convention as ``summarize()``.
+"""
+
+from __future__ import annotations
+
+import codecs
+import mmap
+import os
+import re
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from src.preprocess import Segmenter, get_segmenter
+from src.summarizer import _empty_result, _summary_result, _whole_text_result
+
+if TYPE_CHECKING:
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+# ── Budget ─────────────────────────────────────────────────────────
+
+class StreamPlan(NamedTuple):
+    """Sizes ``summarize_file`` derives from its memory budget."""
+
+    block_bytes: int     # raw bytes decoded and segmented at a time
+    sample_size: int     # sentences in the clustering reservoir
+    max_columns: int     # hash buckets the SVD is fitted on
+    cluster_bytes: int   # dense rows × (k + reduce_dim) block when clustering
+    scratch_bytes: int   # per-step scratch for centroid assignment
+
+
+def plan_stream(max_memory_mb: float, reduce_dim: int = 128) -> StreamPlan:
+    """
+    Split *max_memory_mb* between the streaming stages.
+
+    The budget covers the working set, not the interpreter and the
+    libraries it has imported.  A block costs about twenty times its raw
+    size while in flight (decoded and cleaned copies, sentence strings,
+    tokens and hashed rows), so blocks get 1/64 of the budget.  The
+    randomized SVD, which holds a few ``columns × (reduce_dim + 10)``
+    matrices, gets a quarter, and clustering — whose Lloyd steps hold a
+    dense ``rows × k`` similarity block — another; the reservoir is
+    thinned to fit once *k* is known.
+    """
+    if max_memory_mb <= 0:
+        raise ValueError(f"max_memory_mb must be positive, got {max_memory_mb}")
+    budget = int(max_memory_mb * 2**20)
+    block = max(mmap.PAGESIZE, budget // 64 // mmap.PAGESIZE * mmap.PAGESIZE)
+    sample = int(np.clip(budget // 4 // 2048, 500, 200_000))
+    columns = max(1000, budget // 4 // (4 * 8 * (reduce_dim + 10)))
+    return StreamPlan(block, sample, columns, budget // 4, budget // 16)
+
+
+# ── Streaming segmentation ─────────────────────────────────────────
+
+def stream_sentences(
+    path: str | os.PathLike,
+    segmenter: str | Segmenter = "punkt",
+    block_bytes: int = 1 << 20,
+    encoding: str = "utf-8",
+) -> Iterator[tuple[np.ndarray, list[str]]]:
+    """
+    Segment a file block by block without loading it.
+
+    The file is memory-mapped and decoded incrementally; whitespace is
+    collapsed exactly as ``clean_text`` would across the whole file.  The
+    last, possibly unfinished sentence of each block is carried into the
+    next one, so sentences never break at a block edge.  A carry that
+    grows past four blocks without a boundary is emitted as is.
+
+    Parameters
+    ----------
+    path        : file to read
+    segmenter   : sentence splitter (see ``src.preprocess.get_segmenter``)
+    block_bytes : raw bytes read per step
+    encoding    : text encoding; undecodable bytes become U+FFFD
+
+    Yields
+    ------
+    spans     : int64 array, shape (m, 2) — offsets into the cleaned file
+    sentences : list[str] of length m
+    """
+    seg = get_segmenter(segmenter)
+    block_bytes = max(mmap.PAGESIZE, block_bytes // mmap.PAGESIZE * mmap.PAGESIZE)
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            _advise(mm, "MADV_SEQUENTIAL")
+            pending = ""       # cleaned text not yet emitted
+            offset = 0         # position of pending[0] in the cleaned file
+            at_space = True    # cleaned text so far ends in a space (or is empty)
+            for pos in range(0, size, block_bytes):
+                final = pos + block_bytes >= size
+                piece = _WHITESPACE.sub(" ", decoder.decode(mm[pos:pos + block_bytes], final))
+                _advise(mm, "MADV_DONTNEED", pos, min(block_bytes, size - pos))
+                if at_space and piece.startswith(" "):
+                    piece = piece[1:]
+                if piece:
+                    at_space = piece.endswith(" ")
+                    pending += piece
+
+                spans = seg.spans(pending)
+                if final or len(pending) > 4 * block_bytes:
+                    cut = len(pending)
+                elif len(spans) > 1:
+                    cut = int(spans[-1, 0])
+                    spans = spans[:-1]
+                else:
+                    continue
+                if len(spans):
+                    yield (
+                        spans.astype(np.int64) + offset,
+                        [pending[start:end] for start, end in spans.tolist()],
+                    )
+                pending = pending[cut:]
+                offset += cut
+
+
+def _advise(mm: mmap.mmap, option: str, start: int = 0, length: int | None = None) -> None:
+    """``mm.madvise`` where the platform supports it; a hint, never required."""
+    flag = getattr(mmap, option, None)
+    if flag is None or not hasattr(mm, "madvise"):
+        return
+    try:
+        if length is None:
+            mm.madvise(flag)
+        else:
+            mm.madvise(flag, start, length)
+    except OSError:
+        pass
+
+
+# ── Two-pass summarisation ─────────────────────────────────────────
+
+def summarize_file(
+    path: str | os.PathLike,
+    ratio: float = 0.3,
+    max_memory_mb: float = 256.0,
+    random_state: int = 42,
+    engine: str = "spherical",
+    segmenter: str | Segmenter = "punkt",
+    n_features: int = 2**18,
+    reduce_dim: int = 128,
+    encoding: str = "utf-8",
+) -> dict:
+    """
+    Summarise a text file of any size in bounded memory.
+
+    Same settings as hashing mode (``build_hashed_tfidf_matrix``):
+    English stop words, buckets in more than 95 % of sentences dropped,
+    sublinear TF, smooth IDF and L2-normalised rows — but with df counted
+    over the whole file in a first pass.  See the module docstring for
+    the passes.
+
+    Parameters
+    ----------
+    path          : text file to summarise
+    ratio         : fraction of the original sentences to keep; *k* is
+                    also capped at the reservoir size, so on very large
+                    files small ratios are the meaningful ones
+    max_memory_mb : working-set budget, on top of the interpreter and its
+                    imports; block size, reservoir and SVD width are
+                    derived from it (see ``plan_stream``)
+    random_state  : seed for the reservoir, SVD and clustering
+    engine        : clustering engine for the reservoir (see
+                    ``src.clustering.fit_clusters``)
+    segmenter     : sentence splitter (see ``summarize``)
+    n_features    : hash buckets for document frequencies
+    reduce_dim    : SVD components sentences are assigned in
+    encoding      : text encoding of the file
+
+    Returns
+    -------
+    dict with the same keys as ``summarize``.
+    """
+    from sklearn.decomposition import TruncatedSVD
+    from sklearn.preprocessing import normalize
+
+    from src.clustering import fit_clusters
+
+    plan = plan_stream(max_memory_mb, reduce_dim)
+    hasher = _hasher(n_features)
+
+    def sentence_blocks():
+        return stream_sentences(path, segmenter, plan.block_bytes, encoding)
+
+    # ── pass 1: document frequencies + reservoir ──────────────────
+    rng = np.random.default_rng(random_state)
+    df = np.zeros(n_features, dtype=np.int64)
+    sample: list[str] = []
+    head: list[tuple[list[int], str]] = []
+    n_sentences = 0
+    for spans, sentences in sentence_blocks():
+        counts = hasher.transform(sentences)
+        df += np.bincount(counts.indices, minlength=n_features)
+        _reservoir_update(sample, sentences, n_sentences, plan.sample_size, rng)
+        if len(head) < 3:
+            head.extend(zip(spans.tolist(), sentences))
+        n_sentences += len(sentences)
+
+    if n_sentences == 0:
+        return _empty_result()
+    if n_sentences <= 2:
+        return _whole_text_result(
+            " ".join(s for _, s in head), n_sentences, [span for span, _ in head]
+        )
+
+    idf = np.log((1 + n_sentences) / (1 + df)) + 1.0
+    idf[df > 0.95 * n_sentences] = 0.0  # max_df=0.95 — these buckets are dropped
+
+    # ── cluster the reservoir ─────────────────────────────────────
+    n_clusters = min(max(1, int(n_sentences * ratio)), len(sample))
+    limit = max(n_clusters, plan.cluster_bytes // (8 * (n_clusters + reduce_dim)))
+    if len(sample) > limit:
+        keep = np.sort(rng.choice(len(sample), size=limit, replace=False))
+        sample = [sample[i] for i in keep.tolist()]
+    X = _weigh(hasher.transform(sample), idf)
+    # keep one column even if the sample is all stop words, so shapes hold
+    columns = np.unique(X.indices) if X.nnz else np.zeros(1, dtype=X.indices.dtype)
+    if len(columns) > plan.max_columns:
+        # the buckets most sentences share; rare ones barely move a centroid
+        common = np.argsort(-df[columns], kind="stable")[:plan.max_columns]
+        columns = np.sort(columns[common])
+    del df
+    X = X[:, columns]
+    n_components = min(reduce_dim, X.shape[0] - 1, len(columns) - 1)
+    if n_components >= 2:
+        svd = TruncatedSVD(n_components, algorithm="randomized", random_state=random_state)
+        components = svd.fit(X).components_
+    else:
+        # too few distinct terms to reduce — assign in the sampled columns
+        components = np.eye(len(columns))
+    Z = normalize(np.asarray(X @ components.T), copy=False)
+    fit = fit_clusters(Z, n_clusters, random_state, engine)
+    centroids = np.asarray(fit.centroids)
+    n_clusters = centroids.shape[0]
+    # argmin ‖z − c‖² = argmax (z·c − ‖c‖²/2); for unit centroids that is cosine
+    bias = -0.5 * np.einsum("ij,ij->i", centroids, centroids)
+    step = max(1, plan.scratch_bytes // (8 * n_clusters))
+    del X, Z, sample, fit
+
+    # ── pass 2: score, assign, keep the best per cluster ──────────
+    best_score = np.full(n_clusters, -np.inf)
+    best_span = np.zeros((n_clusters, 2), dtype=np.int64)
+    best_text = [""] * n_clusters
+    for spans, sentences in sentence_blocks():
+        X = _weigh(hasher.transform(sentences), idf)
+        scores = np.asarray(X.sum(axis=1)).ravel() / n_features  # mean TF-IDF
+        Z = normalize(np.asarray(X[:, columns] @ components.T), copy=False)
+        labels = np.concatenate([
+            np.argmax(Z[i:i + step] @ centroids.T + bias, axis=1)
+            for i in range(0, len(Z), step)
+        ])
+
+        # the first top-scoring sentence of each cluster in this block
+        order = np.lexsort((np.arange(len(labels)), -scores, labels))
+        first = order[np.r_[True, labels[order][1:] != labels[order][:-1]]]
+        for i in first[scores[first] > best_score[labels[first]]].tolist():
+            c = labels[i]
+            best_score[c], best_span[c], best_text[c] = scores[i], spans[i], sentences[i]
+
+    picked = np.flatnonzero(np.isfinite(best_score))
+    picked = picked[np.argsort(best_span[picked, 0], kind="stable")]
+    return _summary_result(
+        [best_text[c] for c in picked], n_sentences, best_span[picked]
+    )
+
+
+def _hasher(n_features: int) -> HashingVectorizer:
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    return HashingVectorizer(
+        n_features=n_features,
+        stop_words="english",
+        alternate_sign=False,
+        norm=None,
+    )
+
+
+def _weigh(counts, idf: np.ndarray):
+    """Hashed counts → sublinear TF × IDF, L2-normalised rows."""
+    from sklearn.preprocessing import normalize
+
+    counts.data = np.log(counts.data) + 1.0
+    counts.data *= idf[counts.indices]
+    counts.eliminate_zeros()
+    return normalize(counts, copy=False)
+
+
+def _reservoir_update(
+    sample: list[str],
+    sentences: list[str],
+    seen: int,
+    capacity: int,
+    rng: np.random.Generator,
+) -> None:
+    """
+    Algorithm R over one block: after it, *sample* is a uniform draw of
+    ``min(capacity, seen + len(sentences))`` of all sentences so far.
+    """
+    fill = max(0, min(capacity - len(sample), len(sentences)))
+    sample.extend(sentences[:fill])
+    if fill == len(sentences):
+        return
+    positions = np.arange(seen + fill, seen + len(sentences))
+    slots = rng.integers(0, positions + 1)
+    for i in np.flatnonzero(slots < capacity).tolist():
+        sample[slots[i]] = sentences[fill + i]
@@ -10,12 +10,71 @@ This is the only module the rest of the app needs to import.
 
 from __future__ import annotations
 
-from src.preprocess import preprocess_text
-from src.feature_extraction import build_tfidf_matrix, get_sentence_scores
-from src.clustering import cluster_sentences, select_representative_sentences
+import re
+import threading
+from collections.abc import Callable
+from typing import NamedTuple
 
+import numpy as np
 
-def summarize(text: str, ratio: float = 0.3) -> dict:
+from src.cache import SummaryCache
+from src.dedup import find_near_duplicates
+from src.execution import ExecutionPolicy, use_policy
+from src.idf_store import IDFStore
+from src.preprocess import (
+    Segmenter,
+    SentenceSpans,
+    _get_stop_words,
+    clean_text,
+    get_segmenter,
+    split_sentence_spans,
+    split_sentences,
+    split_sentences_batch,
+    tokenize_sentences,
+)
+from src.feature_extraction import (
+    build_tfidf_matrix,
+    get_sentence_scores,
+    reduce_dimensions,
+    topk_similarity_graph,
+)
+from src.tracing import NULL_TRACE, Trace, NullTrace, start_trace
+from src.clustering import (
+    build_hierarchy,
+    fast_optimal_k,
+    fit_clusters,
+    select_representative_indices,
+)
+from src.ranking import rank_sentences, select_top_indices
+
+# neighbours kept per sentence in the "graph" engine's similarity graph
+GRAPH_NEIGHBOURS = 10
+
+# part of every cache key — bump when the result dict changes shape so
+# results persisted by older versions are recomputed, not served
+RESULT_VERSION = 3
+
+# trace key for ``ClusterFit.n_iter`` on engines where it is not a count of
+# Lloyd iterations
+_ITERATION_KEYS = {"minibatch": "minibatch_steps", "bisecting": "bisect_splits"}
+
+
+def summarize(
+    text: str,
+    ratio: float | str = 0.3,
+    random_state: int = 42,
+    engine: str = "kmeans",
+    segmenter: str | Segmenter = "punkt",
+    cache: SummaryCache | None = None,
+    trace: bool | Callable[[dict], None] = False,
+    hash_features: int | None = None,
+    idf_model: IDFStore | None = None,
+    reduce_dim: int | None = None,
+    dtype: str | np.dtype = "float64",
+    max_memory_mb: float | None = None,
+    policy: ExecutionPolicy | None = None,
+    dedup_threshold: float | None = None,
+) -> dict:
     """
     Produce an extractive summary of *text*.
 
@@ -34,6 +93,57 @@ def summarize(text: str, ratio: float = 0.3) -> dict:
     ratio : float, default 0.3
         Fraction of original sentences to keep (0.0 – 1.0).
         For example, 0.3 means "keep roughly 30 % of sentences".
+        Pass "auto" to let the elbow heuristic pick the number of
+        sentences (see ``src.clustering.fast_optimal_k``).
+    random_state : int, default 42
+        Seed for the clustering step.
+    engine : str, default "kmeans"
+        Clustering engine — "kmeans", "spherical", "minibatch" or
+        "bisecting" (see ``src.clustering.fit_clusters``) — or "graph" to rank
+        sentences by TextRank centrality instead (see ``src.ranking``).
+    segmenter : str or Segmenter, default "punkt"
+        Sentence splitter — "punkt", "regex" for trusted well-formed
+        text, or any ``src.preprocess.Segmenter`` instance.
+    cache : SummaryCache, optional
+        If given, results are looked up by a hash of the cleaned text and
+        the options above, and only computed on a miss.
+    trace : bool or callable, default False
+        If True (or a callback), record per-stage wall times and size
+        metrics and return them under ``timings``; a callback is also
+        called with that dict.  Hooks added with
+        ``src.tracing.register_hook`` switch this on for every call.
+    hash_features : int, optional
+        Hash terms into this many TF-IDF columns instead of building a
+        vocabulary — bounded memory on huge, noisy inputs (see
+        ``src.feature_extraction.build_hashed_tfidf_matrix``).
+    idf_model : IDFStore, optional
+        Corpus-level IDF to weight terms with instead of IDF fitted on
+        this document alone — steadier weights for short inputs (see
+        ``src.idf_store``).
+    reduce_dim : int, optional
+        Cluster on this many truncated-SVD components instead of the full
+        TF-IDF width — cheaper distances on wide technical vocabularies
+        (see ``src.feature_extraction.reduce_dimensions``).  Sentence
+        scores still come from the full matrix; ignored by "graph".
+    dtype : "float64" or "float32", default "float64"
+        Value type used end to end — TF-IDF, scores, centroids and the
+        similarity graph.  float32 halves memory and bandwidth.
+    max_memory_mb : float, optional
+        Budget for the numeric stages.  If the projected footprint of the
+        options above goes over it, cheaper settings are substituted —
+        float32, then a 128-dimension reduction, then the "graph" engine
+        (see ``plan_memory``).  The choice is reported under ``timings``
+        when tracing.
+    policy : ExecutionPolicy, optional
+        Native threads per clustering / similarity call and concurrent
+        K-Means restarts for this call, instead of the process policy
+        (see ``src.execution``).  Results do not depend on it.
+    dedup_threshold : float, optional
+        Collapse sentences whose word-bigram Jaccard similarity is at least
+        this (e.g. 0.8) before TF-IDF, using MinHash / LSH (see
+        ``src.dedup``).  Only the first sentence of each group is
+        clustered, weighted by the group's size, and *ratio* applies to
+        the distinct sentences.
 
     Returns
     -------
@@ -42,45 +152,606 @@ def summarize(text: str, ratio: float = 0.3) -> dict:
         original_sentence_count: int   — sentences in the input
         summary_sentence_count : int   — sentences in the summary
         compression_ratio      : float — summary / original (lower = more compressed)
+        spans                  : list  — ``[start, end]`` of each summary
+                                         sentence in ``clean_text(text)``
+        collapsed_sentence_count: int  — near-duplicates folded into an
+                                         earlier sentence (0 unless
+                                         *dedup_threshold* is set)
+        timings                : dict  — only when tracing (see ``src.tracing``)
     """
     # ── guard: empty or near-empty input ──────────────────────────
     if not text or not text.strip():
         return _empty_result()
+    dtype = _float_dtype(dtype)
+
+    tracer = start_trace(trace)
+    with tracer.stage("clean"):
+        cleaned = clean_text(text)
+
+    computed = False
 
-    cleaned, sentences = preprocess_text(text)
+    def compute() -> dict:
+        nonlocal computed
+        computed = True
+        with use_policy(policy):
+            return _summarize_cleaned(
+                cleaned, ratio, random_state, engine, segmenter, tracer,
+                hash_features, idf_model, reduce_dim, dtype, max_memory_mb,
+                dedup_threshold,
+            )
+
+    if cache is None:
+        result = compute()
+    else:
+        key = cache.make_key(
+            cleaned,
+            ratio=ratio,
+            random_state=random_state,
+            engine=engine,
+            segmenter=_segmenter_key(segmenter),
+            hash_features=hash_features,
+            idf_model=idf_model.fingerprint() if idf_model is not None else None,
+            reduce_dim=reduce_dim,
+            dtype=dtype.name,
+            max_memory_mb=max_memory_mb,
+            dedup_threshold=dedup_threshold,
+            result_version=RESULT_VERSION,
+        )
+        with tracer.stage("cache"):
+            result = cache.get_or_compute(key, compute)
+        tracer.record(cache_hit=not computed)
+
+    return tracer.finish(result)
+
+
+def _summarize_cleaned(
+    cleaned: str,
+    ratio: float | str,
+    random_state: int,
+    engine: str,
+    segmenter: str | Segmenter = "punkt",
+    tracer: Trace | NullTrace = NULL_TRACE,
+    hash_features: int | None = None,
+    idf_model: IDFStore | None = None,
+    reduce_dim: int | None = None,
+    dtype: np.dtype = np.dtype(np.float64),
+    max_memory_mb: float | None = None,
+    dedup_threshold: float | None = None,
+) -> dict:
+    """Run the pipeline on already-cleaned text (the cacheable part)."""
+    # sentences are offsets into *cleaned*; only the summary's are copied out
+    with tracer.stage("segment"):
+        sentences = split_sentence_spans(cleaned, segmenter)
+    tracer.record(sentence_count=len(sentences))
 
     # if there are only a couple of sentences, just return the whole thing
     if len(sentences) <= 2:
-        return {
-            "summary": cleaned,
-            "original_sentence_count": len(sentences),
-            "summary_sentence_count": len(sentences),
-            "compression_ratio": 1.0,
-        }
+        return _whole_text_result(cleaned, len(sentences), sentences.spans)
+
+    # ── feature extraction (tokenized once, shared downstream) ────
+    tokens = None
+    if hash_features is None or dedup_threshold is not None:
+        with tracer.stage("tokenize"):
+            tokens = tokenize_sentences(sentences)
+        tracer.record(token_count=len(tokens.ids))
+
+    # ── near-duplicates: cluster one sentence per group, weighted ─
+    n_sentences, collapsed, weights = len(sentences), 0, None
+    if dedup_threshold is not None:
+        with tracer.stage("dedup"):
+            groups = find_near_duplicates(tokens, dedup_threshold, random_state=random_state)
+        collapsed = groups.n_collapsed
+        tracer.record(duplicate_groups=len(groups.representatives), collapsed_sentences=collapsed)
+        if collapsed:
+            sentences = SentenceSpans(cleaned, sentences.spans[groups.representatives])
+            tokens = tokens.take(groups.representatives)
+            weights = groups.weights
+        if len(sentences) <= 2:
+            # nothing left to choose between — keep every distinct sentence
+            return _summary_result(list(sentences), n_sentences, sentences.spans, collapsed)
+        if hash_features is not None:
+            tokens = None
+
+    with tracer.stage("tfidf"):
+        tfidf_matrix, _vectorizer = build_tfidf_matrix(
+            sentences, n_features=hash_features, idf_model=idf_model, dtype=dtype, tokens=tokens
+        )
+    if tracer.enabled:
+        tracer.record(vocabulary_size=tfidf_matrix.shape[1], nnz=int(tfidf_matrix.nnz))
+
+    # ── memory budget: fall back to cheaper settings if needed ────
+    graph_memory_mb = 256.0
+    if max_memory_mb is not None:
+        n_target = len(sentences) // 2 if ratio == "auto" else max(1, int(len(sentences) * ratio))
+        plan = plan_memory(
+            len(sentences), tfidf_matrix.shape[1], tfidf_matrix.nnz, n_target,
+            max_memory_mb, engine=engine, dtype=dtype, reduce_dim=reduce_dim,
+        )
+        dtype, engine, reduce_dim, graph_memory_mb = (
+            plan.dtype, plan.engine, plan.reduce_dim, plan.graph_memory_mb
+        )
+        tfidf_matrix = tfidf_matrix.astype(dtype, copy=False)
+        tracer.record(memory_plan={
+            "dtype": dtype.name, "engine": engine, "reduce_dim": reduce_dim,
+            "projected_mb": round(plan.projected_mb, 1), "budget_mb": max_memory_mb,
+        })
+
+    with tracer.stage("scores"):
+        scores = get_sentence_scores(tfidf_matrix)
+
+    # ── optional reduction: cluster on a compact dense projection ─
+    features = tfidf_matrix
+    if reduce_dim is not None and engine != "graph":
+        with tracer.stage("reduce"):
+            features = reduce_dimensions(tfidf_matrix, reduce_dim, random_state=random_state)
+        tracer.record(reduced_dimensions=features.shape[1])
 
     # ── determine how many clusters / summary sentences we want ──
-    n_clusters = max(1, int(len(sentences) * ratio))
+    if ratio == "auto":
+        with tracer.stage("auto_k"):
+            n_clusters = fast_optimal_k(features, random_state=random_state)
+    else:
+        n_clusters = max(1, int(len(sentences) * ratio))
     n_clusters = min(n_clusters, len(sentences))
 
-    # ── feature extraction ────────────────────────────────────────
-    tfidf_matrix, _vectorizer = build_tfidf_matrix(sentences)
+    # ── clustering (or graph ranking) + selection ─────────────────
+    selected = _pick_indices(
+        features, scores, n_clusters, engine, random_state, tracer, graph_memory_mb, weights
+    )
+
+    return _summary_result(
+        [sentences[i] for i in selected], n_sentences, sentences.spans[selected], collapsed
+    )
+
+
+# ── Memory budget ──────────────────────────────────────────────────
+
+class MemoryPlan(NamedTuple):
+    """Settings chosen by ``plan_memory``."""
+
+    dtype: np.dtype
+    engine: str
+    reduce_dim: int | None
+    graph_memory_mb: float   # block budget for the similarity graph
+    projected_mb: float      # estimated peak of the numeric stages
+
+
+def estimate_memory_mb(
+    n_sentences: int,
+    n_features: int,
+    nnz: int,
+    n_clusters: int,
+    engine: str = "kmeans",
+    dtype: str | np.dtype = "float64",
+    reduce_dim: int | None = None,
+    graph_memory_mb: float = 256.0,
+) -> float:
+    """
+    Rough peak memory, in MB, of TF-IDF onwards for one document.
+
+    Counts the CSR matrix (plus the normalised copy the cosine engines
+    make), the dense projection if *reduce_dim* is set, and the engine's
+    working set: a few dense ``k × width`` centroid arrays and an
+    ``n × k`` assignment block for the clustering engines, or the
+    similarity blocks and the top-k graph for "graph".  An estimate for
+    choosing settings, not a guarantee.
+    """
+    item = _float_dtype(dtype).itemsize
+    n, k = n_sentences, max(1, n_clusters)
+    csr = nnz * (item + 4) + (n + 1) * 4
+    total = csr
+
+    if engine == "graph":
+        blocks = min(graph_memory_mb * 2**20, n * n * (2 * item + 4))
+        edges = n * min(GRAPH_NEIGHBOURS, n) * (item + 12) * 3  # COO build, symmetrise, transpose
+        return (total + csr + blocks + edges) / 2**20
+
+    width = n_features
+    if reduce_dim is not None:
+        width = min(reduce_dim, n_features)
+        # projection output + randomized-SVD range finder on both sides
+        total += n * width * item + 2 * (n + n_features) * (width + 10) * item
+    else:
+        total += csr  # unit-row copy
+    total += 4 * k * width * item + min(n, 65536) * k * item
+    return total / 2**20
+
+
+def plan_memory(
+    n_sentences: int,
+    n_features: int,
+    nnz: int,
+    n_clusters: int,
+    max_memory_mb: float,
+    engine: str = "kmeans",
+    dtype: str | np.dtype = "float64",
+    reduce_dim: int | None = None,
+) -> MemoryPlan:
+    """
+    Cheapest-change settings whose projected footprint fits *max_memory_mb*.
+
+    Tries, in order: the settings as given; float32; float32 with a
+    128-dimension reduction (clustering engines only); float32 with the
+    "graph" engine, whose similarity blocks are sized to what is left of
+    the budget.  If nothing fits, the last option is returned — its
+    footprint grows only linearly with the sentence count.
+    """
+    f32 = np.dtype(np.float32)
+    candidates = [(_float_dtype(dtype), engine, reduce_dim), (f32, engine, reduce_dim)]
+    if engine != "graph":
+        candidates.append((f32, engine, min(reduce_dim or 128, 128)))
+    candidates.append((f32, "graph", None))
+
+    for cand_dtype, cand_engine, cand_dim in candidates:
+        graph_mb = 256.0
+        if cand_engine == "graph":
+            fixed = estimate_memory_mb(
+                n_sentences, n_features, nnz, n_clusters, "graph", cand_dtype, graph_memory_mb=0.0
+            )
+            graph_mb = max(1.0, min(256.0, max_memory_mb - fixed))
+        projected = estimate_memory_mb(
+            n_sentences, n_features, nnz, n_clusters, cand_engine, cand_dtype, cand_dim, graph_mb
+        )
+        if projected <= max_memory_mb:
+            break
+    return MemoryPlan(cand_dtype, cand_engine, cand_dim, graph_mb, projected)
+
+
+def _float_dtype(dtype: str | np.dtype) -> np.dtype:
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"dtype must be float32 or float64, got {dtype}")
+    return dtype
+
+
+# ── Prepared documents (interactive ratio changes) ─────────────────
+
+class PreparedDocument:
+    """
+    A document taken through every ratio-independent stage once.
+
+    Cleaning, segmentation, TF-IDF, scoring and the cluster hierarchy do
+    not depend on the summary length, so an interactive caller (the
+    ratio slider in ``app.py``) prepares the document once and then calls
+    ``summarize(ratio)`` as often as it likes.
+
+    With the default ``engine="bisecting"`` each call only cuts the
+    bisecting hierarchy and picks representatives.  Any other engine
+    gives exactly ``summarize(text, ratio, engine=engine)``: it reuses
+    the prepared features but fits afresh for each new k (fits are kept
+    per k).
+
+    Example
+    -------
+    >>> doc = PreparedDocument(text)
+    >>> doc.summarize(0.3)
+    >>> doc.summarize(0.5)   # no re-clustering
+    """
+
+    def __init__(
+        self,
+        text: str,
+        random_state: int = 42,
+        segmenter: str | Segmenter = "punkt",
+        hash_features: int | None = None,
+        idf_model: IDFStore | None = None,
+        reduce_dim: int | None = None,
+        engine: str = "bisecting",
+    ) -> None:
+        self.random_state = random_state
+        self.engine = engine
+        self.cleaned = clean_text(text) if text and text.strip() else ""
+        self.sentences = split_sentence_spans(self.cleaned, segmenter)
+        self._lock = threading.Lock()  # the hierarchy grows on demand
+        self._features = self._scores = self._hierarchy = None
+        self._picks: dict[int, list[int]] = {}  # k -> selection, non-bisecting engines
+        if len(self.sentences) > 2:
+            tokens = tokenize_sentences(self.sentences) if hash_features is None else None
+            tfidf_matrix, _vectorizer = build_tfidf_matrix(
+                self.sentences, n_features=hash_features, idf_model=idf_model, tokens=tokens
+            )
+            self._scores = get_sentence_scores(tfidf_matrix)
+            self._features = tfidf_matrix
+            if reduce_dim is not None and engine != "graph":
+                self._features = reduce_dimensions(
+                    tfidf_matrix, reduce_dim, random_state=random_state
+                )
+            if engine == "bisecting":
+                self._hierarchy = build_hierarchy(self._features, random_state=random_state)
+
+    def summarize(self, ratio: float | str = 0.3) -> dict:
+        """Summary at *ratio* — same result keys as ``summarize()``."""
+        if not self.sentences:
+            return _empty_result()
+        if len(self.sentences) <= 2:
+            return _whole_text_result(self.cleaned, len(self.sentences), self.sentences.spans)
+
+        if ratio == "auto":
+            n_clusters = fast_optimal_k(self._features, random_state=self.random_state)
+        else:
+            n_clusters = max(1, int(len(self.sentences) * ratio))
+        n_clusters = min(n_clusters, len(self.sentences))
+
+        with self._lock:
+            if self._hierarchy is not None:
+                selected = select_representative_indices(
+                    self._hierarchy, self._scores, n_clusters=n_clusters
+                )
+            elif n_clusters in self._picks:
+                selected = self._picks[n_clusters]
+            else:
+                selected = self._picks[n_clusters] = _pick_indices(
+                    self._features, self._scores, n_clusters, self.engine, self.random_state
+                )
+        return _summary_result(
+            [self.sentences[i] for i in selected], len(self.sentences), self.sentences.spans[selected]
+        )
+
+
+# ── Warm-up ────────────────────────────────────────────────────────
+
+def warmup(
+    segmenter: str | Segmenter = "punkt",
+    engines: tuple[str, ...] = ("kmeans",),
+) -> None:
+    """
+    Pay the one-off start-up costs now instead of on the first request.
+
+    Importing this package is deliberately cheap — scikit-learn, SciPy
+    and NLTK load on first use.  Call ``warmup()`` once at process start
+    (a worker initializer, a Streamlit ``cache_resource``) to import them,
+    load the sentence segmenter and stopword list, and run a tiny
+    pipeline through each clustering *engine* you plan to use.
+    """
+    sentences = get_segmenter(segmenter).split(
+        "Warm-up text for the summariser. It has a few short sentences. "
+        "Each one is split, vectorised and clustered once."
+    )
+    if get_segmenter(segmenter).name == "punkt":
+        _get_stop_words()
+
+    tfidf_matrix, _vectorizer = build_tfidf_matrix(sentences, tokens=tokenize_sentences(sentences))
+    scores = get_sentence_scores(tfidf_matrix)
+    for engine in engines:
+        _pick_indices(tfidf_matrix, scores, 2, engine, random_state=42)
+
+
+# ── Long-document (map-reduce) mode ────────────────────────────────
+
+def summarize_long(
+    text: str,
+    ratio: float = 0.3,
+    chunk_size: int = 500,
+    workers: int | None = None,
+    split: str = "sections",
+    oversample: float = 2.0,
+    random_state: int = 42,
+    engine: str = "kmeans",
+    segmenter: str | Segmenter = "punkt",
+) -> dict:
+    """
+    Summarise a very long document hierarchically.
+
+    One global TF-IDF + K-Means over tens of thousands of sentences is
+    slow and its memory grows with the document.  Instead:
+
+      1. **Split** the text into chunks of at most *chunk_size* sentences
+         — either paragraph-aligned sections or fixed sentence windows.
+      2. **Map** — summarise every chunk independently (in parallel
+         worker processes), keeping ``oversample × ratio`` of each so
+         the next pass has candidates to choose from.
+      3. **Reduce** — concatenate the chunk summaries in document order
+         and repeat until everything fits in one chunk, then run a final
+         pass that keeps exactly ``ratio × n_sentences`` sentences.
+
+    Only *chunk_size* sentences per worker are ever vectorised at once,
+    so peak memory is bounded by the chunk size and fan-out rather than
+    the document length.
+
+    Parameters
+    ----------
+    text         : raw input text
+    ratio        : fraction of the original sentences to keep
+    chunk_size   : maximum sentences per map task
+    workers      : worker processes for the map passes (fan-out)
+    split        : "sections" (pack blank-line separated paragraphs into
+                   chunks) or "windows" (fixed-size sentence windows)
+    oversample   : how many more candidates than needed each map pass keeps
+    random_state : seed for clustering
+    engine       : clustering engine (see ``src.clustering.fit_clusters``)
+    segmenter    : sentence splitter (see ``summarize``)
+
+    Returns
+    -------
+    dict with the same keys as ``summarize``.
+    """
+    from src.batch import default_workers, imap, pool_policy, worker_initializer
+
+    if not text or not text.strip():
+        return _empty_result()
+    if split not in ("sections", "windows"):
+        raise ValueError(f"split must be 'sections' or 'windows', got {split!r}")
+
+    if split == "sections":
+        chunks = _section_chunks(text, chunk_size, segmenter)
+    else:
+        sentences = split_sentences(clean_text(text), segmenter)
+        chunks = [sentences[i:i + chunk_size] for i in range(0, len(sentences), chunk_size)]
+
+    n_sentences = sum(len(c) for c in chunks)
+    if n_sentences <= 2:
+        return _summarize_cleaned(clean_text(text), ratio, random_state, engine, segmenter)
+
+    target = min(max(1, int(n_sentences * ratio)), n_sentences)
+
+    candidates = n_sentences
+    while len(chunks) > 1 and target * oversample < candidates:
+        keep = min(1.0, target * oversample / candidates)
+        tasks = ((chunk, max(1, round(len(chunk) * keep))) for chunk in chunks)
+        survivors: list[str] = []
+        for _, picked in imap(
+            _summarize_chunk,
+            tasks,
+            workers=workers,
+            initializer=worker_initializer(
+                segmenter, engine, pool_policy(workers or default_workers())
+            ),
+            random_state=random_state,
+            engine=engine,
+        ):
+            survivors.extend(picked)
+        if len(survivors) >= candidates:
+            break  # chunks too small to shrink any further
+        candidates = len(survivors)
+        chunks = [survivors[i:i + chunk_size] for i in range(0, candidates, chunk_size)]
+
+    survivors = [s for chunk in chunks for s in chunk]
+    summary_sentences = _summarize_chunk((survivors, target), random_state, engine)
+
+    return _summary_result(
+        summary_sentences, n_sentences, _locate_spans(clean_text(text), summary_sentences)
+    )
+
+
+def _section_chunks(
+    text: str,
+    chunk_size: int,
+    segmenter: str | Segmenter = "punkt",
+) -> list[list[str]]:
+    """
+    Split *text* on blank lines and pack consecutive paragraphs into
+    chunks of at most *chunk_size* sentences.  A paragraph longer than
+    that is cut into fixed windows.
+    """
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    paragraphs = [clean_text(p) for p in re.split(r"\n\s*\n", text)]
+    for sentences in split_sentences_batch(paragraphs, segmenter):
+        if not sentences:
+            continue
+        if len(current) + len(sentences) > chunk_size and current:
+            chunks.append(current)
+            current = []
+        while len(sentences) > chunk_size:
+            chunks.append(sentences[:chunk_size])
+            sentences = sentences[chunk_size:]
+        current.extend(sentences)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _summarize_chunk(
+    task: tuple[list[str], int],
+    random_state: int = 42,
+    engine: str = "kmeans",
+) -> list[str]:
+    """Map step: keep *n_keep* representative sentences of one chunk."""
+    sentences, n_keep = task
+    if n_keep >= len(sentences) or len(sentences) <= 2:
+        return list(sentences)
+
+    tfidf_matrix, _vectorizer = build_tfidf_matrix(sentences, tokens=tokenize_sentences(sentences))
     scores = get_sentence_scores(tfidf_matrix)
+    selected = _pick_indices(tfidf_matrix, scores, n_keep, engine, random_state)
+    return [sentences[i] for i in selected]
 
-    # ── clustering + representative selection ─────────────────────
-    labels = cluster_sentences(tfidf_matrix, n_clusters)
-    summary_sentences = select_representative_sentences(sentences, labels, scores)
 
-    summary_text = " ".join(summary_sentences)
+def _pick_indices(
+    tfidf_matrix,
+    scores,
+    n_select: int,
+    engine: str,
+    random_state: int,
+    tracer: Trace | NullTrace = NULL_TRACE,
+    graph_memory_mb: float = 256.0,
+    weights: np.ndarray | None = None,
+) -> list[int]:
+    """
+    Positions of *n_select* sentences chosen by *engine*, in document order.
+
+    "graph" ranks sentences by TextRank centrality over a sparse top-k
+    similarity graph; every other engine clusters and keeps the
+    highest-scoring member of each cluster.  Optional per-sentence
+    *weights* (near-duplicate group sizes) weight the clustering or
+    PageRank's teleport distribution.
+    """
+    if engine == "graph":
+        with tracer.stage("graph"):
+            graph = topk_similarity_graph(
+                tfidf_matrix, k=GRAPH_NEIGHBOURS, memory_budget_mb=graph_memory_mb
+            )
+        with tracer.stage("rank"):
+            ranked = rank_sentences(graph, weights=weights)
+        tracer.record(n_clusters=n_select, rank_iterations=ranked.n_iter, graph_edges=graph.nnz)
+        with tracer.stage("select"):
+            return select_top_indices(ranked.scores, n_select)
+
+    with tracer.stage("cluster"):
+        fit = fit_clusters(
+            tfidf_matrix, n_select, random_state=random_state, engine=engine,
+            sample_weight=weights,
+        )
+    iteration_key = _ITERATION_KEYS.get(engine, "kmeans_iterations")
+    tracer.record(n_clusters=n_select, **{iteration_key: fit.n_iter})
+    with tracer.stage("select"):
+        return select_representative_indices(fit.labels, scores)
+
+
+# ── helpers ────────────────────────────────────────────────────────
 
+def _segmenter_key(segmenter: str | Segmenter) -> str:
+    """
+    Cache-key identity of a segmenter: its class and ``name``.
+
+    ``name`` alone is inherited ("base") by custom segmenters that do not
+    set one, so two unrelated classes would share cache entries.
+    """
+    instance = get_segmenter(segmenter)
+    cls = type(instance)
+    return f"{cls.__module__}.{cls.__qualname__}:{instance.name}"
+
+
+def _summary_result(
+    summary_sentences: list[str], n_sentences: int, spans, collapsed: int = 0
+) -> dict:
     return {
-        "summary": summary_text,
-        "original_sentence_count": len(sentences),
+        "summary": " ".join(summary_sentences),
+        "original_sentence_count": n_sentences,
         "summary_sentence_count": len(summary_sentences),
-        "compression_ratio": round(len(summary_sentences) / len(sentences), 2),
+        "compression_ratio": round(len(summary_sentences) / n_sentences, 2),
+        "spans": np.asarray(spans, dtype=np.int64).reshape(-1, 2).tolist(),
+        "collapsed_sentence_count": collapsed,
     }
 
 
-# ── helpers ────────────────────────────────────────────────────────
+def _whole_text_result(cleaned: str, n_sentences: int, spans) -> dict:
+    """Too short to summarise — the summary is the whole text."""
+    return {
+        "summary": cleaned,
+        "original_sentence_count": n_sentences,
+        "summary_sentence_count": n_sentences,
+        "compression_ratio": 1.0,
+        "spans": np.asarray(spans, dtype=np.int64).reshape(-1, 2).tolist(),
+        "collapsed_sentence_count": 0,
+    }
+
+
+def _locate_spans(cleaned: str, sentences: list[str]) -> np.ndarray:
+    """
+    Offsets of *sentences* (in document order) in *cleaned*, for paths
+    that segment piecewise and only hold the sentence strings.
+    """
+    spans = np.empty((len(sentences), 2), dtype=np.int64)
+    pos = 0
+    for i, sentence in enumerate(sentences):
+        start = cleaned.find(sentence, pos)
+        if start < 0:
+            raise ValueError(f"sentence {i} not found in the cleaned text")
+        pos = start + len(sentence)
+        spans[i] = start, pos
+    return spans
+
 
 def _empty_result() -> dict:
     """Return a safe default when there's nothing to summarise."""
@@ -89,4 +760,6 @@ def _empty_result() -> dict:
         "original_sentence_count": 0,
         "summary_sentence_count": 0,
         "compression_ratio": 0.0,
+        "spans": [],
+        "collapsed_sentence_count": 0,
     }
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""Tests for ``src.batch.imap``."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from src.batch import imap
+
+
+def _square(x: int, delay: float = 0.0) -> int:
+    # the first item is slow, so later results finish out of order
+    if x == 0:
+        time.sleep(delay)
+    return x * x
+
+
+@pytest.mark.parametrize("workers, chunksize", [(1, 1), (2, 1), (2, 3)])
+def test_ordered_results_follow_input(workers, chunksize):
+    out = list(imap(
+        _square, range(20), workers=workers, chunksize=chunksize,
+        initializer=None, delay=0.2,
+    ))
+
+    assert out == [(i, i * i) for i in range(20)]
+
+
+def test_unordered_yields_every_item_once():
+    out = list(imap(
+        _square, range(20), workers=2, chunksize=2, ordered=False,
+        initializer=None, delay=0.2,
+    ))
+
+    assert sorted(out) == [(i, i * i) for i in range(20)]
+    assert out[0][0] != 0  # the slow first batch did not hold the rest back
+
+
+@pytest.mark.parametrize("chunksize", [1, 2])
+def test_max_pending_bounds_reads_behind_slow_batch(chunksize):
+    consumed = []
+
+    def items():
+        for i in range(200):
+            consumed.append(i)
+            yield i
+
+    results = imap(
+        _square, items(), workers=2, chunksize=chunksize, max_pending=3,
+        initializer=None, delay=0.5,
+    )
+    first = next(results)
+    read_before_first = len(consumed)
+    rest = list(results)
+
+    assert first == (0, 0)
+    assert read_before_first <= 3 * chunksize
+    assert len(rest) == 199
+
+
+def test_chunksize_must_be_positive():
+    with pytest.raises(ValueError):
+        list(imap(_square, range(3), workers=2, chunksize=0, initializer=None))
@@ -0,0 +1,121 @@
+"""Tests for ``src.cache.SummaryCache`` and how ``summarize`` keys it."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from src.cache import SummaryCache
+from src.preprocess import Segmenter
+from src.summarizer import summarize
+
+TEXT = (
+    "Cells divide by mitosis. Mitosis has four phases. Stars burn hydrogen. "
+    "Hydrogen fuses into helium. Rivers carve valleys. Valleys widen over time."
+)
+
+
+def _result(i: int) -> dict:
+    return {"summary": f"result {i}", "spans": [[0, i]]}
+
+
+def test_single_flight():
+    cache = SummaryCache()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return _result(1)
+
+    results = []
+    owner = threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+    owner.start()
+    started.wait(5)
+    waiters = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+        for _ in range(4)
+    ]
+    for t in waiters:
+        t.start()
+    while cache.stats()["shared"] < 4:
+        time.sleep(0.001)
+    release.set()
+    for t in [owner, *waiters]:
+        t.join(5)
+
+    assert len(calls) == 1
+    assert results == [_result(1)] * 5
+    assert cache.stats()["misses"] == 1
+
+
+def test_failed_computation_is_not_cached():
+    cache = SummaryCache()
+
+    def boom():
+        raise RuntimeError("boom")
+
+    try:
+        cache.get_or_compute("k", boom)
+    except RuntimeError:
+        pass
+
+    assert cache.get_or_compute("k", lambda: _result(2)) == _result(2)
+
+
+def test_memory_lru_eviction():
+    cache = SummaryCache(max_entries=2)
+    cache.get_or_compute("a", lambda: _result(1))
+    cache.get_or_compute("b", lambda: _result(2))
+    cache.get_or_compute("a", lambda: _result(0))  # hit: "a" becomes most recent
+    cache.get_or_compute("c", lambda: _result(3))  # evicts "b"
+
+    assert cache.get_or_compute("a", lambda: _result(0)) == _result(1)
+    assert cache.get_or_compute("b", lambda: _result(9)) == _result(9)
+    assert cache.stats()["memory_entries"] == 2
+
+
+def test_results_are_copies():
+    cache = SummaryCache()
+    first = cache.get_or_compute("k", lambda: _result(1))
+    first["spans"].append([5, 6])
+
+    assert cache.get_or_compute("k", lambda: _result(0)) == _result(1)
+
+
+def test_disk_tier_is_shared_and_evicts_lru(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    writer = SummaryCache(max_entries=0, path=path, max_disk_bytes=130)
+    for key in "abc":  # each payload is ~40 bytes
+        writer.get_or_compute(key, lambda key=key: {"summary": key * 20})
+        time.sleep(0.01)
+    writer.get_or_compute("a", lambda: {"summary": "recomputed"})  # touch "a"
+    time.sleep(0.01)
+    writer.get_or_compute("d", lambda: {"summary": "d" * 20})  # evicts "b"
+
+    reader = SummaryCache(path=path)
+    assert reader.get_or_compute("a", lambda: {"summary": "miss"}) == {"summary": "a" * 20}
+    assert reader.get_or_compute("b", lambda: {"summary": "miss"}) == {"summary": "miss"}
+    assert reader.stats()["disk_hits"] == 1
+    assert writer.stats()["disk_bytes"] <= 130
+
+
+class _Lines(Segmenter):
+    def split(self, text):
+        return [s for s in text.split(". ") if s]
+
+
+class _Words(Segmenter):
+    def split(self, text):
+        return text.split()
+
+
+def test_anonymous_custom_segmenters_do_not_share_entries():
+    cache = SummaryCache()
+    by_line = summarize(TEXT, 0.5, segmenter=_Lines(), engine="spherical", cache=cache)
+    by_word = summarize(TEXT, 0.5, segmenter=_Words(), engine="spherical", cache=cache)
+
+    assert cache.stats()["misses"] == 2
+    assert by_word["original_sentence_count"] != by_line["original_sentence_count"]
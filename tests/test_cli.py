@@ -0,0 +1,65 @@
+"""Tests for ``python -m src`` resume handling."""
+
+from __future__ import annotations
+
+import json
+
+from src.__main__ import completed_ids, main
+
+TEXT = (
+    "Cells divide by mitosis. Mitosis has four phases. Stars burn hydrogen. "
+    "Hydrogen fuses into helium. Rivers carve valleys. Valleys widen over time."
+)
+
+
+def _write(path, lines: list[str]) -> None:
+    path.write_text("".join(lines), encoding="utf-8")
+
+
+def test_completed_ids_truncates_torn_line(tmp_path):
+    out = tmp_path / "out.jsonl"
+    good = json.dumps({"id": "a", "summary": "x"}) + "\n"
+    _write(out, [good, '{"id": "b", "summ'])
+
+    assert completed_ids(str(out)) == {"a"}
+    assert out.read_text(encoding="utf-8") == good
+
+
+def test_completed_ids_retries_errors(tmp_path):
+    out = tmp_path / "out.jsonl"
+    _write(out, [
+        json.dumps({"id": "a", "summary": "x"}) + "\n",
+        json.dumps({"id": "b", "error": "ValueError: boom"}) + "\n",
+        json.dumps({"id": 3, "summary": "y"}) + "\n",
+    ])
+
+    assert completed_ids(str(out)) == {"a", "3"}
+
+
+def test_completed_ids_missing_file(tmp_path):
+    assert completed_ids(str(tmp_path / "absent.jsonl")) == set()
+
+
+def test_resume_summarises_only_unfinished_records(tmp_path):
+    source = tmp_path / "in.jsonl"
+    _write(source, [json.dumps({"id": i, "text": TEXT}) + "\n" for i in ("a", "b", "c")])
+    out = tmp_path / "out.jsonl"
+    _write(out, [
+        json.dumps({"id": "a", "summary": "kept"}) + "\n",
+        json.dumps({"id": "b", "error": "ValueError: boom"}) + "\n",
+        '{"id": "c", "sum',
+    ])
+
+    status = main([
+        str(source), "-o", str(out), "--resume", "--workers", "1",
+        "--segmenter", "regex", "--progress-every", "1000",
+    ])
+
+    records = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert status == 0
+    assert records[:2] == [
+        {"id": "a", "summary": "kept"},
+        {"id": "b", "error": "ValueError: boom"},
+    ]
+    assert sorted(r["id"] for r in records[2:]) == ["b", "c"]
+    assert all("summary" in r for r in records[2:])
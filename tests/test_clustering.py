@@ -0,0 +1,38 @@
+"""Tests for the automatic-k heuristics in ``src.clustering``."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+import src.spherical_kmeans as spherical
+from src.clustering import fast_optimal_k
+
+
+def _constant_inertia(value: float):
+    def fake(X, n_clusters, random_state=42, **kwargs):
+        labels = np.zeros(X.shape[0], dtype=np.int64)
+        return spherical.ClusterFit(labels, np.zeros((n_clusters, X.shape[1])), value, 1)
+
+    return fake
+
+
+@pytest.mark.parametrize("inertia", [0.0, float("nan")])
+def test_fast_optimal_k_flat_inertia_curve(monkeypatch, inertia):
+    # a flat (or NaN) curve has no finite bend to beat the initial best
+    monkeypatch.setattr(spherical, "spherical_kmeans", _constant_inertia(inertia))
+    X = sp.random(60, 40, density=0.2, format="csr", random_state=0)
+
+    k = fast_optimal_k(X, patience=2)
+
+    assert 2 <= k < 60
+
+
+def test_fast_optimal_k_duplicate_sentences():
+    # every row identical: inertia is zero at every k
+    X = sp.csr_matrix(np.tile([[0.6, 0.8, 0.0]], (40, 1)))
+
+    k = fast_optimal_k(X)
+
+    assert 2 <= k < 40
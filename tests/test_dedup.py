@@ -0,0 +1,119 @@
+"""Tests for near-duplicate grouping in ``src.dedup``."""
+
+from __future__ import annotations
+
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from src.dedup import band_shape, find_near_duplicates, minhash_signatures
+from src.preprocess import tokenize_sentences
+from src.summarizer import summarize
+
+WORDS = [f"w{i}" for i in range(400)]
+
+
+def _document(seed: int) -> tuple[list[str], list[int]]:
+    """Distinct sentences, each followed by 0–2 copies or one-word edits."""
+    rng = random.Random(seed)
+    sentences, origin = [], []
+    for i in range(60):
+        words = rng.sample(WORDS, 12)
+        sentences.append(" ".join(words))
+        origin.append(i)
+        for _ in range(rng.randrange(3)):
+            copy = list(words)
+            if rng.random() < 0.5:
+                copy[rng.randrange(len(copy))] = f"edit{rng.randrange(10**6)}"
+            sentences.append(" ".join(copy))
+            origin.append(i)
+    return sentences, origin
+
+
+def _jaccard(tokens, i: int, j: int, k: int = 2) -> float:
+    def shingles(row):
+        ids = tokens.ids[tokens.indptr[row]:tokens.indptr[row + 1]].tolist()
+        return {tuple(ids[p:p + k]) for p in range(len(ids) - k + 1)}
+
+    a, b = shingles(i), shingles(j)
+    return len(a & b) / len(a | b)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_groups_copies_and_edits_with_their_original(seed):
+    sentences, origin = _document(seed)
+    tokens = tokenize_sentences(sentences)
+
+    groups = find_near_duplicates(tokens, threshold=0.5)
+
+    for i, j in itertools.combinations(range(len(sentences)), 2):
+        same_group = groups.labels[i] == groups.labels[j]
+        if _jaccard(tokens, i, j) == 1.0:
+            assert same_group
+        if origin[i] != origin[j]:
+            assert not same_group
+
+
+def test_group_structure():
+    sentences, _ = _document(0)
+    groups = find_near_duplicates(tokenize_sentences(sentences), threshold=0.8)
+
+    # groups are numbered in document order, each led by its first sentence
+    _, first = np.unique(groups.labels, return_index=True)
+    assert np.array_equal(groups.representatives, first)
+    assert (np.diff(groups.representatives) > 0).all()
+    assert np.array_equal(groups.weights, np.bincount(groups.labels))
+    assert groups.weights.sum() == len(sentences)
+    assert groups.n_collapsed == len(sentences) - len(groups.representatives)
+
+
+def test_sentences_without_tokens_stay_alone():
+    tokens = tokenize_sentences(["!!!", "...", "alpha beta gamma", "alpha beta gamma"])
+
+    groups = find_near_duplicates(tokens, threshold=0.8)
+
+    assert groups.labels.tolist() == [0, 1, 2, 2]
+
+
+def test_signatures_are_deterministic():
+    tokens = tokenize_sentences(_document(1)[0])
+
+    a, signed_a = minhash_signatures(tokens, random_state=7)
+    b, signed_b = minhash_signatures(tokens, random_state=7)
+    c, _ = minhash_signatures(tokens, random_state=8)
+
+    assert np.array_equal(a, b) and np.array_equal(signed_a, signed_b)
+    assert not np.array_equal(a, c)
+
+
+@pytest.mark.parametrize("threshold", [0.3, 0.5, 0.8, 0.95, 1.0])
+def test_band_shape_midpoint_not_above_threshold(threshold):
+    bands, rows = band_shape(threshold, 128)
+
+    assert bands * rows <= 128
+    assert (1.0 / bands) ** (1.0 / rows) <= threshold
+
+
+@pytest.mark.parametrize("threshold", [0.0, -0.1, 1.5])
+def test_invalid_threshold(threshold):
+    with pytest.raises(ValueError):
+        find_near_duplicates(tokenize_sentences(["a b", "c d"]), threshold)
+
+
+def test_summarize_collapses_duplicates():
+    base = [
+        "Cells divide by mitosis in four phases.",
+        "Stars burn hydrogen into helium for billions of years.",
+        "Rivers carve deep valleys through soft rock.",
+        "Markets set prices through supply and demand.",
+    ]
+    text = " ".join(base + base + base[:2])
+
+    result = summarize(
+        text, 0.5, engine="spherical", segmenter="regex", dedup_threshold=0.8, cache=None
+    )
+
+    assert result["collapsed_sentence_count"] == 6
+    assert len(set(result["summary"].split(". "))) == result["summary_sentence_count"]
@@ -0,0 +1,50 @@
+"""Tests for ``src.incremental``."""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from src.incremental import IncrementalSummarizer
+
+TOPICS = {
+    "cells": ["cell", "membrane", "protein", "nucleus", "enzyme", "mitosis"],
+    "stars": ["star", "galaxy", "orbit", "planet", "telescope", "nebula"],
+    "rivers": ["river", "valley", "delta", "sediment", "flood", "erosion"],
+    "markets": ["market", "price", "trade", "demand", "supply", "currency"],
+}
+
+
+def _paragraphs(n: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    paragraphs = []
+    for _ in range(n):
+        words = TOPICS[rng.choice(sorted(TOPICS))]
+        paragraphs.append(" ".join(
+            " ".join(rng.choice(words) for _ in range(6)).capitalize() + "."
+            for _ in range(3)
+        ))
+    return paragraphs
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_local_updates_keep_k_clusters(seed):
+    rng = random.Random(seed)
+    ratio = rng.choice([0.3, 0.5, 0.7])
+    paragraphs = _paragraphs(40, seed)
+    inc = IncrementalSummarizer(ratio=ratio, segmenter="regex", refit_fraction=0.9)
+    inc.update("\n\n".join(paragraphs))
+
+    for _ in range(20):
+        i = rng.randrange(len(paragraphs))
+        if rng.random() < 0.5 and len(paragraphs) > 5:
+            del paragraphs[i]
+        else:
+            paragraphs[i] = _paragraphs(1, rng.randrange(10**6))[0]
+        result = inc.update("\n\n".join(paragraphs))
+
+        n_clusters = int(result["original_sentence_count"] * ratio)
+        assert result["summary_sentence_count"] == n_clusters
+        assert np.bincount(inc._labels, minlength=len(inc._centroids)).min() > 0
@@ -0,0 +1,149 @@
+"""Tests for the HTTP plumbing and shutdown of ``src.service``."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+import src.service as service
+from src.service import SummarizationService
+
+
+def _fake_batch(items):
+    return [{"status": 200, "result": {"summary": text}} for text, _ in items]
+
+
+def _bare_service(monkeypatch, **kwargs) -> SummarizationService:
+    # no process pool: batches run on the loop's default thread executor
+    monkeypatch.setattr(service, "_summarize_batch", _fake_batch)
+    svc = SummarizationService(workers=1, **kwargs)
+    svc._queue = asyncio.Queue(maxsize=svc.queue_size)
+    svc._slots = asyncio.Semaphore(svc.workers)
+    svc._batcher = asyncio.create_task(svc._batch_loop())
+    return svc
+
+
+async def _exchange(svc: SummarizationService, raw: bytes, limit: int = 2 ** 16):
+    server = await asyncio.start_server(svc.handle_connection, "127.0.0.1", 0, limit=limit)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(raw)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+    finally:
+        server.close()
+        await server.wait_closed()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+def _post(body: bytes, headers: str = "") -> bytes:
+    return (
+        f"POST /summarize HTTP/1.1\r\nContent-Length: {len(body)}\r\n{headers}"
+        "Connection: close\r\n\r\n"
+    ).encode("latin-1") + body
+
+
+@pytest.mark.parametrize("raw, status", [
+    (b"GARBAGE\r\n\r\n", 400),
+    (b"POST /summarize HTTP/1.1\r\nContent-Length: abc\r\n\r\n", 400),
+    (b"POST /summarize HTTP/1.1\r\nContent-Length: -5\r\n\r\n", 400),
+    (b"POST /summarize HTTP/1.1\r\nContent-Length: 99999999999\r\n\r\n", 413),
+    (_post(b"not json"), 400),
+    (_post(b'{"text": "x", "bogus": 1}'), 400),
+    (b"GET /nowhere HTTP/1.1\r\nConnection: close\r\n\r\n", 404),
+    (b"GET /summarize HTTP/1.1\r\nConnection: close\r\n\r\n", 405),
+])
+def test_request_errors(monkeypatch, raw, status):
+    async def scenario():
+        svc = _bare_service(monkeypatch)
+        try:
+            return await _exchange(svc, raw)
+        finally:
+            await svc.stop()
+
+    got, payload = asyncio.run(scenario())
+
+    assert got == status
+    assert "error" in payload
+
+
+@pytest.mark.parametrize("raw", [
+    b"GET /" + b"a" * 5000 + b" HTTP/1.1\r\n\r\n",
+    _post(b"{}", headers="X-Long: " + "a" * 5000 + "\r\n"),
+    _post(b"{}", headers="".join(f"X-{i}: {i}\r\n" for i in range(service.MAX_HEADERS + 1))),
+])
+def test_oversized_head(monkeypatch, raw):
+    async def scenario():
+        svc = _bare_service(monkeypatch)
+        try:
+            return await _exchange(svc, raw, limit=1024)
+        finally:
+            await svc.stop()
+
+    status, _ = asyncio.run(scenario())
+
+    assert status in (400, 431)
+
+
+def test_summarize_round_trip(monkeypatch):
+    async def scenario():
+        svc = _bare_service(monkeypatch)
+        try:
+            return await _exchange(svc, _post(b'{"text": "hello", "ratio": 0.5}'))
+        finally:
+            await svc.stop()
+
+    assert asyncio.run(scenario()) == (200, {"summary": "hello"})
+
+
+def test_full_queue_is_rejected(monkeypatch):
+    async def scenario():
+        svc = _bare_service(monkeypatch, queue_size=1)
+        await svc._slots.acquire()  # workers busy: nothing leaves the queue
+        waiting = asyncio.create_task(svc.submit("first", {}))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        try:
+            return await _exchange(svc, _post(b'{"text": "second"}'))
+        finally:
+            svc._slots.release()
+            await svc.stop()
+            await waiting
+
+    status, payload = asyncio.run(scenario())
+
+    assert status == 503
+    assert payload == {"error": "server busy, retry later"}
+
+
+def test_stop_runs_the_batch_being_collected(monkeypatch):
+    async def scenario():
+        svc = _bare_service(monkeypatch, max_batch=8, batch_wait_ms=60_000)
+        collecting = asyncio.create_task(svc.submit("taken", {}))
+        await asyncio.sleep(0.05)  # the batcher holds it, waiting for more
+        assert svc._queue.empty()
+        await asyncio.wait_for(svc.stop(), timeout=5)
+        return await asyncio.wait_for(collecting, timeout=5)
+
+    assert asyncio.run(scenario()) == {"status": 200, "result": {"summary": "taken"}}
+
+
+def test_stop_rejects_queued_and_late_requests(monkeypatch):
+    async def scenario():
+        svc = _bare_service(monkeypatch)
+        await svc._slots.acquire()  # workers busy: nothing leaves the queue
+        queued = [asyncio.create_task(svc.submit(f"q{i}", {})) for i in range(3)]
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(svc.stop(), timeout=5)
+        late = await svc.submit("late", {})
+        return await asyncio.wait_for(asyncio.gather(*queued), timeout=5), late
+
+    queued, late = asyncio.run(scenario())
+
+    assert [outcome["status"] for outcome in queued] == [503, 503, 503]
+    assert late == {"status": 503, "error": "service shutting down"}
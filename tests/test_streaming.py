@@ -0,0 +1,75 @@
+"""Tests for ``src.streaming``: block-wise segmentation and result spans."""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from src.preprocess import clean_text, get_segmenter
+from src.streaming import stream_sentences, summarize_file
+
+TOPICS = [
+    ["cell", "membrane", "protein", "nucleus", "enzyme", "mitosis"],
+    ["star", "galaxy", "orbit", "planet", "telescope", "nebula"],
+    ["river", "valley", "delta", "sediment", "flood", "erosion"],
+    ["café", "naïve", "résumé", "über", "jalapeño", "crème"],  # multi-byte UTF-8
+]
+
+
+def _raw_text(n_sentences: int, seed: int = 0) -> str:
+    """Sentences joined by irregular whitespace, so cleaning moves offsets."""
+    rng = random.Random(seed)
+    parts = []
+    for _ in range(n_sentences):
+        words = rng.choice(TOPICS)
+        sentence = " ".join(rng.choice(words) for _ in range(rng.randrange(4, 12)))
+        parts.append(sentence.capitalize() + ".")
+        parts.append(rng.choice([" ", "  ", "\n", " \n\n\t ", "\r\n"]))
+    return "".join(parts)
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_bytes(_raw_text(2000).encode("utf-8"))  # ~90 kB: many 4 kB blocks
+    return path
+
+
+def test_blocks_match_whole_file_segmentation(text_file):
+    cleaned = clean_text(text_file.read_text(encoding="utf-8"))
+
+    blocks = list(stream_sentences(text_file, "regex", block_bytes=4096))
+    spans = np.concatenate([s for s, _ in blocks])
+    sentences = [t for _, block in blocks for t in block]
+
+    assert len(blocks) > 10
+    assert np.array_equal(spans, get_segmenter("regex").spans(cleaned))
+    assert sentences == [cleaned[start:end] for start, end in spans.tolist()]
+
+
+def test_summary_spans_point_into_cleaned_file(text_file):
+    cleaned = clean_text(text_file.read_text(encoding="utf-8"))
+
+    result = summarize_file(text_file, ratio=0.01, max_memory_mb=8, segmenter="regex")
+
+    picked = [cleaned[start:end] for start, end in result["spans"]]
+    assert result["summary_sentence_count"] == len(picked) > 1
+    assert " ".join(picked) == result["summary"]
+    assert [s for s, _ in result["spans"]] == sorted(s for s, _ in result["spans"])
+
+
+def test_short_and_empty_files(tmp_path):
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    short = tmp_path / "short.txt"
+    short.write_text("  One sentence here.\n\nAnd   another one. ", encoding="utf-8")
+
+    assert summarize_file(empty, segmenter="regex")["summary_sentence_count"] == 0
+    result = summarize_file(short, segmenter="regex")
+    cleaned = clean_text(short.read_text(encoding="utf-8"))
+    assert result["summary"] == cleaned
+    assert [cleaned[s:e] for s, e in result["spans"]] == [
+        "One sentence here.", "And another one."
+    ]